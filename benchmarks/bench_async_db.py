@@ -0,0 +1,111 @@
+"""
+bench_async_db.py — Requests/second for the sync vs async database path.
+
+Serves the same query (one user's todo list) from a `def` route on `get_db` and
+an `async def` route on `get_async_db`, then drives each with N concurrent
+clients for a fixed duration. The threadpool is capped with --threads to mimic
+a worker whose threadpool is already the bottleneck.
+
+Run with: uv run python -m benchmarks.bench_async_db --rows 200 --concurrency 64
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+import anyio.to_thread
+import httpx
+from fastapi import Depends, FastAPI
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from src.app.crud import todo as crud_todo
+from src.app.crud.aio import todo as aio_crud_todo
+from src.app.db.session import Base, get_async_db, get_db
+from src.app.models.todo import Todo as TodoModel
+from src.app.models.user import User
+from src.app.schemas.todo import Todo
+import src.app.models.idea  # noqa: F401
+import src.app.models.event  # noqa: F401
+import src.app.models.notification  # noqa: F401
+
+USER_ID = "bench-user"
+
+
+def build_app(db_path: str, rows: int, pool_size: int) -> FastAPI:
+    # Pools sized to the client count so only the threadpool limits the sync path
+    engine = create_engine(
+        f"sqlite:///{db_path}", connect_args={"check_same_thread": False}, pool_size=pool_size
+    )
+    Base.metadata.create_all(bind=engine)
+    SessionLocal = sessionmaker(autoflush=False, bind=engine)
+    with SessionLocal() as db:
+        db.add(User(id=USER_ID, email="bench@example.com", hashed_password="x"))
+        db.add_all(TodoModel(user_id=USER_ID, title=f"Task {i}") for i in range(rows))
+        db.commit()
+
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}", pool_size=pool_size)
+    AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+    app = FastAPI()
+
+    @app.get("/sync", response_model=list[Todo])
+    def sync_todos(db: Session = Depends(get_db)):
+        return crud_todo.get_todos(db, user_id=USER_ID)
+
+    @app.get("/async", response_model=list[Todo])
+    async def async_todos(db: AsyncSession = Depends(get_async_db)):
+        return await aio_crud_todo.get_todos(db, user_id=USER_ID)
+
+    def override_get_db():
+        with SessionLocal() as db:
+            yield db
+
+    async def override_get_async_db():
+        async with AsyncSessionLocal() as db:
+            yield db
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    return app
+
+
+async def drive(app: FastAPI, path: str, concurrency: int, duration: float, threads: int) -> float:
+    anyio.to_thread.current_default_thread_limiter().total_tokens = threads
+    done = 0
+    deadline = time.perf_counter() + duration
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def worker():
+            nonlocal done
+            while time.perf_counter() < deadline:
+                resp = await client.get(path)
+                resp.raise_for_status()
+                done += 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+    return done / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200, help="todos returned per request")
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--duration", type=float, default=5.0, help="seconds per path")
+    parser.add_argument("--threads", type=int, default=8, help="threadpool size for sync routes")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        app = build_app(os.path.join(tmp, "bench.db"), args.rows, args.concurrency)
+        print(f"rows={args.rows} concurrency={args.concurrency} threads={args.threads}")
+        for path in ("/sync", "/async"):
+            rps = asyncio.run(drive(app, path, args.concurrency, args.duration, args.threads))
+            print(f"  {path:<7} {rps:8.1f} req/s")
+
+
+if __name__ == "__main__":
+    main()
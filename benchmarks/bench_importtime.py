@@ -0,0 +1,61 @@
+"""
+bench_importtime.py — Cold-start cost of `import src.app.main`.
+
+Runs `python -X importtime -c "import src.app.main"` in fresh interpreters
+(after one warm-up run so .pyc files exist) and reports the cumulative import
+time of the app module plus the slowest imports by self time. With --max-ms it
+exits non-zero when the median exceeds the budget, so CI can catch regressions.
+
+Run with: uv run python -m benchmarks.bench_importtime --runs 7 --max-ms 600
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+MODULE = "src.app.main"
+
+
+def import_profile() -> dict[str, tuple[int, int]]:
+    """Return {module: (self_us, cumulative_us)} for one cold interpreter."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {MODULE}"],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    profile = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        profile[name.strip()] = (int(self_us), int(cumulative_us))
+    return profile
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=7)
+    parser.add_argument("--top", type=int, default=10, help="slowest imports to list")
+    parser.add_argument("--max-ms", type=float, default=None, help="fail if the median exceeds this")
+    args = parser.parse_args()
+
+    import_profile()  # warm-up: compile .pyc, fill the OS page cache
+    runs = [import_profile() for _ in range(args.runs)]
+    totals = [run[MODULE][1] / 1000 for run in runs]
+    median = statistics.median(totals)
+    print(f"{MODULE}: median {median:.1f} ms, min {min(totals):.1f} ms, max {max(totals):.1f} ms ({args.runs} runs)")
+
+    last = runs[-1]
+    print(f"slowest {args.top} by self time:")
+    for name, (self_us, cumulative_us) in sorted(last.items(), key=lambda kv: -kv[1][0])[: args.top]:
+        print(f"  {self_us / 1000:7.1f} ms self  {cumulative_us / 1000:7.1f} ms cum  {name}")
+
+    if args.max_ms is not None and median > args.max_ms:
+        print(f"FAIL: median {median:.1f} ms exceeds budget of {args.max_ms:.1f} ms")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,81 @@
+"""
+bench_json.py — Encoding time and peak memory of a list response, per JSON path.
+
+Builds --sizes lists of validated IdeaPublic models (with nested authors) and
+encodes each one three ways:
+
+  jsonable    jsonable_encoder + json.dumps (FastAPI's JSONResponse before)
+  fast-class  FastJSONResponse.render (orjson, or pydantic-core without it)
+  adapter     TypeAdapter(list[IdeaPublic]).dump_json, models straight to bytes
+
+Time is the median of --repeats runs. Peak is the tracemalloc high-water mark
+of one run, measured separately so tracing does not skew the timings.
+
+Run with: uv run python -m benchmarks.bench_json --sizes 1000 10000
+"""
+import argparse
+import json
+import statistics
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+
+from src.app.core import responses
+from src.app.schemas.idea import IdeaPublic
+from src.app.schemas.user import PublicProfile
+
+ADAPTER = TypeAdapter(list[IdeaPublic])
+
+PATHS = {
+    "jsonable": lambda items: json.dumps(jsonable_encoder(items), ensure_ascii=False, separators=(",", ":")).encode(),
+    "fast-class": lambda items: responses.FastJSONResponse(items).body,
+    "adapter": ADAPTER.dump_json,
+}
+
+
+def make_items(count: int) -> list[IdeaPublic]:
+    authors = [PublicProfile(id=f"user-{n}", email=f"user{n}@example.com", bio="Builds things") for n in range(50)]
+    start = datetime(2024, 1, 1)
+    return [
+        IdeaPublic(id=f"idea-{i}", user_id=f"user-{i % 50}", title=f"Idea number {i}",
+                   description="Benchmark idea body " * 8, category="AI", status="submitted",
+                   tags="ai, llm", created_at=start + timedelta(seconds=i), author=authors[i % 50])
+        for i in range(count)
+    ]
+
+
+def measure(encode, items, repeats: int) -> tuple[float, float, int]:
+    samples = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        body = encode(items)
+        samples.append((time.perf_counter() - started) * 1000)
+    tracemalloc.start()
+    encode(items)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return statistics.median(samples), peak / 2**20, len(body)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10_000])
+    parser.add_argument("--repeats", type=int, default=7)
+    args = parser.parse_args()
+
+    print(f"fast-class encoder: {'orjson' if responses.orjson else 'pydantic-core'}")
+    print(f"  {'items':>6}  {'path':<10}  {'ms':>8}  {'peak MiB':>9}  {'body KiB':>9}")
+    for size in args.sizes:
+        items = make_items(size)
+        expected = json.loads(PATHS["jsonable"](items))
+        for name, encode in PATHS.items():
+            assert json.loads(encode(items)) == expected, name
+            ms, peak, length = measure(encode, items, args.repeats)
+            print(f"  {size:>6}  {name:<10}  {ms:>8.2f}  {peak:>9.2f}  {length / 1024:>9.0f}")
+
+
+if __name__ == "__main__":
+    main()
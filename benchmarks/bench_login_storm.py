@@ -0,0 +1,122 @@
+"""
+bench_login_storm.py — Latency of ordinary GETs while a login storm is running.
+
+Drives the real app against a temporary database. --logins clients post to
+/api/auth/login in a loop while --readers clients fetch /api/todos with a
+valid token. The run is repeated with hashing on the threadpool
+(PASSWORD_HASH_WORKERS=0, the old behaviour) and on the process pool. Each
+run reports logins/second and p50/p99 latency of the GETs.
+
+Run with: uv run python -m benchmarks.bench_login_storm --logins 32 --readers 8 --workers 4
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+
+import anyio.to_thread
+import httpx
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.app.core import hashing
+from src.app.core.config import settings
+from src.app.core.security import get_password_hash
+from src.app.db.base import Base
+from src.app.db.session import get_async_db, get_db, get_read_db
+from src.app.main import app
+from src.app.models.todo import Todo
+from src.app.models.user import User
+
+EMAIL = "storm@example.com"
+PASSWORD = "password"
+
+
+def setup_db(db_path: str, pool_size: int) -> None:
+    engine = create_engine(
+        f"sqlite:///{db_path}", connect_args={"check_same_thread": False}, pool_size=pool_size
+    )
+    Base.metadata.create_all(bind=engine)
+    SessionLocal = sessionmaker(autoflush=False, bind=engine)
+    with SessionLocal() as db:
+        user = User(email=EMAIL, hashed_password=get_password_hash(PASSWORD))
+        db.add(user)
+        db.flush()
+        db.add_all(Todo(user_id=user.id, title=f"Task {i}") for i in range(20))
+        db.commit()
+
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}", pool_size=pool_size)
+    AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+    def override_get_db():
+        with SessionLocal() as db:
+            yield db
+
+    async def override_get_async_db():
+        async with AsyncSessionLocal() as db:
+            yield db
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
+
+
+async def storm(logins: int, readers: int, duration: float, threads: int) -> tuple[float, list[float]]:
+    anyio.to_thread.current_default_thread_limiter().total_tokens = threads
+    await hashing.warm_up()
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        res = await client.post("/api/auth/login", data={"username": EMAIL, "password": PASSWORD})
+        headers = {"Authorization": f"Bearer {res.json()['access_token']}"}
+        login_count = 0
+        latencies: list[float] = []
+        deadline = time.perf_counter() + duration
+
+        async def login_worker():
+            nonlocal login_count
+            while time.perf_counter() < deadline:
+                res = await client.post("/api/auth/login", data={"username": EMAIL, "password": PASSWORD})
+                res.raise_for_status()
+                login_count += 1
+
+        async def reader():
+            while time.perf_counter() < deadline:
+                started = time.perf_counter()
+                res = await client.get("/api/todos", headers=headers)
+                res.raise_for_status()
+                latencies.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(login_worker() for _ in range(logins)), *(reader() for _ in range(readers)))
+        elapsed = time.perf_counter() - started
+    return login_count / elapsed, latencies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--logins", type=int, default=32, help="concurrent login clients")
+    parser.add_argument("--readers", type=int, default=8, help="concurrent GET clients")
+    parser.add_argument("--duration", type=float, default=5.0, help="seconds per mode")
+    parser.add_argument("--threads", type=int, default=16, help="threadpool size")
+    parser.add_argument("--workers", type=int, default=settings.password_hash_workers, help="hash processes")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        setup_db(os.path.join(tmp, "bench.db"), args.logins + args.readers)
+        print(f"logins={args.logins} readers={args.readers} threads={args.threads} rounds={settings.password_hash_rounds}")
+        for label, workers in (("threadpool", 0), (f"pool x{args.workers}", args.workers)):
+            settings.password_hash_workers = workers
+            rate, latencies = asyncio.run(storm(args.logins, args.readers, args.duration, args.threads))
+            hashing.shutdown()
+            cuts = statistics.quantiles(latencies, n=100)
+            print(
+                f"  {label:<12} {rate:7.1f} logins/s   GET /api/todos: {len(latencies)} reqs, "
+                f"p50 {cuts[49] * 1000:6.1f} ms, p99 {cuts[98] * 1000:6.1f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
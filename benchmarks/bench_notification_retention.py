@@ -0,0 +1,126 @@
+"""
+bench_notification_retention.py — Pruning a large notifications table, and what writers feel meanwhile.
+
+Builds a temporary database of --users users with --per-user notifications
+each, spread over the last year, most of them read. It times the bell feed
+and mark-all-read for one user, runs the pruner with the default policy
+(read and older than 90 days, at most 1000 per user), and times them again.
+A writer thread inserts a notification every few milliseconds throughout the
+prune and reports its slowest commit. The prune is repeated on a fresh copy
+with each user's rows in one batch, as an unbatched delete would.
+
+Run with: uv run python -m benchmarks.bench_notification_retention --users 50 --per-user 4000
+"""
+import argparse
+import os
+import random
+import shutil
+import statistics
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine, insert, update
+from sqlalchemy.orm import Session
+
+from src.app.core.config import settings
+from src.app.crud import notification as crud_notif
+from src.app.db import aggregates
+from src.app.db.base import Base
+from src.app.db.session import apply_sqlite_profile
+from src.app.models.notification import Notification
+from src.app.models.user import User
+from src.app.tasks import notification_retention
+
+
+def build(db_path: str, users: int, per_user: int) -> list[str]:
+    engine = create_engine(f"sqlite:///{db_path}")
+    apply_sqlite_profile(engine)
+    Base.metadata.create_all(bind=engine)
+    now = datetime.utcnow()
+    rng = random.Random(7)
+    with Session(engine) as db:
+        db.add_all(User(email=f"user{i}@example.com", hashed_password="x") for i in range(users))
+        db.commit()
+        ids = [u.id for u in db.query(User)]
+        for user_id in ids:
+            db.execute(insert(Notification), [
+                {"id": f"{user_id}-{n}", "user_id": user_id, "message": f"Notification {n}", "type": "new_idea",
+                 "is_read": rng.random() < 0.8, "created_at": now - timedelta(minutes=rng.randrange(365 * 24 * 60))}
+                for n in range(per_user)
+            ])
+        db.commit()
+        aggregates.NOTIFICATION_STATS.reconcile(db.connection())
+        db.commit()
+    engine.dispose()
+    return ids
+
+
+def time_reads(engine, user_id: str) -> str:
+    with Session(engine) as db:
+        started = time.perf_counter()
+        crud_notif.get_user_notifications(db, user_id=user_id, limit=20)
+        feed = time.perf_counter() - started
+        started = time.perf_counter()  # mark-all-read's update, rolled back so the data stays put
+        db.execute(update(Notification).where(Notification.user_id == user_id, Notification.is_read.is_(False))
+                   .values(is_read=True))
+        mark = time.perf_counter() - started
+        db.rollback()
+    return f"feed {feed * 1000:6.2f} ms, mark-all-read {mark * 1000:6.2f} ms"
+
+
+def prune_under_load(db_path: str, user_id: str, batch_size: int) -> None:
+    engine = create_engine(f"sqlite:///{db_path}", connect_args={"check_same_thread": False})
+    apply_sqlite_profile(engine)
+    print(f"  before: {time_reads(engine, user_id)}")
+    settings.notification_retention_batch_size = batch_size
+    commits: list[float] = []
+    done = threading.Event()
+
+    def writer():
+        with Session(engine) as db:
+            while not done.is_set():
+                started = time.perf_counter()
+                db.add(Notification(user_id=user_id, message="During prune", type="new_idea"))
+                db.commit()
+                commits.append(time.perf_counter() - started)
+                time.sleep(0.005)
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+    with Session(engine) as db:
+        stats = notification_retention.prune(db)
+    done.set()
+    thread.join()
+    print(f"  deleted {stats['deleted_rows']} rows in {stats['batches']} batches in {stats['seconds']:.2f} s")
+    print(f"  writer during prune: {len(commits)} commits, median {statistics.median(commits) * 1000:.2f} ms, "
+          f"slowest {max(commits) * 1000:.1f} ms")
+    print(f"  after:  {time_reads(engine, user_id)}")
+    engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--per-user", type=int, default=4000)
+    parser.add_argument("--batch-size", type=int, default=settings.notification_retention_batch_size)
+    args = parser.parse_args()
+
+    settings.notification_retention_read_days = 90
+    settings.notification_retention_max_per_user = 1000
+    settings.notification_retention_archive_dir = ""
+    with tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, "source.db")
+        user_id = build(source, args.users, args.per_user)[0]
+        print(f"users={args.users}, notifications={args.users * args.per_user}")
+        for label, batch_size in (("batched", args.batch_size), ("one delete per user", args.users * args.per_user)):
+            db_path = os.path.join(tmp, "bench.db")
+            shutil.copy(source, db_path)
+            print(f"{label} (batch size {batch_size}):")
+            prune_under_load(db_path, user_id, batch_size)
+            os.remove(db_path)
+
+
+if __name__ == "__main__":
+    main()
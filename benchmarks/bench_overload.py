@@ -0,0 +1,101 @@
+"""
+bench_overload.py — Latency of well-behaved clients while one client floods writes.
+
+Drives the real app against a temporary database. One user floods
+/api/todos with posts at --flood-rate requests/second (open loop, over
+--flooders connections). Meanwhile --clients other users read /api/todos and
+post one todo every --think seconds, which stays within the write limit.
+The run is repeated with rate limiting off and on. Each run reports the polite
+clients' p50/p99 and how the flood was answered (201 / 429 / 503).
+
+Run with: uv run python -m benchmarks.bench_overload --flood-rate 400 --clients 8
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from collections import Counter
+
+import httpx
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from src.app.core.config import settings
+from src.app.core.ratelimit import rate_limiter
+from src.app.core.security import create_access_token, get_password_hash
+from src.app.main import app
+from src.app.models.user import User
+
+from benchmarks.bench_login_storm import setup_db
+
+
+def make_users(db_path: str, count: int) -> list[dict]:
+    engine = create_engine(f"sqlite:///{db_path}")
+    hashed = get_password_hash("password")
+    with Session(engine) as db:
+        emails = [f"user{i}@example.com" for i in range(count)]
+        db.add_all(User(email=email, hashed_password=hashed) for email in emails)
+        db.commit()
+    return [{"Authorization": f"Bearer {create_access_token({'sub': email})}"} for email in emails]
+
+
+async def run(flooder: dict, polite: list[dict], flooders: int, flood_rate: float, think: float, duration: float):
+    flood_codes: Counter[int] = Counter()
+    latencies: list[float] = []
+    deadline = time.perf_counter() + duration
+    transport = httpx.ASGITransport(app=app, client=("10.0.0.1", 1234))
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def flood():
+            interval = flooders / flood_rate
+            next_at = time.perf_counter()
+            while time.perf_counter() < deadline:
+                res = await client.post("/api/todos", json={"title": "spam"}, headers=flooder)
+                flood_codes[res.status_code] += 1
+                next_at += interval
+                await asyncio.sleep(max(0.0, next_at - time.perf_counter()))
+
+        async def behave(headers):
+            while time.perf_counter() < deadline:
+                for request in (
+                    client.get("/api/todos", headers=headers),
+                    client.post("/api/todos", json={"title": "real work"}, headers=headers),
+                ):
+                    started = time.perf_counter()
+                    await request
+                    latencies.append(time.perf_counter() - started)
+                await asyncio.sleep(think)
+
+        await asyncio.gather(*(flood() for _ in range(flooders)), *(behave(h) for h in polite))
+    return flood_codes, latencies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--flooders", type=int, default=32, help="concurrent connections of the abusive user")
+    parser.add_argument("--flood-rate", type=float, default=400, help="offered flood requests/second")
+    parser.add_argument("--clients", type=int, default=8, help="well-behaved users")
+    parser.add_argument("--think", type=float, default=1.0, help="seconds between a polite client's rounds")
+    parser.add_argument("--duration", type=float, default=5.0, help="seconds per mode")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "bench.db")
+        setup_db(db_path, args.flooders + args.clients)
+        flooder, *polite = make_users(db_path, args.clients + 1)
+        print(f"flood {args.flood_rate:.0f} req/s over {args.flooders} connections, polite clients={args.clients}")
+        for enabled in (False, True):
+            settings.rate_limit_enabled = enabled
+            rate_limiter.clear()
+            codes, latencies = asyncio.run(run(flooder, polite, args.flooders, args.flood_rate, args.think, args.duration))
+            cuts = statistics.quantiles(latencies, n=100)
+            flood = " ".join(f"{code}:{n}" for code, n in sorted(codes.items()))
+            print(
+                f"  rate limit {'on ' if enabled else 'off'}  polite p50 {cuts[49] * 1000:6.1f} ms, "
+                f"p99 {cuts[98] * 1000:6.1f} ms   flood {flood}"
+            )
+
+
+if __name__ == "__main__":
+    main()
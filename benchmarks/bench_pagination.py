@@ -0,0 +1,81 @@
+"""
+bench_pagination.py — Page latency vs depth, OFFSET vs keyset cursor.
+
+Seeds --ideas ideas (one author, one timestamp per idea) into a temporary
+database with the model's indexes. It then times fetching a page at several
+depths through crud_idea.get_all_ideas, once with skip=depth and once with
+the cursor of the row before that depth. OFFSET time grows with depth;
+keyset time should stay flat.
+
+Run with: uv run python -m benchmarks.bench_pagination --ideas 100000 --limit 50
+"""
+import argparse
+import os
+import statistics
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import Session
+
+from src.app.core import pagination
+from src.app.crud import idea as crud_idea
+from src.app.db.base import Base
+from src.app.models.idea import Idea
+from src.app.models.user import User
+
+
+def seed(db: Session, count: int) -> None:
+    db.add(User(id="author", email="author@example.com", hashed_password="x"))
+    start = datetime(2024, 1, 1)
+    rows = [
+        {"id": str(uuid.uuid4()), "title": f"Idea {i}", "description": "Benchmark idea body",
+         "category": "AI", "status": "submitted", "user_id": "author",
+         "created_at": start + timedelta(seconds=i)}
+        for i in range(count)
+    ]
+    db.execute(insert(Idea), rows)
+    db.commit()
+
+
+def time_ms(fn, repeats: int) -> float:
+    samples = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--ideas", type=int, default=100_000)
+    parser.add_argument("--limit", type=int, default=50, help="page size")
+    parser.add_argument("--repeats", type=int, default=5, help="median of this many fetches per point")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        Base.metadata.create_all(bind=engine)
+        with Session(engine) as db:
+            seed(db, args.ideas)
+            depths = [d for d in (0, 1_000, 10_000, 50_000, args.ideas - args.limit) if d < args.ideas]
+            # Cursor positions for each depth, i.e. the row just before it in keyset order
+            ordered = select(Idea.created_at, Idea.id).order_by(*pagination.keyset_order(Idea))
+            positions = {d: tuple(db.execute(ordered.offset(d - 1).limit(1)).one()) if d else None for d in depths}
+
+            print(f"ideas={args.ideas} limit={args.limit}")
+            print(f"  {'depth':>8}  {'offset ms':>10}  {'cursor ms':>10}")
+            for depth in depths:
+                offset_ms = time_ms(lambda: crud_idea.get_all_ideas(db, skip=depth, limit=args.limit), args.repeats)
+                cursor_ms = time_ms(
+                    lambda: crud_idea.get_all_ideas(db, limit=args.limit, after=positions[depth]), args.repeats
+                )
+                db.expunge_all()
+                print(f"  {depth:>8}  {offset_ms:>10.2f}  {cursor_ms:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
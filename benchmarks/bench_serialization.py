@@ -0,0 +1,109 @@
+"""
+bench_serialization.py — Per-row cost of rendering an idea page, old path vs serializer.
+
+Seeds --ideas ideas from --authors authors, about half of them reviewed, into
+a temporary database. Then it times building one --limit page of JSON two ways.
+The old path loads ORM objects with joined people, builds a dict from
+__table__.columns per row, runs IdeaPublic.model_validate, and lets FastAPI
+validate and serialize the list again through response_model. The new path
+is src.app.api.serializers: a column-projected select, model_construct with
+shared profiles, and one TypeAdapter.dump_json.
+
+Run with: uv run python -m benchmarks.bench_serialization --ideas 2000 --limit 100
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import Session
+
+from src.app.api import serializers
+from src.app.crud import idea as crud_idea
+from src.app.db.base import Base
+from src.app.models.idea import Idea
+from src.app.models.user import User
+from src.app.schemas.idea import IdeaPublic
+
+
+def seed(db: Session, ideas: int, authors: int) -> None:
+    users = [{"id": f"user-{n}", "email": f"user{n}@example.com", "hashed_password": "x",
+              "bio": "Benchmark author", "studio_name": "Lab"} for n in range(authors)]
+    db.execute(insert(User), users)
+    start = datetime(2024, 1, 1)
+    rows = [
+        {"id": str(uuid.uuid4()), "title": f"Idea {i}", "description": "Benchmark idea body " * 10,
+         "category": "AI", "tags": "ai, llm", "status": "accepted" if i % 2 else "submitted",
+         "admin_comment": "Looks good" if i % 2 else None, "reviewed_by_id": "user-0" if i % 2 else None,
+         "user_id": f"user-{i % authors}", "created_at": start + timedelta(seconds=i)}
+        for i in range(ideas)
+    ]
+    db.execute(insert(Idea), rows)
+    db.commit()
+
+
+def old_path(db: Session, limit: int, field) -> bytes:
+    ideas = crud_idea.get_all_ideas(db, limit=limit)
+    content = [IdeaPublic.model_validate({
+        **{c.name: getattr(i, c.name) for c in i.__table__.columns},
+        "author": i.owner,
+        "reviewer": i.reviewer,
+    }) for i in ideas]
+    # What FastAPI does with the return value of a response_model route, then JSONResponse.render
+    payload = asyncio.run(serialize_response(field=field, response_content=content))
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def new_path(db: Session, limit: int) -> bytes:
+    return serializers.ideas_response(crud_idea.get_all_idea_rows(db, limit=limit)).body
+
+
+def time_ms(fn, repeats: int) -> float:
+    samples = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--ideas", type=int, default=2000)
+    parser.add_argument("--authors", type=int, default=20)
+    parser.add_argument("--limit", type=int, default=100, help="page size")
+    parser.add_argument("--repeats", type=int, default=50, help="median of this many pages per path")
+    args = parser.parse_args()
+
+    field = create_model_field("Response_read_all_ideas", list[IdeaPublic], mode="serialization")
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        Base.metadata.create_all(bind=engine)
+        with Session(engine) as db:
+            seed(db, args.ideas, args.authors)
+            assert json.loads(old_path(db, args.limit, field)) == json.loads(new_path(db, args.limit))
+
+            def old():
+                old_path(db, args.limit, field)
+                db.expunge_all()
+
+            old_ms = time_ms(old, args.repeats)
+            new_ms = time_ms(lambda: new_path(db, args.limit), args.repeats)
+
+    print(f"ideas={args.ideas} authors={args.authors} limit={args.limit}")
+    print(f"  {'path':<12}  {'page ms':>8}  {'us/row':>8}")
+    for name, ms in (("old", old_ms), ("serializer", new_ms)):
+        print(f"  {name:<12}  {ms:>8.2f}  {ms * 1000 / args.limit:>8.1f}")
+    print(f"  speed-up {old_ms / new_ms:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+bench_sse_memory.py — Memory per idle notification stream, and the polling it replaces.
+
+Drives the real app against a temporary database. It opens --clients
+GET /api/notifications/stream connections, one per user, lets them sit idle
+through a few heartbeats, and measures the Python heap (tracemalloc) and the
+process RSS before and after. It then publishes one notification to every
+user and times how long it takes until every stream has it. The same clients
+polling every 10 seconds would send clients * 6 requests a minute, each a JWT
+check and an ETag lookup.
+
+Run with: uv run python -m benchmarks.bench_sse_memory --clients 1000
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+from sqlalchemy import create_engine, select
+
+from src.app.core import notification_stream
+from src.app.core.config import settings
+from src.app.main import app
+from src.app.models.user import User
+
+from benchmarks.bench_login_storm import setup_db
+from benchmarks.bench_overload import make_users
+
+POLL_SECONDS = 10
+
+
+def rss_bytes() -> int:
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+class IdleStream:
+    def __init__(self, headers: dict):
+        self.headers = [(k.lower().encode(), v.encode()) for k, v in headers.items()]
+        self.received = asyncio.Event()
+        self.started = asyncio.Event()
+        self.closed = asyncio.Event()
+
+    async def run(self):
+        scope = {"type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+                 "scheme": "http", "path": "/api/notifications/stream", "raw_path": b"/api/notifications/stream",
+                 "query_string": b"", "root_path": "", "headers": self.headers,
+                 "client": ("127.0.0.1", 50000), "server": ("bench", 80)}
+
+        async def receive():
+            await self.closed.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            if message["type"] == "http.response.start":
+                self.started.set()
+            elif b"event: notification" in message.get("body", b""):
+                self.received.set()
+
+        await app(scope, receive, send)
+
+
+async def run(users: list[tuple[str, dict]], idle: float) -> None:
+    # One stream first, so lazy imports and first-use caches aren't billed to the clients
+    warm = IdleStream(users[0][1])
+    task = asyncio.create_task(warm.run())
+    await warm.started.wait()
+    warm.closed.set()
+    await task
+
+    tracemalloc.start()
+    heap_before, rss_before = tracemalloc.get_traced_memory()[0], rss_bytes()
+    streams = [IdleStream(headers) for _, headers in users]
+    tasks = [asyncio.create_task(s.run()) for s in streams]
+    await asyncio.gather(*(s.started.wait() for s in streams))
+    await asyncio.sleep(idle)
+    heap, rss = tracemalloc.get_traced_memory()[0] - heap_before, rss_bytes() - rss_before
+    tracemalloc.stop()
+    count = len(streams)
+    print(f"  {count} idle streams: heap {heap / count / 1024:6.1f} KiB/client, "
+          f"RSS {rss / count / 1024:6.1f} KiB/client ({rss / 2**20:.1f} MiB total)")
+
+    now = datetime.utcnow()
+    started = time.perf_counter()
+    notification_stream.publish([{"id": f"bench-{n}", "user_id": user_id, "message": "Benchmark",
+                                  "is_read": False, "type": "new_idea", "created_at": now}
+                                 for n, (user_id, _) in enumerate(users)])
+    await asyncio.gather(*(s.received.wait() for s in streams))
+    print(f"  one notification to every client delivered in {(time.perf_counter() - started) * 1000:.1f} ms")
+    print(f"  polling instead: {count * 60 // POLL_SECONDS} requests/minute")
+
+    for s in streams:
+        s.closed.set()
+    await asyncio.gather(*tasks)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--clients", type=int, default=1000, help="open streams, one user each")
+    parser.add_argument("--idle", type=float, default=3.0, help="seconds the streams sit idle before measuring")
+    parser.add_argument("--heartbeat", type=float, default=1.0, help="SSE heartbeat interval, seconds")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "bench.db")
+        setup_db(db_path, 8)
+        tokens = make_users(db_path, args.clients)
+        with create_engine(f"sqlite:///{db_path}").connect() as conn:
+            ids = dict(conn.execute(select(User.email, User.id)).all())
+        users = [(ids[f"user{i}@example.com"], headers) for i, headers in enumerate(tokens)]
+        settings.rate_limit_enabled = False
+        settings.sse_heartbeat_seconds = args.heartbeat
+        print(f"clients={args.clients}, heartbeat every {args.heartbeat:g}s")
+        asyncio.run(run(users, args.idle))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+bench_wire_bytes.py — Bytes on the wire for an admin dashboard load, before vs after compression.
+
+Seeds --ideas ideas into a temporary database and builds the static assets
+into a temporary directory. Then it fetches what the browser fetches to open
+the admin dashboard (index.html, app.js, style.css, /api/admin/dashboard)
+two ways:
+
+  plain       StaticFiles over static/, API responses uncompressed (before)
+  compressed  PrecompressedStaticFiles over the build, gzip on /api (after)
+
+It reports the body bytes of each response on a first visit, and of a repeat
+visit. On a repeat visit the browser revalidates index.html and unversioned
+assets with If-None-Match (a round trip each, 0 bytes when unchanged), while
+fingerprinted assets come from its cache without a request. CDN scripts are
+not counted.
+
+Run with: uv run python -m benchmarks.bench_wire_bytes --ideas 500
+"""
+import argparse
+import os
+import tempfile
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from fastapi import FastAPI
+from fastapi.staticfiles import StaticFiles
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, insert, select, update
+from sqlalchemy.orm import Session
+
+from src.app.core import assets
+from src.app.core.config import settings
+from src.app.core.security import create_access_token
+from src.app.main import app
+from src.app.models.idea import Idea
+from src.app.models.user import User
+
+from benchmarks.bench_login_storm import EMAIL, setup_db
+
+
+def seed(db_path: str, ideas: int) -> dict:
+    engine = create_engine(f"sqlite:///{db_path}")
+    with Session(engine) as db:
+        db.execute(update(User).where(User.email == EMAIL).values(role="admin"))
+        user_id = db.scalar(select(User.id).where(User.email == EMAIL))
+        start = datetime(2024, 1, 1)
+        db.execute(insert(Idea), [
+            {"id": str(uuid.uuid4()), "title": f"Idea {i}", "description": "Benchmark idea body " * 10,
+             "category": "AI", "tags": "ai, llm", "status": "accepted" if i % 3 == 0 else "submitted",
+             "user_id": user_id, "created_at": start + timedelta(hours=i)}
+            for i in range(ideas)
+        ])
+        db.commit()
+    return {"Authorization": f"Bearer {create_access_token({'sub': EMAIL})}"}
+
+
+def static_client(files) -> TestClient:
+    site = FastAPI()
+    site.mount("/", files, name="static")
+    return TestClient(site)
+
+
+def body_bytes(res) -> int:
+    # Content-Length is what was sent; .content is already decoded
+    return int(res.headers.get("content-length", len(res.content)))
+
+
+def load(site: TestClient, api: TestClient, admin: dict, names: dict, encoding: str) -> dict:
+    """(bytes, requests) per resource on a first visit and on a repeat visit."""
+    accept = {"Accept-Encoding": encoding}
+    first, sent = {}, {}
+    for name, path in {"index.html": "", **names}.items():
+        res = site.get(f"/{path}", headers=accept)
+        first[name], sent[name] = (body_bytes(res), 1), res.headers
+    dashboard = (body_bytes(api.get("/api/admin/dashboard", headers={**admin, **accept})), 1)
+    first["/api/admin/dashboard"] = dashboard
+
+    repeat = {}
+    for name, path in {"index.html": "", **names}.items():
+        if "immutable" in sent[name].get("cache-control", ""):
+            repeat[name] = (0, 0)  # served from the browser cache, no request at all
+        else:
+            res = site.get(f"/{path}", headers={**accept, "If-None-Match": sent[name]["etag"]})
+            repeat[name] = (body_bytes(res) if res.status_code != 304 else 0, 1)
+    repeat["/api/admin/dashboard"] = dashboard
+    return {"first visit": first, "repeat visit": repeat}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--ideas", type=int, default=500, help="ideas in the database")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "bench.db")
+        setup_db(db_path, 4)
+        admin = seed(db_path, args.ideas)
+        settings.rate_limit_enabled = False
+        dist = Path(tmp) / "dist"
+        built = assets.build(assets.SOURCE_DIR, dist)["assets"]
+        api = TestClient(app)
+
+        modes = {
+            "plain": load(static_client(StaticFiles(directory=str(assets.SOURCE_DIR), html=True)),
+                          api, admin, {n: n for n in assets.FINGERPRINTED}, "identity"),
+            "compressed": load(static_client(assets.PrecompressedStaticFiles(directory=str(dist), html=True)),
+                               api, admin, built, "gzip, br"),
+        }
+        print(f"ideas={args.ideas}, brotli {'on' if assets.brotli is not None else 'off (pip install brotli)'}")
+        for visit in ("first visit", "repeat visit"):
+            print(f"  {visit}")
+            for name in modes["plain"][visit]:
+                (before, _), (after, _) = modes["plain"][visit][name], modes["compressed"][visit][name]
+                print(f"    {name:<22} {before:>9,} B -> {after:>9,} B")
+            (before, before_requests), (after, after_requests) = (
+                [sum(col) for col in zip(*modes[m][visit].values())] for m in ("plain", "compressed"))
+            print(f"    {'total':<22} {before:>9,} B -> {after:>9,} B  ({after / before:.0%}), "
+                  f"{before_requests} -> {after_requests} requests")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""Baseline schema: users, ideas, todos, calendar_events, notifications
+
+Replaces migrate_db.py, scripts/migrate_v2.py and recreate_todos.py. Safe to
+run against a database created by the old `create_all` startup or those
+scripts: existing tables are kept and only missing columns/indexes are added.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def _tables() -> dict[str, list[sa.Column]]:
+    return {
+        "users": [
+            sa.Column("id", sa.String(), primary_key=True),
+            sa.Column("email", sa.String(), nullable=False),
+            sa.Column("hashed_password", sa.String(), nullable=False),
+            sa.Column("role", sa.String(), nullable=True),
+            sa.Column("is_active", sa.Boolean(), nullable=True),
+            sa.Column("avatar_url", sa.String(), nullable=True),
+            sa.Column("bio", sa.Text(), nullable=True),
+            sa.Column("github_link", sa.String(), nullable=True),
+            sa.Column("linkedin_link", sa.String(), nullable=True),
+            sa.Column("studio_name", sa.String(), nullable=True),
+        ],
+        "ideas": [
+            sa.Column("id", sa.String(), primary_key=True),
+            sa.Column("title", sa.String(), nullable=False),
+            sa.Column("description", sa.Text(), nullable=False),
+            sa.Column("category", sa.String(), nullable=False),
+            sa.Column("file_path", sa.String(), nullable=True),
+            sa.Column("status", sa.String(), nullable=True),
+            sa.Column("admin_comment", sa.Text(), nullable=True),
+            sa.Column("created_at", sa.DateTime(), nullable=True),
+            sa.Column("tags", sa.String(), nullable=True),
+            sa.Column("problem_statement", sa.Text(), nullable=True),
+            sa.Column("solution", sa.Text(), nullable=True),
+            sa.Column("user_id", sa.String(), sa.ForeignKey("users.id"), nullable=False),
+            sa.Column("reviewed_by_id", sa.String(), sa.ForeignKey("users.id"), nullable=True),
+        ],
+        "todos": [
+            sa.Column("id", sa.String(), primary_key=True),
+            sa.Column("user_id", sa.String(), sa.ForeignKey("users.id"), nullable=False),
+            sa.Column("title", sa.String(), nullable=False),
+            sa.Column("description", sa.String(), nullable=True),
+            sa.Column("date", sa.String(), nullable=True),
+            sa.Column("start_time", sa.String(), nullable=True),
+            sa.Column("end_time", sa.String(), nullable=True),
+            sa.Column("tags", sa.String(), nullable=True),
+            sa.Column("assigned_by", sa.String(), sa.ForeignKey("users.id"), nullable=True),
+            sa.Column("done", sa.Boolean(), nullable=True),
+            sa.Column("created_at", sa.DateTime(), nullable=True),
+        ],
+        "calendar_events": [
+            sa.Column("id", sa.String(), primary_key=True),
+            sa.Column("user_id", sa.String(), sa.ForeignKey("users.id"), nullable=False),
+            sa.Column("title", sa.String(), nullable=False),
+            sa.Column("date", sa.String(), nullable=False),
+            sa.Column("time", sa.String(), nullable=True),
+            sa.Column("description", sa.String(), nullable=True),
+            sa.Column("color", sa.String(), nullable=True),
+        ],
+        "notifications": [
+            sa.Column("id", sa.String(), primary_key=True),
+            sa.Column("user_id", sa.String(), sa.ForeignKey("users.id"), nullable=False),
+            sa.Column("message", sa.String(), nullable=False),
+            sa.Column("is_read", sa.Boolean(), nullable=True),
+            sa.Column("type", sa.String(), nullable=False),
+            sa.Column("created_at", sa.DateTime(), nullable=True),
+        ],
+    }
+
+
+# (name, table, columns, unique) — what `create_all` produced for index=True columns
+INDEXES = [
+    ("ix_users_id", "users", ["id"], False),
+    ("ix_users_email", "users", ["email"], True),
+    ("ix_ideas_id", "ideas", ["id"], False),
+    ("ix_todos_id", "todos", ["id"], False),
+    ("ix_todos_user_id", "todos", ["user_id"], False),
+    ("ix_calendar_events_id", "calendar_events", ["id"], False),
+    ("ix_calendar_events_user_id", "calendar_events", ["user_id"], False),
+    ("ix_notifications_id", "notifications", ["id"], False),
+    ("ix_notifications_user_id", "notifications", ["user_id"], False),
+]
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    existing = set(inspector.get_table_names())
+
+    for table, columns in _tables().items():
+        if table not in existing:
+            op.create_table(table, *columns)
+            continue
+        # Legacy database: add whatever the ad-hoc scripts never got to
+        present = {c["name"] for c in inspector.get_columns(table)}
+        for column in columns:
+            if column.name not in present:
+                op.add_column(table, sa.Column(column.name, column.type, nullable=True))
+
+    for name, table, columns, unique in INDEXES:
+        op.create_index(name, table, columns, unique=unique, if_not_exists=True)
+
+
+def downgrade() -> None:
+    for name, table, _, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
+    for table in reversed(list(_tables())):
+        op.drop_table(table)
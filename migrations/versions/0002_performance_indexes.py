@@ -0,0 +1,47 @@
+"""Composite indexes for the hot list/feed queries
+
+The single-column user_id indexes on todos, calendar_events and notifications
+become redundant (they are prefixes of the new composites) and are dropped to
+save write amplification.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18
+"""
+from alembic import op
+
+from src.app.db.indexes import create_indexes_in_batches
+
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+INDEXES = [
+    ("ix_ideas_user_id_created_at", "ideas", ["user_id", "created_at"]),
+    ("ix_ideas_status_created_at", "ideas", ["status", "created_at"]),
+    ("ix_ideas_reviewed_by_id", "ideas", ["reviewed_by_id"]),
+    ("ix_notifications_user_id_is_read_created_at", "notifications", ["user_id", "is_read", "created_at"]),
+    ("ix_todos_user_id_date", "todos", ["user_id", "date"]),
+    ("ix_calendar_events_user_id_date", "calendar_events", ["user_id", "date"]),
+]
+
+SUPERSEDED = [
+    ("ix_todos_user_id", "todos", ["user_id"]),
+    ("ix_calendar_events_user_id", "calendar_events", ["user_id"]),
+    ("ix_notifications_user_id", "notifications", ["user_id"]),
+]
+
+
+def upgrade() -> None:
+    create_indexes_in_batches(op, INDEXES)
+    for name, table, _ in SUPERSEDED:
+        op.drop_index(name, table_name=table, if_exists=True)
+
+
+def downgrade() -> None:
+    create_indexes_in_batches(op, SUPERSEDED)
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,41 @@
+"""Indexes for keyset pagination of the idea feeds
+
+Both feeds page by (created_at, id) newest first. The user feed index gains
+id as a tie-breaker and replaces ix_ideas_user_id_created_at, which becomes
+its prefix.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18
+"""
+from alembic import op
+
+from src.app.db.indexes import create_indexes_in_batches
+
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+
+INDEXES = [
+    ("ix_ideas_user_id_created_at_id", "ideas", ["user_id", "created_at", "id"]),
+    ("ix_ideas_created_at_id", "ideas", ["created_at", "id"]),
+]
+
+SUPERSEDED = [
+    ("ix_ideas_user_id_created_at", "ideas", ["user_id", "created_at"]),
+]
+
+
+def upgrade() -> None:
+    create_indexes_in_batches(op, INDEXES)
+    for name, table, _ in SUPERSEDED:
+        op.drop_index(name, table_name=table, if_exists=True)
+
+
+def downgrade() -> None:
+    create_indexes_in_batches(op, SUPERSEDED)
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,29 @@
+"""Full-text search index over ideas (FTS5)
+
+Creates ideas_fts with its sync triggers and indexes the existing ideas.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18
+"""
+from alembic import op
+from sqlalchemy import text
+
+from src.app.db import search
+
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    for statement in search.create_statements(key="rowid"):
+        op.execute(text(statement))
+    search.rebuild(op.get_bind())
+
+
+def downgrade() -> None:
+    for statement in search.DROP_STATEMENTS:
+        op.execute(text(statement))
@@ -0,0 +1,84 @@
+"""Normalised idea tags (tags, idea_tags) and the category facet index
+
+Backfills idea_tags from the free-form ideas.tags column in rowid order,
+BATCH_SIZE ideas per committed transaction. A large table never holds the
+write lock for long, and an interrupted run resumes safely because every
+insert is OR IGNORE.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18
+"""
+import time
+
+from alembic import op
+import sqlalchemy as sa
+
+from src.app.crud.tag import parse_tags
+from src.app.db.indexes import create_indexes_in_batches
+
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 1000
+
+INDEXES = [
+    ("ix_ideas_category", "ideas", ["category"]),
+]
+
+
+def _backfill(log=print) -> None:
+    bind = op.get_bind()
+    last_rowid, total = 0, 0
+    started = time.perf_counter()
+    # Outside the migration transaction: BEGIN/COMMIT by hand, one batch each
+    with op.get_context().autocommit_block():
+        while True:
+            bind.exec_driver_sql("BEGIN")
+            try:
+                rows = bind.execute(sa.text(
+                    "SELECT rowid, id, tags FROM ideas WHERE rowid > :last ORDER BY rowid LIMIT :n"
+                ), {"last": last_rowid, "n": BATCH_SIZE}).all()
+                links = [(idea_id, name) for _, idea_id, raw in rows for name in parse_tags(raw)]
+                if links:
+                    bind.execute(sa.text("INSERT OR IGNORE INTO tags (name) VALUES (:name)"),
+                                 [{"name": name} for name in {name for _, name in links}])
+                    bind.execute(sa.text(
+                        "INSERT OR IGNORE INTO idea_tags (idea_id, tag_id) "
+                        "SELECT :idea_id, id FROM tags WHERE name = :name"
+                    ), [{"idea_id": idea_id, "name": name} for idea_id, name in links])
+                bind.exec_driver_sql("COMMIT")
+            except Exception:
+                bind.exec_driver_sql("ROLLBACK")
+                raise
+            if not rows:
+                break
+            last_rowid, total = rows[-1][0], total + len(rows)
+    log(f"  backfilled tags for {total} ideas in {(time.perf_counter() - started) * 1000:.0f} ms")
+
+
+def upgrade() -> None:
+    op.create_table(
+        "tags",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("name", sa.String(), nullable=False, unique=True),
+        if_not_exists=True,
+    )
+    op.create_table(
+        "idea_tags",
+        sa.Column("idea_id", sa.String(), sa.ForeignKey("ideas.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("tag_id", sa.Integer(), sa.ForeignKey("tags.id", ondelete="CASCADE"), primary_key=True),
+        if_not_exists=True,
+    )
+    create_indexes_in_batches(op, [("ix_idea_tags_tag_id_idea_id", "idea_tags", ["tag_id", "idea_id"]), *INDEXES])
+    _backfill()
+
+
+def downgrade() -> None:
+    for name, table, _ in INDEXES:
+        op.drop_index(name, table_name=table)
+    op.drop_table("idea_tags")
+    op.drop_table("tags")
@@ -0,0 +1,46 @@
+"""Content-addressed attachments: the attachments table and ideas' blob columns
+
+Ideas uploaded before this revision keep their flat uploads/<uuid>.<ext>
+file_path and have no attachment_sha256. They are not hashed or moved.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from src.app.db.indexes import create_indexes_in_batches
+
+
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+INDEXES = [
+    ("ix_ideas_attachment_sha256", "ideas", ["attachment_sha256"]),
+]
+
+
+def upgrade() -> None:
+    op.create_table(
+        "attachments",
+        sa.Column("sha256", sa.String(64), primary_key=True),
+        sa.Column("size", sa.Integer(), nullable=False),
+        sa.Column("refcount", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        if_not_exists=True,
+    )
+    op.add_column("ideas", sa.Column("attachment_sha256", sa.String(64), nullable=True))
+    op.add_column("ideas", sa.Column("attachment_name", sa.String(), nullable=True))
+    create_indexes_in_batches(op, INDEXES)
+
+
+def downgrade() -> None:
+    for name, table, _ in INDEXES:
+        op.drop_index(name, table_name=table)
+    # Plain ALTER TABLE ... DROP COLUMN (SQLite >= 3.35); a batch rebuild would drop the search triggers
+    op.drop_column("ideas", "attachment_name")
+    op.drop_column("ideas", "attachment_sha256")
+    op.drop_table("attachments")
@@ -0,0 +1,41 @@
+"""Per-author idea counters maintained by triggers
+
+Creates user_idea_stats and its triggers on ideas, then fills it from the
+existing ideas with one GROUP BY.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import text
+
+from src.app.db import aggregates
+
+
+revision = "0007"
+down_revision = "0006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "user_idea_stats",
+        sa.Column("user_id", sa.String(), sa.ForeignKey("users.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("total", sa.Integer(), nullable=False),
+        sa.Column("accepted", sa.Integer(), nullable=False),
+        sa.Column("rejected", sa.Integer(), nullable=False),
+        sa.Column("pending", sa.Integer(), nullable=False),
+        if_not_exists=True,
+    )
+    for statement in aggregates.USER_STATS.create_statements:
+        op.execute(text(statement))
+    aggregates.USER_STATS.reconcile(op.get_bind())
+
+
+def downgrade() -> None:
+    for statement in aggregates.USER_STATS.drop_statements:
+        op.execute(text(statement))
+    op.drop_table("user_idea_stats")
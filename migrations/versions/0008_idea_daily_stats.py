@@ -0,0 +1,40 @@
+"""Daily submission rollups maintained by triggers
+
+Creates idea_daily_stats and its triggers on ideas, then fills it from the
+existing ideas with one GROUP BY.
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import text
+
+from src.app.db import aggregates
+
+
+revision = "0008"
+down_revision = "0007"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "idea_daily_stats",
+        sa.Column("day", sa.String(10), primary_key=True),
+        sa.Column("submitted", sa.Integer(), nullable=False),
+        sa.Column("accepted", sa.Integer(), nullable=False),
+        sa.Column("rejected", sa.Integer(), nullable=False),
+        if_not_exists=True,
+    )
+    for statement in aggregates.DAILY_STATS.create_statements:
+        op.execute(text(statement))
+    aggregates.DAILY_STATS.reconcile(op.get_bind())
+
+
+def downgrade() -> None:
+    for statement in aggregates.DAILY_STATS.drop_statements:
+        op.execute(text(statement))
+    op.drop_table("idea_daily_stats")
@@ -0,0 +1,46 @@
+"""Per-user collection version counters for list ETags
+
+Creates collection_versions and the triggers that bump it on ideas, todos,
+calendar_events and notifications, plus the one on users that bumps "ideas"
+when a profile embedded in idea responses changes. Counters start at 0: no
+ETag was issued before this revision, so there is nothing to backfill.
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import text
+
+from src.app.db import versions
+
+
+revision = "0009"
+down_revision = "0008"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "collection_versions",
+        sa.Column("user_id", sa.String(), sa.ForeignKey("users.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("collection", sa.String(), primary_key=True),
+        sa.Column("version", sa.Integer(), nullable=False),
+        if_not_exists=True,
+    )
+    for collection in versions.COLLECTIONS:
+        for statement in versions.create_statements(collection):
+            op.execute(text(statement))
+    for statement in versions.create_profile_statements():
+        op.execute(text(statement))
+
+
+def downgrade() -> None:
+    for statement in versions.drop_profile_statements():
+        op.execute(text(statement))
+    for collection in versions.COLLECTIONS:
+        for statement in versions.drop_statements(collection):
+            op.execute(text(statement))
+    op.drop_table("collection_versions")
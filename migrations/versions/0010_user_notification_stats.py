@@ -0,0 +1,39 @@
+"""Per-user notification counters maintained by triggers
+
+Creates user_notification_stats and its triggers on notifications, then fills
+it from the existing notifications with one GROUP BY.
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import text
+
+from src.app.db import aggregates
+
+
+revision = "0010"
+down_revision = "0009"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "user_notification_stats",
+        sa.Column("user_id", sa.String(), sa.ForeignKey("users.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("total", sa.Integer(), nullable=False),
+        sa.Column("unread", sa.Integer(), nullable=False),
+        if_not_exists=True,
+    )
+    for statement in aggregates.NOTIFICATION_STATS.create_statements:
+        op.execute(text(statement))
+    aggregates.NOTIFICATION_STATS.reconcile(op.get_bind())
+
+
+def downgrade() -> None:
+    for statement in aggregates.NOTIFICATION_STATS.drop_statements:
+        op.execute(text(statement))
+    op.drop_table("user_notification_stats")
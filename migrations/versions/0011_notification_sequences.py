@@ -0,0 +1,52 @@
+"""Number notifications per user in commit order
+
+Adds notifications.seq and notification_sequences, numbers the existing
+notifications of each user in (created_at, id) order, starts each counter at
+its user's highest number, and then creates the trigger that numbers new
+rows. ?since= and the long-poll page over seq from here on.
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import text
+
+from src.app.db import sequences
+from src.app.db.indexes import create_indexes_in_batches
+
+
+revision = "0011"
+down_revision = "0010"
+branch_labels = None
+depends_on = None
+
+
+INDEXES = [
+    ("ix_notifications_user_id_seq", "notifications", ["user_id", "seq"]),
+]
+
+
+def upgrade() -> None:
+    op.add_column("notifications", sa.Column("seq", sa.Integer(), nullable=True))
+    op.create_table(
+        "notification_sequences",
+        sa.Column("user_id", sa.String(), sa.ForeignKey("users.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("last_seq", sa.Integer(), nullable=False),
+        if_not_exists=True,
+    )
+    for statement in sequences.backfill_statements():
+        op.execute(text(statement))
+    for statement in sequences.create_statements():
+        op.execute(text(statement))
+    create_indexes_in_batches(op, INDEXES)
+
+
+def downgrade() -> None:
+    for statement in sequences.drop_statements():
+        op.execute(text(statement))
+    for name, table, _ in INDEXES:
+        op.drop_index(name, table_name=table)
+    op.drop_table("notification_sequences")
+    op.drop_column("notifications", "seq")
@@ -0,0 +1,43 @@
+"""Key the idea search index on an explicit integer column
+
+ideas_fts was keyed on the implicit rowid of ideas, which has a string primary
+key, so VACUUM could renumber the rows under the index. Adds ideas.search_docid,
+sets it to each idea's current rowid (so search cursors already handed out stay
+valid), and recreates ideas_fts and its triggers on it.
+
+Revision ID: 0012
+Revises: 0011
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import text
+
+from src.app.db import search
+
+
+revision = "0012"
+down_revision = "0011"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    for statement in search.DROP_STATEMENTS:
+        op.execute(text(statement))
+    op.add_column("ideas", sa.Column("search_docid", sa.Integer(), nullable=True))
+    op.execute(text("UPDATE ideas SET search_docid = rowid"))
+    op.create_index("ix_ideas_search_docid", "ideas", ["search_docid"], unique=True)
+    for statement in search.CREATE_STATEMENTS:
+        op.execute(text(statement))
+    search.rebuild(op.get_bind())
+
+
+def downgrade() -> None:
+    for statement in search.DROP_STATEMENTS:
+        op.execute(text(statement))
+    op.drop_index("ix_ideas_search_docid", table_name="ideas")
+    op.drop_column("ideas", "search_docid")
+    for statement in search.create_statements(key="rowid"):
+        op.execute(text(statement))
+    search.rebuild(op.get_bind())
@@ -1,45 +1,118 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
-from typing import List
-from src.app.api.deps import RoleChecker, get_current_user
-from src.app.db.session import get_db
-from src.app.schemas.user import User, UserAdminView, RoleUpdate
-from src.app.schemas.idea import IdeaPublic, IdeaEvaluation
+from datetime import date, datetime, timezone
+from typing import List, Optional
+from src.app.api.deps import require_admin, get_cursor
+from src.app.api import serializers
+from src.app.core import pagination
+from src.app.db.session import get_db, get_read_db
+from src.app.schemas.user import User, UserAdminView, RoleUpdate, UserSort, SortOrder
+from src.app.schemas.idea import IdeaPublic, IdeaEvaluation, IdeaBatchEvaluation, IdeaBatchEvaluationResult
 from src.app.schemas.todo import Todo, TodoCreate
+from src.app.schemas.stats import AdminDashboard, AdminStats, StatsBucket
 from src.app.crud import idea as crud_idea
 from src.app.crud import user as crud_user
 from src.app.crud import notification as crud_notif
 from src.app.schemas.notification import NotificationCreate
+from src.app.core.dashboard_cache import SNAPSHOT_KEY, dashboard_cache
+from src.app.core.metrics import metrics
+from src.app.tasks import attachment_gc
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 
 
-def _idea_to_public(idea) -> IdeaPublic:
-    return IdeaPublic.model_validate({
-        **{c.name: getattr(idea, c.name) for c in idea.__table__.columns},
-        "author": idea.owner,
-        "reviewer": idea.reviewer,
-    })
-
-
-@router.get("/summary", dependencies=[Depends(RoleChecker(["admin"]))])
+@router.get("/summary", dependencies=[Depends(require_admin)])
 def get_admin_summary():
     return {"message": "Admin Dashboard Summary", "total_users": "N/A"}
 
 
-@router.get("/ideas", response_model=List[IdeaPublic], dependencies=[Depends(RoleChecker(["admin"]))])
+@router.get("/metrics", dependencies=[Depends(require_admin)])
+def get_metrics():
+    """In-process counters, gauges and latency summaries for this worker."""
+    return metrics.snapshot()
+
+
+@router.post("/attachments/gc", dependencies=[Depends(require_admin)])
+def collect_attachments(dry_run: bool = True, db: Session = Depends(get_db)):
+    """Delete attachment files no idea references. Defaults to a dry run that only reports."""
+    return attachment_gc.collect(db, dry_run=dry_run)
+
+
+@router.get("/ideas", response_model=List[IdeaPublic], dependencies=[Depends(require_admin)])
 def read_all_ideas(
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db)
+    tag: Optional[str] = None,
+    after: Optional[pagination.Position] = Depends(get_cursor),
+    db: Session = Depends(get_read_db)
 ):
-    ideas = crud_idea.get_all_ideas(db, skip=skip, limit=limit)
-    return [_idea_to_public(i) for i in ideas]
+    """Newest first, optionally only ideas tagged ``tag``. Pass X-Next-Cursor back as ?cursor=."""
+    rows = crud_idea.get_all_idea_rows(db, skip=skip, limit=limit + 1, after=after, tag=tag)
+    rows, next_cursor = pagination.split_page(rows, limit)
+    headers = {pagination.NEXT_CURSOR_HEADER: next_cursor} if next_cursor else None
+    return serializers.ideas_response(rows, headers=headers)
+
+
+@router.get("/stats", response_model=AdminStats, dependencies=[Depends(require_admin)])
+def get_admin_stats(
+    start: Optional[date] = Query(None, alias="from"),
+    end: Optional[date] = Query(None, alias="to"),
+    bucket: StatsBucket = "day",
+    db: Session = Depends(get_read_db),
+):
+    """Counts for ideas submitted between ``from`` and ``to`` (inclusive UTC days), per day/week/month.
+
+    Read from the trigger-maintained daily rollup, so the cost follows the number
+    of days in range, not the number of ideas.
+    """
+    if start and end and start > end:
+        raise HTTPException(status_code=400, detail="'from' must not be after 'to'.")
+    return crud_idea.get_admin_stats(db, start=start, end=end, bucket=bucket)
+
+
+DASHBOARD_IDEAS = 100
+DASHBOARD_USERS = 10
+
+def _dashboard_snapshot(db: Session) -> bytes:
+    rows = crud_idea.get_all_idea_rows(db, limit=DASHBOARD_IDEAS + 1)
+    rows, next_cursor = pagination.split_page(rows, DASHBOARD_IDEAS)
+    users = crud_user.get_users_with_stats(db, limit=DASHBOARD_USERS, sort="total", descending=True)
+    snapshot = AdminDashboard.model_construct(
+        generated_at=datetime.now(timezone.utc),
+        stats=AdminStats.model_validate(crud_idea.get_admin_stats(db)),
+        ideas=serializers.ideas_from_rows(rows),
+        ideas_next_cursor=next_cursor,
+        top_users=[UserAdminView.model_validate(dict(row)) for row in users],
+    )
+    return snapshot.model_dump_json().encode()
 
 
-@router.get("/stats", dependencies=[Depends(RoleChecker(["admin"]))])
-def get_admin_stats(db: Session = Depends(get_db)):
-    return crud_idea.get_admin_stats(db)
+@router.get("/dashboard", response_model=AdminDashboard, dependencies=[Depends(require_admin)])
+def get_admin_dashboard(db: Session = Depends(get_read_db)):
+    """Stats, the newest ideas and the most active users in one payload.
+
+    Served from a snapshot shared by all admins: rebuilt at most every
+    DASHBOARD_CACHE_TTL_SECONDS, once however many admins miss together, and
+    dropped when an idea or a role changes.
+    """
+    body = dashboard_cache.get(SNAPSHOT_KEY, lambda: _dashboard_snapshot(db))
+    return Response(body, media_type="application/json", headers={"Cache-Control": "private, no-cache"})
+
+
+@router.post("/ideas/evaluate:batch", response_model=IdeaBatchEvaluationResult)
+def evaluate_ideas(
+    batch: IdeaBatchEvaluation,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_admin)
+):
+    """Evaluate up to 200 ideas in one transaction and notify their authors.
+
+    Items that cannot be applied (unknown or repeated idea) are reported in
+    ``results`` with ``ok: false``; the rest are still applied.
+    """
+    results = crud_idea.evaluate_ideas(db, batch.items, reviewed_by_id=current_user.id)
+    succeeded = sum(r["ok"] for r in results)
+    return {"succeeded": succeeded, "failed": len(results) - succeeded, "results": results}
 
 
 @router.patch("/ideas/{idea_id}/evaluate", response_model=IdeaPublic)
@@ -47,7 +120,7 @@ def evaluate_idea(
     idea_id: str,
     evaluation: IdeaEvaluation,
     db: Session = Depends(get_db),
-    current_user: User = Depends(RoleChecker(["admin"]))
+    current_user: User = Depends(require_admin)
 ):
     idea = crud_idea.get_idea(db, idea_id)
     if not idea:
@@ -60,15 +133,40 @@ def evaluate_idea(
         comment=evaluation.admin_comment,
         reviewed_by_id=current_user.id
     )
-    return _idea_to_public(updated)
+    return serializers.idea_from_orm(updated)
 
 
 # ── User Management ────────────────────────────────────────────────────────────
 
-@router.get("/users", response_model=List[UserAdminView], dependencies=[Depends(RoleChecker(["admin"]))])
-def list_all_users(db: Session = Depends(get_db)):
-    """Return all users with their idea submission statistics."""
-    return crud_user.get_all_users_with_stats(db)
+# Python type of each sort key, to decode its cursor
+USER_SORT_TYPES = {"email": str, "total": int, "accepted": int, "success_rate": float}
+
+@router.get("/users", response_model=List[UserAdminView], dependencies=[Depends(require_admin)])
+def list_all_users(
+    response: Response,
+    limit: int = Query(100, ge=1, le=500),
+    cursor: Optional[str] = None,
+    sort: UserSort = "email",
+    order: Optional[SortOrder] = None,
+    email: Optional[str] = Query(None, max_length=254),
+    db: Session = Depends(get_read_db),
+):
+    """Users with their idea statistics, one query per page.
+
+    Sorted by ``sort`` (ascending for email, descending for the counts unless
+    ``order`` says otherwise), optionally only emails containing ``email``.
+    Pass the X-Next-Cursor response header back as ?cursor= for the next page.
+    """
+    descending = (order or ("asc" if sort == "email" else "desc")) == "desc"
+    try:
+        after = pagination.decode_sort_cursor(cursor, USER_SORT_TYPES[sort]) if cursor else None
+    except pagination.InvalidCursorError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    rows = crud_user.get_users_with_stats(db, limit=limit + 1, sort=sort, descending=descending, after=after, email=email)
+    if len(rows) > limit:
+        rows = rows[:limit]
+        response.headers[pagination.NEXT_CURSOR_HEADER] = pagination.encode_sort_cursor(rows[-1][sort], rows[-1]["id"])
+    return [dict(row) for row in rows]
 
 
 @router.patch("/users/{user_id}/role", response_model=UserAdminView)
@@ -76,7 +174,7 @@ def update_user_role(
     user_id: str,
     payload: RoleUpdate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(RoleChecker(["admin"]))
+    current_user: User = Depends(require_admin)
 ):
     """Promote or demote a user's role (admin only)."""
     if payload.role not in ("admin", "submitter"):
@@ -86,20 +184,15 @@ def update_user_role(
     user = crud_user.set_user_role(db, user_id=user_id, role=payload.role)
     if not user:
         raise HTTPException(status_code=404, detail="User not found.")
-    # Build stats response
-    stats_list = crud_user.get_all_users_with_stats(db)
-    for s in stats_list:
-        if s["id"] == user_id:
-            return s
-    return user
+    return dict(crud_user.get_user_with_stats(db, user_id))
 
 
-@router.post("/users/{user_id}/todos", response_model=Todo, dependencies=[Depends(RoleChecker(["admin"]))])
+@router.post("/users/{user_id}/todos", response_model=Todo)
 def assign_todo_to_user(
     user_id: str,
     data: TodoCreate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(RoleChecker(["admin"]))
+    current_user: User = Depends(require_admin)
 ):
     """Assign a todo directly to a user's workspace (admin only)."""
     # Ensure user exists
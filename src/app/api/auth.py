@@ -1,36 +1,46 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
-from src.app.db.session import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.app.db.session import get_async_db
 from src.app.schemas.user import UserCreate, User
-from src.app.crud.user import get_user_by_email, create_user
-from src.app.core.security import verify_password, create_access_token
+from src.app.crud.aio import user as crud_user
+from src.app.core import hashing
+from src.app.core.security import create_access_token
 from src.app.api.deps import get_current_user
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
+# Password work runs in the hashing pool, so these handlers are async and
+# never hold a threadpool worker for the length of a hash.
+
 @router.post("/register", response_model=User, status_code=status.HTTP_201_CREATED)
-def register_user(user: UserCreate, db: Session = Depends(get_db)):
-    db_user = get_user_by_email(db, email=user.email)
+async def register_user(user: UserCreate, db: AsyncSession = Depends(get_async_db)):
+    db_user = await crud_user.get_user_by_email(db, email=user.email)
     if db_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already registered"
         )
-    return create_user(db=db, user=user)
+    return await crud_user.create_user(db=db, user=user)
 
 @router.post("/login")
-def login(
-    db: Session = Depends(get_db), form_data: OAuth2PasswordRequestForm = Depends()
+async def login(
+    db: AsyncSession = Depends(get_async_db), form_data: OAuth2PasswordRequestForm = Depends()
 ):
-    user = get_user_by_email(db, email=form_data.username)
-    if not user or not verify_password(form_data.password, user.hashed_password):
+    user = await crud_user.get_user_by_email(db, email=form_data.username)
+    verified, new_hash = (False, None)
+    if user:
+        verified, new_hash = await hashing.verify_and_update_password(form_data.password, user.hashed_password)
+    if not verified:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    
+    if new_hash:
+        # Stored hash predates the current PASSWORD_HASH_ROUNDS
+        await crud_user.change_password(db, user=user, new_hashed_password=new_hash)
+
     access_token = create_access_token(data={"sub": user.email})
     return {"access_token": access_token, "token_type": "bearer"}
 
@@ -1,36 +1,66 @@
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, Response, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import jwt, JWTError
 from sqlalchemy.orm import Session
-from src.app.db.session import get_db
-from src.app.core import security
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.app.db import versions
+from src.app.db.session import get_read_db, get_async_db
+from src.app.core import security, pagination
+from src.app.core.auth_cache import principal_cache
 from src.app.crud import user as crud_user
+from src.app.crud.aio import user as aio_crud_user
 from src.app.schemas.user import User
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
-def get_current_user(
-    db: Session = Depends(get_db), token: str = Depends(oauth2_scheme)
-) -> User:
-    credentials_exception = HTTPException(
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
+
+def _decode_token(token: str) -> dict:
     try:
         payload = jwt.decode(
             token, security.SECRET_KEY, algorithms=[security.ALGORITHM]
         )
-        email: str = payload.get("sub")
-        if email is None:
-            raise credentials_exception
+        if payload.get("sub") is None:
+            raise _credentials_exception()
     except JWTError:
-        raise credentials_exception
-    
-    user = crud_user.get_user_by_email(db, email=email)
+        raise _credentials_exception()
+    return payload
+
+def _cache_principal(token: str, payload: dict, user, epoch: int) -> User:
     if user is None:
-        raise credentials_exception
-    return user
+        raise _credentials_exception()
+    principal = User.model_validate(user)
+    principal_cache.put(token, principal, epoch=epoch, token_expires_at=payload.get("exp"))
+    return principal
+
+def get_current_user(
+    db: Session = Depends(get_read_db), token: str = Depends(oauth2_scheme)
+) -> User:
+    """Resolve the bearer token to a User principal, served from principal_cache when warm."""
+    principal = principal_cache.get(token)
+    if principal is not None:
+        return principal
+    epoch = principal_cache.epoch
+    payload = _decode_token(token)
+    user = crud_user.get_user_by_email(db, email=payload["sub"])
+    return _cache_principal(token, payload, user, epoch)
+
+async def get_current_user_async(
+    db: AsyncSession = Depends(get_async_db), token: str = Depends(oauth2_scheme)
+) -> User:
+    """Same as get_current_user, for `async def` routes on the async session."""
+    principal = principal_cache.get(token)
+    if principal is not None:
+        return principal
+    epoch = principal_cache.epoch
+    payload = _decode_token(token)
+    user = await aio_crud_user.get_user_by_email(db, email=payload["sub"])
+    return _cache_principal(token, payload, user, epoch)
 
 class RoleChecker:
     def __init__(self, allowed_roles: list[str]):
@@ -43,3 +73,72 @@ class RoleChecker:
                 detail="Not enough permissions"
             )
         return user
+
+# Shared instance so FastAPI's per-request dependency cache resolves it once
+require_admin = RoleChecker(["admin"])
+
+def get_cursor(cursor: str | None = None) -> pagination.Position | None:
+    """Decode the opaque ``?cursor=`` of a keyset-paginated list (from X-Next-Cursor)."""
+    if cursor is None:
+        return None
+    try:
+        return pagination.decode_cursor(cursor)
+    except pagination.InvalidCursorError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+def get_since_cursor(since: str | None = None) -> int | None:
+    """Decode ``?since=`` (an X-Latest-Cursor), for fetching only newer notifications."""
+    if since is None:
+        return None
+    try:
+        return pagination.decode_seq_cursor(since)
+    except pagination.InvalidCursorError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+def get_rank_cursor(cursor: str | None = None) -> tuple[float, int] | None:
+    """Decode the ``?cursor=`` of a ranked search listing."""
+    if cursor is None:
+        return None
+    try:
+        return pagination.decode_rank_cursor(cursor)
+    except pagination.InvalidCursorError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """If-None-Match uses the weak comparison: W/ prefixes are ignored on both sides."""
+    if not if_none_match:
+        return False
+    tags = [t.strip().removeprefix("W/") for t in if_none_match.split(",")]
+    return "*" in tags or etag.removeprefix("W/") in tags
+
+class CollectionETag:
+    """Conditional GET for one of the current user's lists (src.app.db.versions).
+
+    Answers 304 before the route runs when If-None-Match names the current
+    version. Otherwise it sets ETag/Cache-Control on the response and returns
+    them, for routes that build their own Response.
+    """
+    def __init__(self, collection: str):
+        self.collection = collection
+
+    def __call__(
+        self,
+        request: Request,
+        response: Response,
+        db: Session = Depends(get_read_db),
+        user: User = Depends(get_current_user),
+    ) -> dict:
+        version = versions.get_version(db, user.id, self.collection)
+        headers = {
+            "ETag": versions.etag(self.collection, version, user.id, request.url.query),
+            "Cache-Control": "private, no-cache",
+        }
+        if etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+            raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        response.headers.update(headers)
+        return headers
+
+ideas_etag = CollectionETag("ideas")
+todos_etag = CollectionETag("todos")
+events_etag = CollectionETag("events")
+notifications_etag = CollectionETag("notifications")
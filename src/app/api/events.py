@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, status
 from sqlalchemy.orm import Session
-from src.app.db.session import get_db
-from src.app.api.deps import get_current_user
+from src.app.db.session import get_db, get_read_db
+from src.app.api.deps import get_current_user, events_etag
 from src.app.schemas.event import Event, EventCreate
 from src.app.crud import event as crud_event
 
@@ -11,9 +11,10 @@ router = APIRouter(prefix="/events", tags=["events"])
 @router.get("", response_model=list[Event])
 def list_events(
     current_user=Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db),
+    _etag=Depends(events_etag),
 ):
-    """List all calendar events for the authenticated user."""
+    """List all calendar events for the authenticated user (304 while If-None-Match is current)."""
     return crud_event.get_events_for_user(db, user_id=current_user.id)
 
 
@@ -1,31 +1,26 @@
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Header, Query, Response, UploadFile, File, Form, status
+from fastapi.responses import FileResponse
 from sqlalchemy.orm import Session
 from typing import Annotated, List, Optional
 from pydantic import Field
-import shutil
+import mimetypes
 import os
-import uuid
+import time
+from pathlib import Path
 
-from src.app.api import deps
-from src.app.db.session import get_db
+from src.app.api import deps, serializers
+from src.app.core import pagination, storage
+from src.app.core.config import settings
+from src.app.db import search
+from src.app.db.session import get_db, get_read_db, get_session_factory
 from src.app.models.user import User
-from src.app.schemas.idea import IdeaPublic, IdeaCreate
+from src.app.schemas.idea import IdeaPublic, IdeaCreate, IdeaSearchHit, IdeaFacets
 from src.app.crud import idea as crud_idea
-from src.app.crud import notification as crud_notif
-from src.app.crud import user as crud_user
-from src.app.schemas.notification import NotificationCreate
+from src.app.crud import tag as crud_tag
+from src.app.tasks import notifications
 
 router = APIRouter(prefix="/ideas", tags=["ideas"])
 
-UPLOAD_DIR = "uploads"
-
-def _to_public(idea) -> dict:
-    """Map Idea ORM object → IdeaPublic-compatible dict with author/reviewer."""
-    d = {c.name: getattr(idea, c.name) for c in idea.__table__.columns}
-    d["author"] = idea.owner
-    d["reviewer"] = idea.reviewer
-    return d
-
 @router.post("", response_model=IdeaPublic, status_code=status.HTTP_201_CREATED)
 def create_idea(
     title: Annotated[str, Form(min_length=3, max_length=100)],
@@ -35,56 +30,144 @@ def create_idea(
     problem_statement: Annotated[Optional[str], Form()] = None,
     solution: Annotated[Optional[str], Form()] = None,
     attachment: Optional[UploadFile] = File(None),
+    background_tasks: BackgroundTasks = None,
     db: Session = Depends(get_db),
+    session_factory = Depends(get_session_factory),
     current_user: User = Depends(deps.get_current_user)
 ):
-    file_path = None
+    # Sync route, so this streams to the store on a threadpool thread, not the event loop
+    stored = None
     if attachment and attachment.filename:
-        file_ext = os.path.splitext(attachment.filename)[1]
-        file_name = f"{uuid.uuid4()}{file_ext}"
-        file_path = os.path.join(UPLOAD_DIR, file_name)
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(attachment.file, buffer)
+        max_bytes = settings.upload_max_bytes
+        try:
+            if attachment.size is not None:
+                storage.check_size(attachment.size, max_bytes)  # known up front: skip the copy
+            stored = storage.store(attachment.file, max_bytes)
+        except storage.UploadTooLargeError:
+            raise HTTPException(status_code=413, detail=f"Attachment exceeds {max_bytes} bytes")
 
     idea_in = IdeaCreate(
         title=title, description=description, category=category,
         tags=tags, problem_statement=problem_statement, solution=solution
     )
-    db_idea = crud_idea.create_idea(db, idea_in, user_id=current_user.id, file_path=file_path)
+    db_idea = crud_idea.create_idea(
+        db, idea_in, user_id=current_user.id,
+        attachment=stored, attachment_name=os.path.basename(attachment.filename) if stored else None,
+    )
     
-    # Notify all admins about the new idea submission
-    admins = crud_user.get_users_by_role(db, role="admin")
-    for admin in admins:
-        crud_notif.create_notification(db, NotificationCreate(
-            user_id=admin.id,
-            message=f"New idea submitted: '{db_idea.title}' by {current_user.email}",
-            type="new_idea"
-        ))
-        
-    return IdeaPublic.model_validate({**{c.name: getattr(db_idea, c.name) for c in db_idea.__table__.columns}, "author": db_idea.owner, "reviewer": db_idea.reviewer})
+    # Notify all admins once the response is out (one bulk insert, retried on failure)
+    background_tasks.add_task(
+        notifications.fan_out_to_role, session_factory, "admin",
+        message=f"New idea submitted: '{db_idea.title}' by {current_user.email}",
+        type="new_idea", queued_at=time.monotonic(),
+    )
+    return serializers.idea_from_orm(db_idea)
 
 @router.get("", response_model=List[IdeaPublic])
 def read_ideas(
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db),
+    tag: Optional[str] = None,
+    after: Optional[pagination.Position] = Depends(deps.get_cursor),
+    db: Session = Depends(get_read_db),
+    current_user: User = Depends(deps.get_current_user),
+    etag_headers: dict = Depends(deps.ideas_etag),
+):
+    """Newest first, optionally only ideas tagged ``tag`` (any case).
+
+    Pass the X-Next-Cursor response header back as ?cursor= for the next page.
+    Send the ETag back as If-None-Match to get a 304 while the list is unchanged.
+    """
+    rows = crud_idea.get_user_idea_rows(db, user_id=current_user.id, skip=skip, limit=limit + 1, after=after, tag=tag)
+    rows, next_cursor = pagination.split_page(rows, limit)
+    headers = {pagination.NEXT_CURSOR_HEADER: next_cursor, **etag_headers} if next_cursor else etag_headers
+    return serializers.ideas_response(rows, headers=headers)
+
+@router.get("/facets", response_model=IdeaFacets)
+def read_facets(
+    db: Session = Depends(get_read_db),
+    current_user: User = Depends(deps.get_current_user)
+):
+    """Tag, category and status counts. Admins see every idea, others their own."""
+    user_id = None if current_user.role == "admin" else current_user.id
+    return crud_tag.get_facets(db, user_id=user_id)
+
+@router.get("/search", response_model=List[IdeaSearchHit])
+def search_ideas(
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(20, ge=1, le=100),
+    after: Optional[tuple[float, int]] = Depends(deps.get_rank_cursor),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(deps.get_current_user)
 ):
-    ideas = crud_idea.get_user_ideas(db, user_id=current_user.id, skip=skip, limit=limit)
-    return [IdeaPublic.model_validate({**{c.name: getattr(i, c.name) for c in i.__table__.columns}, "author": i.owner, "reviewer": i.reviewer}) for i in ideas]
+    """Full-text search, best match first. Admins search every idea, others only their own.
+
+    Every word must match (the last one as a prefix). Pass X-Next-Cursor back as ?cursor=.
+    """
+    user_id = None if current_user.role == "admin" else current_user.id
+    hits = crud_idea.search_ideas(db, q, user_id=user_id, limit=limit + 1, after=after)
+    headers = None
+    if len(hits) > limit:
+        hits = hits[:limit]
+        headers = {pagination.NEXT_CURSOR_HEADER: pagination.encode_rank_cursor(hits[-1]["rank"], hits[-1]["docid"])}
+    return serializers.search_hits_response(
+        [h["row"] for h in hits], [search.snippet_html(h["snippet"]) for h in hits], headers=headers,
+    )
 
 @router.get("/{idea_id}", response_model=IdeaPublic)
 def read_idea(
     idea_id: str,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
+    current_user: User = Depends(deps.get_current_user)
+):
+    idea = crud_idea.get_idea(db, idea_id)
+    if not idea:
+        raise HTTPException(status_code=404, detail="Idea not found")
+    if idea.user_id != current_user.id and current_user.role != "admin":
+        raise HTTPException(status_code=403, detail="Not enough permissions")
+    return serializers.idea_from_orm(idea)
+
+# Content-addressed files never change under their URL; legacy ones must be revalidated.
+IMMUTABLE = "private, max-age=31536000, immutable"
+REVALIDATE = "private, no-cache"
+
+def _attachment_response(idea, if_none_match: str | None) -> Response:
+    if idea.attachment_sha256:
+        path = storage.blob_path(idea.attachment_sha256)
+        etag, cache_control = f'"{idea.attachment_sha256}"', IMMUTABLE
+    else:  # flat uploads/<uuid>.<ext> from before the content-addressed store
+        path = Path(idea.file_path)
+        etag, cache_control = None, REVALIDATE
+    if not path.is_file():
+        raise HTTPException(status_code=404, detail="Attachment not found")
+    if etag is None:
+        stat = path.stat()
+        etag = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+    # User-supplied bytes served from our origin: never sniff, never run scripts
+    headers = {"ETag": etag, "Cache-Control": cache_control,
+               "X-Content-Type-Options": "nosniff", "Content-Security-Policy": "sandbox"}
+    if deps.etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    name = idea.attachment_name or path.name
+    return FileResponse(path, headers=headers, filename=name, content_disposition_type="inline",
+                        media_type=mimetypes.guess_type(name)[0] or "application/octet-stream")
+
+@router.get("/{idea_id}/attachment", responses={200: {"content": {"application/octet-stream": {}}}, 206: {}, 304: {}})
+def read_attachment(
+    idea_id: str,
+    if_none_match: Annotated[Optional[str], Header()] = None,
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(deps.get_current_user)
 ):
+    """The idea's attachment, for its author and admins. Honours If-None-Match and Range."""
     idea = crud_idea.get_idea(db, idea_id)
     if not idea:
         raise HTTPException(status_code=404, detail="Idea not found")
     if idea.user_id != current_user.id and current_user.role != "admin":
         raise HTTPException(status_code=403, detail="Not enough permissions")
-    return IdeaPublic.model_validate({**{c.name: getattr(idea, c.name) for c in idea.__table__.columns}, "author": idea.owner, "reviewer": idea.reviewer})
+    if not idea.file_path:
+        raise HTTPException(status_code=404, detail="Attachment not found")
+    return _attachment_response(idea, if_none_match)
 
 @router.delete("/{idea_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_idea(
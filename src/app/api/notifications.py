@@ -1,23 +1,103 @@
-from fastapi import APIRouter, Depends, status
+from anyio import from_thread
+from contextlib import suppress
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from typing import List
+from typing import Annotated, List, Optional
 
 from src.app.api import deps
-from src.app.db.session import get_db
+from src.app.core import notification_stream, pagination
+from src.app.core.broker import TooManySubscribersError
+from src.app.core.config import settings
+from src.app.db.session import get_db, get_read_db
 from src.app.models.user import User
-from src.app.schemas.notification import Notification
+from src.app.schemas.notification import Notification, UnreadCount
 from src.app.crud import notification as crud_notif
 
 router = APIRouter(prefix="/notifications", tags=["notifications"])
 
+def _rows(db: Session, user_id: str, limit: int, since: int | None):
+    if since is None:
+        return crud_notif.get_user_notifications(db, user_id=user_id, limit=limit)
+    return crud_notif.get_notifications_since(db, user_id, since, limit=limit)
+
+def _read_notifications(db: Session, token: str, request: Request, response: Response,
+                        limit: int, since: int | None, wait: bool):
+    """Authenticate, check the ETag (or subscribe, to wait) and read, on one worker thread.
+
+    As in _open_stream, the session is released before returning: a long-poll must not
+    hold a pooled connection while it waits.
+    """
+    try:
+        current_user = deps.get_current_user(db, token)
+        if not wait:
+            deps.notifications_etag(request, response, db, current_user)
+            return current_user.id, None, _rows(db, current_user.id, limit, since)
+        # A long-poll waits for a change, so no 304: it would only come straight back
+        subscription = from_thread.run_sync(notification_stream.subscribe, current_user.id)
+        try:
+            return current_user.id, subscription, _rows(db, current_user.id, limit, since)
+        except BaseException:
+            subscription.close()
+            raise
+    finally:
+        db.close()
+
+def _read_since(db: Session, user_id: str, limit: int, since: int):
+    try:
+        return _rows(db, user_id, limit, since)
+    finally:
+        db.close()
+
+def _too_many_streams() -> HTTPException:
+    return HTTPException(status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                         detail="Too many open notification streams",
+                         headers={"Retry-After": str(settings.sse_heartbeat_seconds)})
+
 @router.get("", response_model=List[Notification])
-def get_my_notifications(
+async def get_my_notifications(
+    request: Request,
+    response: Response,
     limit: int = 20,
-    db: Session = Depends(get_db),
+    since: Optional[int] = Depends(deps.get_since_cursor),
+    wait: float = Query(0, ge=0),
+    db: Session = Depends(get_read_db),
+    token: str = Depends(deps.oauth2_scheme),
+):
+    """The newest notifications; with ?since=, only those committed after it, oldest first.
+
+    Pass the X-Latest-Cursor response header back as ?since= to fetch only what is new.
+    With ``wait`` (seconds, capped at NOTIFICATIONS_MAX_WAIT_SECONDS) as well, an empty
+    answer is held until a notification arrives or the time is up. Otherwise If-None-Match
+    gets a 304 while the list is unchanged.
+    """
+    wait = min(wait, settings.notifications_max_wait_seconds) if since is not None else 0
+    try:
+        user_id, subscription, rows = await run_in_threadpool(
+            _read_notifications, db, token, request, response, limit, since, wait > 0)
+    except TooManySubscribersError:
+        raise _too_many_streams()
+    if subscription is not None:
+        try:
+            if not rows:
+                with suppress(TimeoutError):
+                    await subscription.get(wait)
+                    rows = await run_in_threadpool(_read_since, db, user_id, limit, since)
+        finally:
+            subscription.close()
+
+    latest = max((n.seq for n in rows), default=since or 0)
+    response.headers[pagination.LATEST_CURSOR_HEADER] = pagination.encode_seq_cursor(latest)
+    return rows
+
+@router.get("/unread-count", response_model=UnreadCount)
+def get_unread_count(
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(deps.get_current_user)
 ):
-    """Get notifications for the current user."""
-    return crud_notif.get_user_notifications(db, user_id=current_user.id, limit=limit)
+    """Unread notifications, from the per-user counter that triggers keep current."""
+    return {"unread": crud_notif.get_unread_count(db, user_id=current_user.id)}
 
 @router.patch("/read", status_code=status.HTTP_200_OK)
 def mark_notifications_read(
@@ -27,3 +107,48 @@ def mark_notifications_read(
     """Mark all notifications as read for current user."""
     crud_notif.mark_all_as_read(db, user_id=current_user.id)
     return {"message": "All notifications marked as read."}
+
+def _open_stream(db: Session, token: str, since: int | None):
+    """Authenticate, subscribe and read what was missed, all on one worker thread.
+
+    The session is closed before returning: the stream may stay open for hours, and a
+    connection must never be held while waiting for another thread, or a reconnect storm
+    (every tab at once after a restart, principal cache cold) deadlocks pool against threadpool.
+    """
+    try:
+        current_user = deps.get_current_user(db, token)
+        # Subscribe (on the event loop) before the catch-up read, so nothing written in between is lost
+        subscription = from_thread.run_sync(notification_stream.subscribe, current_user.id)
+        try:
+            if since is None:
+                return subscription, [], True
+            limit = settings.sse_replay_limit
+            rows = crud_notif.get_notifications_since(db, current_user.id, since, limit=limit + 1)
+            return subscription, [notification_stream.frame(n) for n in rows[:limit]], len(rows) <= limit
+        except BaseException:
+            subscription.close()
+            raise
+    finally:
+        db.close()
+
+@router.get("/stream", response_class=StreamingResponse,
+            responses={200: {"content": {"text/event-stream": {}}}, 429: {}})
+async def stream_notifications(
+    last_event_id: Annotated[Optional[str], Header()] = None,
+    db: Session = Depends(get_read_db),
+    token: str = Depends(deps.oauth2_scheme),
+):
+    """Server-Sent Events: one ``notification`` event per new notification, as it is written.
+
+    Reconnect with the last event's id as Last-Event-ID to be sent what was missed first.
+    """
+    since = deps.get_since_cursor(last_event_id)
+    try:
+        subscription, missed, complete = await run_in_threadpool(_open_stream, db, token, since)
+    except TooManySubscribersError:
+        raise _too_many_streams()
+    return StreamingResponse(
+        notification_stream.events(subscription, missed, complete),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,84 @@
+"""
+One serialization path for ideas in API responses.
+
+Lists start from the column-projected rows of ``crud_idea.get_*_idea_rows``.
+Each row becomes an ``IdeaPublic`` via ``model_construct``: the values come
+straight from typed columns, so validating them again would only burn CPU.
+Within one page, every author and reviewer profile is built once and shared.
+A single module-level ``TypeAdapter`` then writes the whole page to JSON bytes.
+Routes return that as a ``Response``, so FastAPI does not validate and
+serialize it a second time. They keep ``response_model`` only for the OpenAPI
+schema.
+
+Single ideas (create, detail, evaluate) are ORM objects and go through
+``idea_from_orm``, which builds the same model without the dict detour.
+"""
+from collections.abc import Mapping, Sequence
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+from src.app.crud.idea import IDEA_FIELDS, PROFILE_FIELDS
+from src.app.schemas.idea import IdeaPublic, IdeaSearchHit
+from src.app.schemas.user import PublicProfile
+
+_idea_list = TypeAdapter(list[IdeaPublic])
+_hit_list = TypeAdapter(list[IdeaSearchHit])
+
+_AUTHOR_KEYS = tuple((f, f"author_{f}") for f in PROFILE_FIELDS)
+_REVIEWER_KEYS = tuple((f, f"reviewer_{f}") for f in PROFILE_FIELDS)
+
+
+class _Profiles:
+    """Per-page cache: one PublicProfile per user id."""
+
+    def __init__(self):
+        self._by_id: dict[str, PublicProfile] = {}
+
+    def get(self, row: Mapping, keys: tuple) -> PublicProfile | None:
+        user_id = row[keys[0][1]]
+        if user_id is None:
+            return None
+        profile = self._by_id.get(user_id)
+        if profile is None:
+            profile = self._by_id[user_id] = PublicProfile.model_construct(
+                **{field: row[key] for field, key in keys}
+            )
+        return profile
+
+
+def ideas_from_rows(rows: Sequence[Mapping], model: type[IdeaPublic] = IdeaPublic, extra: Sequence[dict] = ()) -> list:
+    """Build ``model`` instances from public idea rows; ``extra[i]`` adds fields to row i."""
+    profiles = _Profiles()
+    ideas = []
+    for i, row in enumerate(rows):
+        ideas.append(model.model_construct(
+            **{f: row[f] for f in IDEA_FIELDS},
+            author=profiles.get(row, _AUTHOR_KEYS),
+            reviewer=profiles.get(row, _REVIEWER_KEYS),
+            **(extra[i] if extra else {}),
+        ))
+    return ideas
+
+
+def ideas_response(rows: Sequence[Mapping], headers: dict | None = None) -> Response:
+    return Response(_idea_list.dump_json(ideas_from_rows(rows)), media_type="application/json", headers=headers)
+
+
+def search_hits_response(rows: Sequence[Mapping], snippets: Sequence[str], headers: dict | None = None) -> Response:
+    hits = ideas_from_rows(rows, IdeaSearchHit, [{"snippet": s} for s in snippets])
+    return Response(_hit_list.dump_json(hits), media_type="application/json", headers=headers)
+
+
+def _profile_from_orm(user) -> PublicProfile | None:
+    if user is None:
+        return None
+    return PublicProfile.model_construct(**{f: getattr(user, f) for f in PROFILE_FIELDS})
+
+
+def idea_from_orm(idea) -> IdeaPublic:
+    return IdeaPublic.model_construct(
+        **{f: getattr(idea, f) for f in IDEA_FIELDS},
+        author=_profile_from_orm(idea.owner),
+        reviewer=_profile_from_orm(idea.reviewer),
+    )
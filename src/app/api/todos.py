@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
-from src.app.db.session import get_db
-from src.app.api.deps import get_current_user
+from src.app.db.session import get_db, get_read_db
+from src.app.api.deps import get_current_user, todos_etag
 from src.app.schemas.todo import Todo, TodoCreate, TodoUpdate
 from src.app.crud import todo as crud_todo
 from src.app.crud import notification as crud_notif
@@ -13,9 +13,10 @@ router = APIRouter(prefix="/todos", tags=["todos"])
 @router.get("", response_model=list[Todo])
 def list_todos(
     current_user=Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db),
+    _etag=Depends(todos_etag),
 ):
-    """List all todos for the authenticated user."""
+    """List all todos for the authenticated user (304 while If-None-Match is current)."""
     return crud_todo.get_todos(db, user_id=current_user.id)
 
 
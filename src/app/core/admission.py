@@ -0,0 +1,120 @@
+"""
+Admission control for /api requests: load shedding, then per-client rate limits.
+
+Load shedding protects the process as a whole. When SHED_MAX_IN_FLIGHT
+requests are already running, or the writer queue is deeper than
+SHED_MAX_WRITER_QUEUE (writes only), the request gets 503 with Retry-After
+straight away. Queueing it would only raise latency for everyone.
+
+Rate limiting protects the process from any single client. Each request spends
+a token from its client's bucket for the route class (auth, writes, reads),
+and an empty bucket answers 429 with Retry-After.
+
+This is plain ASGI middleware, so a refused request never reaches routing,
+dependencies or the database.
+"""
+import json
+import math
+
+from jose import JWTError, jwt
+
+from src.app.core import security
+from src.app.core.config import settings
+from src.app.core.metrics import metrics
+from src.app.core.ratelimit import Limit, rate_limiter
+from src.app.db.session import writer_queue_depth
+
+_WRITE_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
+# Long-lived and idle nearly all the time: admitted like any read, but not counted
+# as in flight, or a few hundred open tabs would shed everyone else
+_STREAMS = {"/api/notifications/stream"}
+_LONG_POLLS = {"/api/notifications"}
+
+
+def _long_lived(scope) -> bool:
+    path = scope["path"]
+    return path in _STREAMS or (path in _LONG_POLLS and b"wait=" in scope["query_string"])
+
+_in_flight = metrics.gauge("http.in_flight")
+_shed = metrics.counter("admission.shed")
+metrics.register_collector("rate_limiter", rate_limiter.stats)
+
+
+def route_class(method: str, path: str) -> str:
+    if path.startswith("/api/auth/") and method in _WRITE_METHODS:
+        return "auth"
+    return "writes" if method in _WRITE_METHODS else "reads"
+
+
+def _limit_for(route: str) -> Limit:
+    return Limit(
+        per_minute=getattr(settings, f"rate_limit_{route}_per_minute"),
+        burst=getattr(settings, f"rate_limit_{route}_burst"),
+    )
+
+
+def client_key(scope) -> str:
+    """JWT subject for a valid bearer token, otherwise the client address."""
+    for name, value in scope["headers"]:
+        if name == b"authorization":
+            scheme, _, token = value.decode("latin-1").partition(" ")
+            if scheme.lower() == "bearer" and token:
+                try:
+                    sub = jwt.decode(token, security.SECRET_KEY, algorithms=[security.ALGORITHM]).get("sub")
+                except JWTError:
+                    sub = None
+                if sub:
+                    return f"user:{sub}"
+            break
+    client = scope.get("client")
+    return f"ip:{client[0] if client else 'unknown'}"
+
+
+async def _refuse(send, status: int, detail: str, retry_after: float) -> None:
+    body = json.dumps({"detail": detail}).encode()
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+            (b"retry-after", str(max(1, math.ceil(retry_after))).encode()),
+        ],
+    })
+    await send({"type": "http.response.body", "body": body})
+
+
+class AdmissionMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not scope["path"].startswith("/api/"):
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        route = route_class(method, scope["path"])
+        overloaded = 0 < settings.shed_max_in_flight <= _in_flight.value or (
+            route != "reads" and 0 < settings.shed_max_writer_queue < writer_queue_depth()
+        )
+        if overloaded:
+            _shed.inc()
+            await _refuse(send, 503, "Server is busy, please retry shortly.", settings.shed_retry_after_seconds)
+            return
+
+        if settings.rate_limit_enabled:
+            wait = rate_limiter.acquire(route, client_key(scope), _limit_for(route))
+            if wait:
+                metrics.counter(f"admission.rate_limited.{route}").inc()
+                await _refuse(send, 429, "Too many requests.", wait)
+                return
+
+        if _long_lived(scope):
+            await self.app(scope, receive, send)
+            return
+        _in_flight.inc()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _in_flight.dec()
@@ -0,0 +1,150 @@
+"""
+Static assets: a build step that fingerprints and precompresses them, and the
+handler that serves the result.
+
+``build()`` copies ``static/app.js`` and ``static/style.css`` to
+``static/dist/<name>.<sha256[:12]>.<ext>`` and rewrites ``index.html`` to
+point at those names. It writes a ``.gz`` (and, when the ``brotli`` package
+is installed, a ``.br``) next to every file, plus ``manifest.json``. Files
+from the previous build are kept, so a page loaded just before a deploy can
+still fetch its assets. Anything older is removed.
+
+``PrecompressedStaticFiles`` serves ``static/dist`` when it has a manifest,
+and ``static`` otherwise, which is the case in development. It picks the best
+precompressed variant the client accepts, so no compression happens per
+request. Fingerprinted files are cached as ``immutable``; everything else
+(``index.html``) is revalidated with its ETag.
+
+    uv run python -m src.app.core.assets build
+"""
+import argparse
+import gzip
+import hashlib
+import json
+import mimetypes
+import os
+import re
+import sys
+import time
+from pathlib import Path
+
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Scope
+
+try:
+    import brotli
+except ImportError:  # optional: pip install brotli
+    brotli = None
+
+SOURCE_DIR = Path("static")
+DIST_DIR = SOURCE_DIR / "dist"
+MANIFEST = "manifest.json"
+ENTRY = "index.html"
+FINGERPRINTED = ("app.js", "style.css")
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+REVALIDATE = "no-cache"
+
+_FINGERPRINT = re.compile(r"\.[0-9a-f]{12}\.[a-z0-9]+$")
+# Best first; the suffix of the precompressed sibling for each Content-Encoding
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+
+def _compress(path: Path) -> list[str]:
+    data = path.read_bytes()
+    written = [path.name + ".gz"]
+    # mtime=0 keeps the .gz byte-identical across rebuilds of the same content
+    path.with_name(written[0]).write_bytes(gzip.compress(data, compresslevel=9, mtime=0))
+    if brotli is not None:
+        written.append(path.name + ".br")
+        path.with_name(written[1]).write_bytes(brotli.compress(data, quality=11))
+    return written
+
+
+def _reference(name: str) -> re.Pattern:
+    """``name`` as a src/href value, with or without a ?v= cache-buster."""
+    return re.compile(rf'(?<=["\'/]){re.escape(name)}(\?[^"\']*)?(?=["\'])')
+
+
+def build(source: Path = SOURCE_DIR, dist: Path = DIST_DIR) -> dict:
+    """Fingerprint, rewrite and precompress the assets into ``dist``; returns the manifest."""
+    dist.mkdir(parents=True, exist_ok=True)
+    previous = {}
+    if (dist / MANIFEST).is_file():
+        previous = json.loads((dist / MANIFEST).read_text())
+
+    assets, files = {}, {MANIFEST}
+    for name in FINGERPRINTED:
+        data = (source / name).read_bytes()
+        stem, ext = os.path.splitext(name)
+        hashed = f"{stem}.{hashlib.sha256(data).hexdigest()[:12]}{ext}"
+        (dist / hashed).write_bytes(data)
+        assets[name] = hashed
+        files.update([hashed, *_compress(dist / hashed)])
+
+    html = (source / ENTRY).read_text()
+    for name, hashed in assets.items():
+        html = _reference(name).sub(hashed, html)
+    (dist / ENTRY).write_text(html)
+    files.update([ENTRY, *_compress(dist / ENTRY)])
+
+    manifest = {"assets": assets, "files": sorted(files)}
+    keep = files | set(previous.get("files", ()))
+    for path in dist.iterdir():
+        if path.is_file() and path.name not in keep:
+            path.unlink()
+    (dist / MANIFEST).write_text(json.dumps(manifest, indent=2))
+    return manifest
+
+
+def serving_dir(source: Path = SOURCE_DIR, dist: Path = DIST_DIR) -> str:
+    """The built assets when there are any, else the sources as they are."""
+    return str(dist if (dist / MANIFEST).is_file() else source)
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """StaticFiles that answers with a .br/.gz sibling when the client accepts it."""
+
+    def file_response(self, full_path, stat_result: os.stat_result, scope: Scope, status_code: int = 200) -> Response:
+        request_headers = Headers(scope=scope)
+        accepted = request_headers.get("accept-encoding", "")
+        name = os.path.basename(full_path)
+        headers = {
+            "Cache-Control": IMMUTABLE if _FINGERPRINT.search(name) else REVALIDATE,
+            "Vary": "Accept-Encoding",
+        }
+        path, media_type = full_path, None
+        for encoding, suffix in ENCODINGS:
+            if encoding in accepted and os.path.isfile(f"{full_path}{suffix}"):
+                path, stat_result = f"{full_path}{suffix}", os.stat(f"{full_path}{suffix}")
+                # The type of the content, not of the .gz/.br container
+                media_type = mimetypes.guess_type(full_path)[0] or "text/plain"
+                headers["Content-Encoding"] = encoding
+                break
+        response = FileResponse(path, status_code=status_code, stat_result=stat_result,
+                                headers=headers, media_type=media_type)
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Build fingerprinted, precompressed static assets.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("build", help=f"write {DIST_DIR}")
+    parser.parse_args(argv)
+
+    started = time.perf_counter()
+    manifest = build()
+    for name, hashed in manifest["assets"].items():
+        print(f"  {name} -> {DIST_DIR / hashed}")
+    encodings = "gzip + brotli" if brotli is not None else "gzip (pip install brotli for .br)"
+    print(f"[assets] built {len(manifest['files'])} files with {encodings} "
+          f"in {(time.perf_counter() - started) * 1000:.0f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
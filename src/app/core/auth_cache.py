@@ -0,0 +1,74 @@
+"""
+Cache of verified principals, keyed by a SHA-256 digest of the bearer token.
+
+A hit skips both the JWT decode and the user lookup in get_current_user. The
+crud functions that change what a principal carries (role, password, profile)
+call invalidate_user() after they commit, so changes apply immediately in
+this process. Other workers pick them up when their entry expires, within
+PRINCIPAL_CACHE_TTL_SECONDS at most.
+"""
+import hashlib
+import threading
+import time
+
+from src.app.core.cache import TTLCache
+from src.app.core.config import settings
+from src.app.core.metrics import metrics
+from src.app.schemas.user import User
+
+
+def token_digest(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+class PrincipalCache:
+    def __init__(self, maxsize: int, ttl: float):
+        self._entries = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._digests_by_user: dict[str, set[str]] = {}
+        self._lock = threading.Lock()
+        # Bumped on every invalidation; a lookup that started before one must not be cached
+        self.epoch = 0
+
+    def get(self, token: str) -> User | None:
+        return self._entries.get(token_digest(token))
+
+    def put(self, token: str, principal: User, epoch: int, token_expires_at: float | None = None) -> None:
+        """Cache ``principal`` until the TTL or the token's own ``exp``, whichever is sooner.
+
+        ``epoch`` is the value read before the user was loaded from the database.
+        """
+        ttl = self._entries.ttl
+        if token_expires_at is not None:
+            ttl = min(ttl, token_expires_at - time.time())
+            if ttl <= 0:
+                return
+        digest = token_digest(token)
+        with self._lock:
+            if epoch != self.epoch:
+                return
+            self._entries.set(digest, principal, ttl=ttl)
+            # Drop digests whose entries already expired or were evicted
+            live = {d for d in self._digests_by_user.get(principal.id, ()) if d in self._entries}
+            live.add(digest)
+            self._digests_by_user[principal.id] = live
+
+    def invalidate_user(self, user_id: str) -> None:
+        with self._lock:
+            self.epoch += 1
+            for digest in self._digests_by_user.pop(user_id, ()):
+                self._entries.pop(digest)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.epoch += 1
+            self._digests_by_user.clear()
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        return self._entries.stats()
+
+
+principal_cache = PrincipalCache(
+    maxsize=settings.principal_cache_size, ttl=settings.principal_cache_ttl_seconds
+)
+metrics.register_collector("principal_cache", principal_cache.stats)
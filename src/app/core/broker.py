@@ -0,0 +1,102 @@
+"""
+In-process publish/subscribe for pushing events to open streams.
+
+Each subscriber is an ``asyncio.Queue`` on the event loop that subscribed.
+Publishers can be anywhere: request handlers and background tasks run on
+threadpool threads, so events are handed to the loop with
+``call_soon_threadsafe`` rather than put on the queue directly.
+
+Queues are bounded. A subscriber that falls behind is marked ``overflowed``
+and gets no further events; its stream should end so the client reconnects
+and catches up from the database. Nothing is buffered for channels without
+subscribers, and like the caches in src.app.core.cache, all of this is per
+worker process.
+"""
+import asyncio
+import threading
+from collections import defaultdict
+from typing import Any
+
+
+class TooManySubscribersError(Exception):
+    pass
+
+
+class Subscription:
+    def __init__(self, broker: "Broker", channel: str, queue_size: int):
+        self.broker = broker
+        self.channel = channel
+        self.overflowed = False
+        self._loop = asyncio.get_running_loop()
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+
+    def _deliver(self, event: Any) -> None:
+        # Runs on the subscriber's loop
+        if self.overflowed:
+            return
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.overflowed = True
+            self.broker.overflows += 1
+
+    @property
+    def drained(self) -> bool:
+        """Overflowed, and everything queued before that has been taken."""
+        return self.overflowed and self._queue.empty()
+
+    async def get(self, timeout: float) -> Any:
+        """The next event, or raises TimeoutError after ``timeout`` seconds without one."""
+        return await asyncio.wait_for(self._queue.get(), timeout)
+
+    def close(self) -> None:
+        self.broker._unsubscribe(self)
+
+
+class Broker:
+    def __init__(self):
+        self.published = 0
+        self.overflows = 0
+        self._channels: dict[str, set[Subscription]] = defaultdict(set)
+        self._lock = threading.Lock()
+
+    def subscribe(self, channel: str, queue_size: int, max_per_channel: int = 0) -> Subscription:
+        """Call on the event loop; raises TooManySubscribersError past ``max_per_channel`` (0: no cap)."""
+        subscription = Subscription(self, channel, queue_size)
+        with self._lock:
+            subscribers = self._channels[channel]
+            if 0 < max_per_channel <= len(subscribers):
+                raise TooManySubscribersError(channel)
+            subscribers.add(subscription)
+        return subscription
+
+    def _unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            subscribers = self._channels.get(subscription.channel)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._channels[subscription.channel]
+
+    def publish(self, channel: str, event: Any) -> int:
+        """Queue ``event`` for every current subscriber of ``channel``; returns how many."""
+        with self._lock:
+            subscribers = list(self._channels.get(channel, ()))
+        for subscription in subscribers:
+            try:
+                subscription._loop.call_soon_threadsafe(subscription._deliver, event)
+            except RuntimeError:  # its loop is closed; the stream is gone
+                self._unsubscribe(subscription)
+        self.published += len(subscribers)
+        return len(subscribers)
+
+    def subscriber_count(self, channel: str) -> int:
+        with self._lock:
+            return len(self._channels.get(channel, ()))
+
+    def stats(self) -> dict:
+        with self._lock:
+            channels = len(self._channels)
+            subscribers = sum(len(s) for s in self._channels.values())
+        return {"channels": channels, "subscribers": subscribers,
+                "published": self.published, "overflows": self.overflows}
@@ -0,0 +1,34 @@
+"""
+gzip for JSON API responses.
+
+Starlette's GZipMiddleware, limited to ``/api``: static assets are already
+precompressed on disk (see src.app.core.assets), and attachments keep their
+bytes and strong ETags as stored. Bodies under GZIP_MIN_BYTES go out as they
+are. Responses that already carry a Content-Encoding, event streams and
+partial content are left alone by GZipMiddleware itself.
+"""
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.app.core.config import settings
+
+API_PREFIX = "/api/"
+
+
+def _compressible(path: str) -> bool:
+    return path.startswith(API_PREFIX) and not path.endswith("/attachment")
+
+
+class APIGZipMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self.gzip = GZipMiddleware(app)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and _compressible(scope["path"]):
+            # Read per request, like every other setting
+            self.gzip.minimum_size = settings.gzip_min_bytes
+            self.gzip.compresslevel = settings.gzip_level
+            await self.gzip(scope, receive, send)
+        else:
+            await self.app(scope, receive, send)
@@ -0,0 +1,104 @@
+"""
+Runtime settings read once from ``INNOVAT_*`` environment variables.
+
+Modules read attributes off the shared ``settings`` object at call time, so
+tests can monkeypatch a single value without reloading anything.
+"""
+import os
+
+
+def _env_str(name: str, default: str) -> str:
+    return os.getenv(f"INNOVAT_{name}", default)
+
+
+def _env_int(name: str, default: int) -> int:
+    return int(os.getenv(f"INNOVAT_{name}", default))
+
+
+class Settings:
+    def __init__(self):
+        # SQLite connection profile (applied on every new connection)
+        self.sqlite_journal_mode = _env_str("SQLITE_JOURNAL_MODE", "WAL")
+        self.sqlite_synchronous = _env_str("SQLITE_SYNCHRONOUS", "NORMAL")
+        self.sqlite_busy_timeout_ms = _env_int("SQLITE_BUSY_TIMEOUT_MS", 5000)
+        self.sqlite_cache_size_kib = _env_int("SQLITE_CACHE_SIZE_KIB", 20_000)
+        self.sqlite_mmap_size = _env_int("SQLITE_MMAP_SIZE", 256 * 1024 * 1024)
+
+        # Engine pools. SQLite admits one writer at a time, so the writer pool
+        # stays small; readers never block on it under WAL.
+        self.writer_pool_size = _env_int("WRITER_POOL_SIZE", 2)
+        self.writer_max_overflow = _env_int("WRITER_MAX_OVERFLOW", 2)
+        self.reader_pool_size = _env_int("READER_POOL_SIZE", 8)
+        self.reader_max_overflow = _env_int("READER_MAX_OVERFLOW", 8)
+
+        # Verified-principal cache used by get_current_user
+        self.principal_cache_size = _env_int("PRINCIPAL_CACHE_SIZE", 10_000)
+        self.principal_cache_ttl_seconds = _env_int("PRINCIPAL_CACHE_TTL_SECONDS", 30)
+
+        # Admin dashboard snapshot, shared by all admins and dropped on idea writes
+        self.dashboard_cache_ttl_seconds = _env_int("DASHBOARD_CACHE_TTL_SECONDS", 5)
+
+        # Notification push stream (GET /api/notifications/stream) and long-poll (?wait=)
+        self.sse_heartbeat_seconds = _env_int("SSE_HEARTBEAT_SECONDS", 15)
+        self.sse_max_connections_per_user = _env_int("SSE_MAX_CONNECTIONS_PER_USER", 5)
+        self.sse_queue_size = _env_int("SSE_QUEUE_SIZE", 100)
+        self.sse_replay_limit = _env_int("SSE_REPLAY_LIMIT", 100)
+        self.sse_retry_ms = _env_int("SSE_RETRY_MS", 5000)
+        self.notifications_max_wait_seconds = _env_int("NOTIFICATIONS_MAX_WAIT_SECONDS", 30)
+
+        # gzip for /api responses; smaller bodies aren't worth the CPU or the header
+        self.gzip_min_bytes = _env_int("GZIP_MIN_BYTES", 1000)
+        self.gzip_level = _env_int("GZIP_LEVEL", 6)
+
+        # Password hashing. Changing the rounds re-hashes each user on their next login.
+        # HASH_WORKERS=0 runs hashes on the threadpool instead of a process pool.
+        self.password_hash_rounds = _env_int("PASSWORD_HASH_ROUNDS", 29_000)
+        self.password_hash_workers = _env_int("PASSWORD_HASH_WORKERS", min(4, os.cpu_count() or 1))
+        self.password_hash_max_pending = _env_int("PASSWORD_HASH_MAX_PENDING", 32)
+
+        # Per-client token buckets by route class: sustained requests/minute and burst size.
+        # Clients are keyed by JWT subject when authenticated, else by IP.
+        self.rate_limit_enabled = _env_int("RATE_LIMIT_ENABLED", 1) == 1
+        self.rate_limit_auth_per_minute = _env_int("RATE_LIMIT_AUTH_PER_MINUTE", 20)
+        self.rate_limit_auth_burst = _env_int("RATE_LIMIT_AUTH_BURST", 10)
+        self.rate_limit_writes_per_minute = _env_int("RATE_LIMIT_WRITES_PER_MINUTE", 120)
+        self.rate_limit_writes_burst = _env_int("RATE_LIMIT_WRITES_BURST", 30)
+        self.rate_limit_reads_per_minute = _env_int("RATE_LIMIT_READS_PER_MINUTE", 1200)
+        self.rate_limit_reads_burst = _env_int("RATE_LIMIT_READS_BURST", 200)
+
+        # Load shedding: 503 + Retry-After once either threshold is passed (0 disables it)
+        self.shed_max_in_flight = _env_int("SHED_MAX_IN_FLIGHT", 512)
+        self.shed_max_writer_queue = _env_int("SHED_MAX_WRITER_QUEUE", 64)
+        self.shed_retry_after_seconds = _env_int("SHED_RETRY_AFTER_SECONDS", 1)
+
+        # Startup. Set MIGRATE_ON_STARTUP=0 when `alembic upgrade head` runs as a deploy step.
+        self.migrate_on_startup = _env_int("MIGRATE_ON_STARTUP", 1) == 1
+        self.upload_dir = _env_str("UPLOAD_DIR", "uploads")
+
+        # Attachments: hard cap per file (413 past it) and the streaming chunk size
+        self.upload_max_bytes = _env_int("UPLOAD_MAX_BYTES", 10 * 1024 * 1024)
+        self.upload_chunk_bytes = _env_int("UPLOAD_CHUNK_BYTES", 1024 * 1024)
+        # Room for the other form fields and multipart framing in an upload request's size cap
+        self.upload_form_overhead_bytes = _env_int("UPLOAD_FORM_OVERHEAD_BYTES", 64 * 1024)
+
+        # Background notification fan-out: attempts per batch and the first retry delay (doubles)
+        self.fanout_max_attempts = _env_int("FANOUT_MAX_ATTEMPTS", 3)
+        self.fanout_retry_delay_ms = _env_int("FANOUT_RETRY_DELAY_MS", 200)
+
+        # Orphaned attachment collection: run interval (0 disables), minimum file age, report-only mode
+        self.attachment_gc_interval_seconds = _env_int("ATTACHMENT_GC_INTERVAL_SECONDS", 3600)
+        self.attachment_gc_grace_seconds = _env_int("ATTACHMENT_GC_GRACE_SECONDS", 3600)
+        self.attachment_gc_dry_run = _env_int("ATTACHMENT_GC_DRY_RUN", 0) == 1
+
+        # Notification retention: run interval (0 disables), age of read notifications to drop
+        # (0 keeps them), newest kept per user (0: no cap), rows per delete, pause between deletes,
+        # and where to write a gzipped NDJSON copy of what is dropped (empty: no archive)
+        self.notification_retention_interval_seconds = _env_int("NOTIFICATION_RETENTION_INTERVAL_SECONDS", 3600)
+        self.notification_retention_read_days = _env_int("NOTIFICATION_RETENTION_READ_DAYS", 90)
+        self.notification_retention_max_per_user = _env_int("NOTIFICATION_RETENTION_MAX_PER_USER", 1000)
+        self.notification_retention_batch_size = _env_int("NOTIFICATION_RETENTION_BATCH_SIZE", 500)
+        self.notification_retention_pause_ms = _env_int("NOTIFICATION_RETENTION_PAUSE_MS", 50)
+        self.notification_retention_archive_dir = _env_str("NOTIFICATION_RETENTION_ARCHIVE_DIR", "")
+
+
+settings = Settings()
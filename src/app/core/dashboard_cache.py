@@ -0,0 +1,17 @@
+"""
+Cache of the rendered admin dashboard snapshot (GET /api/admin/dashboard).
+
+Every admin sees the same snapshot, so it is built at most once per
+DASHBOARD_CACHE_TTL_SECONDS, and admins who miss together wait for one build
+(single-flight). The crud functions that change ideas, or a user's role,
+call invalidate() after they commit. That applies in this process
+immediately; other workers catch up when their snapshot expires.
+"""
+from src.app.core.cache import SingleFlightCache
+from src.app.core.config import settings
+from src.app.core.metrics import metrics
+
+SNAPSHOT_KEY = "admin"
+
+dashboard_cache = SingleFlightCache(maxsize=1, ttl=settings.dashboard_cache_ttl_seconds)
+metrics.register_collector("dashboard_cache", dashboard_cache.stats)
@@ -0,0 +1,133 @@
+"""
+Password hashing off the request path.
+
+pbkdf2 is pure CPU work. Run inline in a sync handler, it holds a threadpool
+worker for the whole hash, so a burst of logins starves cheap GETs. Here the
+hashes run in a process pool of PASSWORD_HASH_WORKERS processes, started
+lazily. At most PASSWORD_HASH_MAX_PENDING jobs are queued on or running in the
+pool at once; further callers wait on a semaphore in the event loop, and the
+number waiting is exported as a gauge.
+
+With PASSWORD_HASH_WORKERS=0 the same calls run on the threadpool instead.
+"""
+import asyncio
+import multiprocessing
+import threading
+import time
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from fastapi.concurrency import run_in_threadpool
+
+from src.app.core import security
+from src.app.core.config import settings
+from src.app.core.metrics import metrics
+
+_limits: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+
+_waiting = metrics.gauge("password_hash.waiting")
+_pending = metrics.gauge("password_hash.pending")
+_wait_seconds = metrics.summary("password_hash.wait_seconds")
+_run_seconds = metrics.summary("password_hash.seconds")
+_rehashed = metrics.counter("password_hash.rehashed")
+
+
+class _ProcessPool:
+    """The lazily started process pool, replaced by a fresh one after ``close()``."""
+
+    def __init__(self):
+        self._executor: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    def get(self) -> ProcessPoolExecutor | None:
+        with self._lock:
+            if self._executor is None and settings.password_hash_workers > 0:
+                # spawn, not fork: forking a process that already runs threads can deadlock the child
+                self._executor = ProcessPoolExecutor(
+                    max_workers=settings.password_hash_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._executor
+
+    def close(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+_pool = _ProcessPool()
+
+
+def shutdown() -> None:
+    """Stop the worker processes; the next hash starts a fresh pool."""
+    _pool.close()
+
+
+async def warm_up() -> None:
+    """Start every worker process now rather than on the first logins."""
+    executor = _pool.get()
+    if executor is not None:
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(
+            loop.run_in_executor(executor, time.sleep, 0.05)
+            for _ in range(settings.password_hash_workers)
+        ))
+
+
+def _limit() -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    limit = _limits.get(loop)
+    if limit is None:
+        limit = _limits[loop] = asyncio.Semaphore(settings.password_hash_max_pending)
+    return limit
+
+
+async def _submit(fn, *args):
+    executor = _pool.get()
+    if executor is None:
+        return await run_in_threadpool(fn, *args)
+    try:
+        return await asyncio.wrap_future(executor.submit(fn, *args))
+    except BrokenProcessPool:
+        # A worker died (OOM kill, etc.); replace the pool and retry once
+        shutdown()
+        return await asyncio.wrap_future(_pool.get().submit(fn, *args))
+
+
+async def _run(fn, *args):
+    limit = _limit()
+    queued_at = time.perf_counter()
+    _waiting.inc()
+    try:
+        await limit.acquire()
+    finally:
+        _waiting.dec()
+    started_at = time.perf_counter()
+    _wait_seconds.observe(started_at - queued_at)
+    _pending.inc()
+    try:
+        return await _submit(fn, *args)
+    finally:
+        _pending.dec()
+        limit.release()
+        _run_seconds.observe(time.perf_counter() - started_at)
+
+
+async def hash_password(password: str) -> str:
+    return await _run(security.get_password_hash, password, settings.password_hash_rounds)
+
+
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
+    return await _run(security.verify_password, plain_password, hashed_password)
+
+
+async def verify_and_update_password(plain_password: str, hashed_password: str) -> tuple[bool, str | None]:
+    """Verify a login; the second item is a new hash when the stored cost is outdated."""
+    verified, new_hash = await _run(
+        security.verify_and_update_password, plain_password, hashed_password, settings.password_hash_rounds
+    )
+    if new_hash is not None:
+        _rehashed.inc()
+    return verified, new_hash
@@ -0,0 +1,123 @@
+"""
+In-process metrics registry, served to admins at GET /api/admin/metrics.
+
+Counters, gauges, and summaries that keep a fixed-size reservoir for
+percentiles. Values are per worker process. Components that already keep
+their own stats (caches, pools) register a collector callback instead.
+"""
+import random
+import threading
+from collections.abc import Callable
+
+
+class Counter:
+    def __init__(self):
+        self.value = 0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: int = 1) -> None:
+        with self._lock:
+            self.value += amount
+
+    def snapshot(self) -> int:
+        return self.value
+
+
+class Gauge:
+    """Current value plus its high-water mark."""
+
+    def __init__(self):
+        self.value = 0
+        self.max = 0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: int = 1) -> None:
+        with self._lock:
+            self.value += amount
+            self.max = max(self.max, self.value)
+
+    def dec(self, amount: int = 1) -> None:
+        with self._lock:
+            self.value -= amount
+
+    def set(self, value: int) -> None:
+        with self._lock:
+            self.value = value
+            self.max = max(self.max, value)
+
+    def snapshot(self) -> dict:
+        return {"value": self.value, "max": self.max}
+
+
+class Summary:
+    """Count/sum/max of observations, with p50/p99 from a reservoir sample."""
+
+    def __init__(self, reservoir_size: int = 1024):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self._reservoir: list[float] = []
+        self._size = reservoir_size
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        with self._lock:
+            self.count += 1
+            self.total += value
+            self.max = max(self.max, value)
+            if len(self._reservoir) < self._size:
+                self._reservoir.append(value)
+            else:
+                slot = random.randrange(self.count)
+                if slot < self._size:
+                    self._reservoir[slot] = value
+
+    def percentile(self, q: float) -> float:
+        with self._lock:
+            sample = sorted(self._reservoir)
+        if not sample:
+            return 0.0
+        return sample[min(len(sample) - 1, int(q * len(sample)))]
+
+    def snapshot(self) -> dict:
+        return {
+            "count": self.count,
+            "sum": round(self.total, 6),
+            "max": round(self.max, 6),
+            "p50": round(self.percentile(0.50), 6),
+            "p99": round(self.percentile(0.99), 6),
+        }
+
+
+class Registry:
+    def __init__(self):
+        self._metrics: dict[str, Counter | Gauge | Summary] = {}
+        self._collectors: dict[str, Callable[[], dict]] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, name: str, kind: type):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = kind()
+        return metric
+
+    def counter(self, name: str) -> Counter:
+        return self._get(name, Counter)
+
+    def gauge(self, name: str) -> Gauge:
+        return self._get(name, Gauge)
+
+    def summary(self, name: str) -> Summary:
+        return self._get(name, Summary)
+
+    def register_collector(self, name: str, collect: Callable[[], dict]) -> None:
+        self._collectors[name] = collect
+
+    def snapshot(self) -> dict:
+        data = {name: metric.snapshot() for name, metric in sorted(self._metrics.items())}
+        data.update({name: collect() for name, collect in sorted(self._collectors.items())})
+        return data
+
+
+metrics = Registry()
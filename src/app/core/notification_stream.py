@@ -0,0 +1,86 @@
+"""
+Server-Sent Events for notifications (GET /api/notifications/stream).
+
+The crud functions that write notifications call publish() after they commit.
+Each notification is framed once, as ``id: <seq>`` plus its JSON. The
+frame goes to the ``user:<id>`` channel of the in-process broker, and every
+open stream of that user writes the same bytes. An idle stream costs no
+queries at all, only a comment line every SSE_HEARTBEAT_SECONDS so that
+proxies keep it open.
+
+The event id is the notification's ``seq``, its place in the user's commit
+order (src.app.db.sequences). A client that reconnects sends it back as
+Last-Event-ID and is first sent what it missed, read from the database. The same catch-up ends a stream whose
+queue overflowed, or whose backlog is over SSE_REPLAY_LIMIT. The client
+reconnects and carries on from the last event it received.
+
+The broker is per worker process. With several workers, a stream hears only
+the notifications written by its own worker until it reconnects.
+"""
+from collections.abc import AsyncIterator, Iterable
+
+from src.app.core import pagination
+from src.app.core.broker import Broker, Subscription
+from src.app.core.config import settings
+from src.app.core.metrics import metrics
+from src.app.schemas.notification import Notification
+
+HEARTBEAT = b": keepalive\n\n"
+
+notification_broker = Broker()
+metrics.register_collector("notification_stream", notification_broker.stats)
+
+
+def channel(user_id: str) -> str:
+    return f"user:{user_id}"
+
+
+def _frame(model: Notification) -> tuple[int, bytes]:
+    event_id = pagination.encode_seq_cursor(model.seq)
+    body = f"id: {event_id}\nevent: notification\ndata: {model.model_dump_json()}\n\n".encode()
+    return model.seq, body
+
+
+def frame(notification) -> tuple[int, bytes]:
+    """``notification`` (an ORM row or a dict) as its stream position and SSE frame."""
+    return _frame(Notification.model_validate(notification))
+
+
+def publish(notifications: Iterable) -> None:
+    """Push committed notifications to their users' open streams, in commit order."""
+    models = sorted((Notification.model_validate(n) for n in notifications), key=lambda m: m.seq)
+    for model in models:
+        if notification_broker.subscriber_count(channel(model.user_id)):  # nobody listening: skip the framing
+            notification_broker.publish(channel(model.user_id), _frame(model))
+
+
+def subscribe(user_id: str) -> Subscription:
+    """Open a stream for ``user_id``; raises TooManySubscribersError past the per-user cap."""
+    return notification_broker.subscribe(channel(user_id), queue_size=settings.sse_queue_size,
+                                         max_per_channel=settings.sse_max_connections_per_user)
+
+
+async def events(subscription: Subscription, missed: list, complete: bool = True) -> AsyncIterator[bytes]:
+    """The SSE body: the ``missed`` frames, then live ones, then heartbeats while idle.
+
+    ``complete`` is False when ``missed`` is a truncated backlog; the stream then ends
+    after it, and the client's reconnect picks up the rest.
+    """
+    try:
+        yield f"retry: {settings.sse_retry_ms}\n\n".encode()
+        last = None
+        for last, body in missed:
+            yield body
+        if not complete:
+            return
+        while not subscription.drained:
+            try:
+                position, body = await subscription.get(settings.sse_heartbeat_seconds)
+            except TimeoutError:
+                yield HEARTBEAT
+                continue
+            # Published between subscribing and the catch-up query: already sent
+            if last is None or position > last:
+                yield body
+    finally:
+        subscription.close()
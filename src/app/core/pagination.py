@@ -0,0 +1,107 @@
+"""
+Keyset (cursor) pagination over ``(created_at, id)``, newest first.
+
+A cursor is the position of the last row served, encoded opaquely. The next
+page is the rows strictly after it in ``created_at DESC, id DESC`` order, so
+page N costs the same index seek as page 1. Rows inserted while a client is
+paging never shift later pages. List endpoints return the cursor for the
+next page in the ``X-Next-Cursor`` header; no header means no more rows.
+
+Search results page the same way over ``(rank, docid)`` instead, and sortable
+tables over ``(sort value, id)``. Notifications are fetched forward instead,
+past a per-user sequence number (``encode_seq_cursor``), for clients that only
+want what they have not seen yet.
+"""
+import base64
+from collections.abc import Mapping
+from datetime import datetime
+
+from sqlalchemy import tuple_
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+# Newest notification a client has seen, for fetching only what came after it (?since=)
+LATEST_CURSOR_HEADER = "X-Latest-Cursor"
+
+Position = tuple[datetime, str]
+
+
+class InvalidCursorError(ValueError):
+    pass
+
+
+def _pack(first: str, second: str) -> str:
+    return base64.urlsafe_b64encode(f"{first}|{second}".encode()).decode().rstrip("=")
+
+
+def _unpack(cursor: str) -> tuple[str, str]:
+    raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+    first, second = raw.split("|", 1)
+    return first, second
+
+
+def encode_cursor(created_at: datetime, row_id: str) -> str:
+    return _pack(created_at.isoformat(), row_id)
+
+
+def decode_cursor(cursor: str) -> Position:
+    try:
+        created_at, row_id = _unpack(cursor)
+        return datetime.fromisoformat(created_at), row_id
+    except ValueError as exc:  # bad base64, bad UTF-8, no separator, bad timestamp
+        raise InvalidCursorError(cursor) from exc
+
+
+def encode_seq_cursor(seq: int) -> str:
+    """A notification's place in its user's commit order (src.app.db.sequences), for ?since=."""
+    return str(seq)
+
+
+def decode_seq_cursor(cursor: str) -> int:
+    if not (cursor.isascii() and cursor.isdigit()):
+        raise InvalidCursorError(cursor)
+    return int(cursor)
+
+
+def encode_rank_cursor(rank: float, docid: int) -> str:
+    return _pack(repr(rank), str(docid))
+
+
+def decode_rank_cursor(cursor: str) -> tuple[float, int]:
+    try:
+        rank, docid = _unpack(cursor)
+        return float(rank), int(docid)
+    except ValueError as exc:
+        raise InvalidCursorError(cursor) from exc
+
+
+def encode_sort_cursor(value, row_id: str) -> str:
+    return _pack(row_id, str(value))  # id first: the value (an email, say) may contain the separator
+
+
+def decode_sort_cursor(cursor: str, cast=str) -> tuple:
+    """``(value, id)`` of a sorted-table cursor, with the value passed through ``cast``."""
+    try:
+        row_id, value = _unpack(cursor)
+        return cast(value), row_id
+    except ValueError as exc:
+        raise InvalidCursorError(cursor) from exc
+
+
+def keyset_order(model) -> tuple:
+    return model.created_at.desc(), model.id.desc()
+
+
+def after(model, position: Position):
+    """Rows that come after ``position`` in keyset order."""
+    return tuple_(model.created_at, model.id) < tuple_(*position)
+
+
+def split_page(rows: list, limit: int) -> tuple[list, str | None]:
+    """Split a ``limit + 1`` fetch into the page and the cursor for the next one."""
+    if len(rows) <= limit:
+        return rows, None
+    page = rows[:limit]
+    last = page[-1]
+    if isinstance(last, Mapping):  # a column-projected row
+        return page, encode_cursor(last["created_at"], last["id"])
+    return page, encode_cursor(last.created_at, last.id)
@@ -0,0 +1,54 @@
+"""
+Token-bucket rate limiting, per client and route class.
+
+Each (route class, client key) pair has a bucket that holds up to ``burst``
+tokens and refills at ``per_minute / 60`` tokens per second. A request spends
+one token; with none left it is refused along with the wait until the next
+token arrives. An idle bucket is dropped once it would be full again, so
+forgetting it changes nothing. Buckets live per worker process.
+"""
+import time
+from dataclasses import dataclass
+
+from src.app.core.cache import TTLCache
+
+
+@dataclass(frozen=True)
+class Limit:
+    per_minute: int
+    burst: int
+
+    @property
+    def rate(self) -> float:
+        return self.per_minute / 60
+
+    @property
+    def refill_seconds(self) -> float:
+        return self.burst / self.rate
+
+
+class RateLimiter:
+    def __init__(self, maxsize: int = 100_000):
+        # (tokens, updated_at) per bucket; entries expire once fully refilled
+        self._buckets = TTLCache(maxsize=maxsize, ttl=60)
+
+    def acquire(self, route_class: str, key: str, limit: Limit) -> float:
+        """Spend one token. Returns 0 if allowed, else seconds until a token is available."""
+        now = time.monotonic()
+        bucket_key = (route_class, key)
+        tokens, updated_at = self._buckets.get(bucket_key, (limit.burst, now))
+        tokens = min(limit.burst, tokens + (now - updated_at) * limit.rate)
+        if tokens < 1:
+            self._buckets.set(bucket_key, (tokens, now), ttl=limit.refill_seconds)
+            return (1 - tokens) / limit.rate
+        self._buckets.set(bucket_key, (tokens - 1, now), ttl=limit.refill_seconds)
+        return 0.0
+
+    def clear(self) -> None:
+        self._buckets.clear()
+
+    def stats(self) -> dict:
+        return {"buckets": len(self._buckets)}
+
+
+rate_limiter = RateLimiter()
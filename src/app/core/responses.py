@@ -0,0 +1,44 @@
+"""
+JSON response encoding.
+
+Routes with a ``response_model`` already skip ``jsonable_encoder``. FastAPI
+validates what they return and writes it to bytes with pydantic-core, but
+only while the route's response class is still a ``Default(...)``
+placeholder. That is why the app installs ``FastJSONResponse`` wrapped in
+``Default``. Routes without a model (stats, metrics, summaries) then render
+through it instead of through ``jsonable_encoder`` + ``json.dumps``.
+
+``FastJSONResponse`` uses orjson when it is installed and falls back to
+pydantic-core's ``to_json`` otherwise. Both write datetimes in ISO 8601, as
+the default encoder did. Timezone-aware values end in ``+00:00`` under orjson
+and in ``Z`` under pydantic-core, and clients parse both forms.
+"""
+from typing import Any
+
+import pydantic_core
+from fastapi.datastructures import Default
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # optional: pip install orjson
+    orjson = None
+
+
+def _fallback(value: Any) -> Any:
+    """orjson ``default`` hook for types it does not know (models, Decimal, sets...)."""
+    return pydantic_core.to_jsonable_python(value)
+
+
+def dumps(content: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(content, default=_fallback, option=orjson.OPT_NON_STR_KEYS)
+    return pydantic_core.to_json(content)
+
+
+class FastJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+default_response_class = Default(FastJSONResponse)
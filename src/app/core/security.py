@@ -1,20 +1,39 @@
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Any, Union
 from jose import jwt
 from passlib.context import CryptContext
+from src.app.core.config import settings
 
 # Configuration (In a real app, these would come from env vars)
 SECRET_KEY = "super-secret-key-for-dev-only"
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 
-pwd_context = CryptContext(schemes=["pbkdf2_sha256"], deprecated="auto")
+
+@lru_cache(maxsize=4)
+def crypt_context(rounds: int) -> CryptContext:
+    # min == max == default, so a hash made at any other cost reports needs_update
+    return CryptContext(
+        schemes=["pbkdf2_sha256"],
+        deprecated="auto",
+        pbkdf2_sha256__default_rounds=rounds,
+        pbkdf2_sha256__min_rounds=rounds,
+        pbkdf2_sha256__max_rounds=rounds,
+    )
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+    return crypt_context(settings.password_hash_rounds).verify(plain_password, hashed_password)
+
+def get_password_hash(password: str, rounds: int | None = None) -> str:
+    return crypt_context(rounds or settings.password_hash_rounds).hash(password)
 
-def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
+def verify_and_update_password(
+    plain_password: str, hashed_password: str, rounds: int | None = None
+) -> tuple[bool, str | None]:
+    """Verify, and return a replacement hash when the stored one uses an outdated cost."""
+    return crypt_context(rounds or settings.password_hash_rounds).verify_and_update(plain_password, hashed_password)
 
 def create_access_token(data: dict, expires_delta: Union[timedelta, None] = None) -> str:
     to_encode = data.copy()
@@ -0,0 +1,102 @@
+"""
+Content-addressed attachment store.
+
+Every upload is streamed in ``upload_chunk_bytes`` chunks into a temporary
+file under ``<upload_dir>/.tmp`` and hashed as it goes. The size cap is
+checked per chunk, so the copy of an oversized file stops at the first chunk
+past ``upload_max_bytes``. The request carrying it is bounded earlier, while
+it is received (src.app.core.upload_limit). A finished file is renamed to
+``<upload_dir>/ab/cd/<sha256>``. When that blob is already there, the copy is
+dropped and the upload costs no disk space.
+
+Blobs are shared. The ``attachments`` table (src.app.crud.attachment) counts
+the ideas that reference each blob, and only unreferenced blobs may be
+deleted.
+
+``store`` does blocking file I/O. Call it from a sync route (which runs on the
+threadpool) or through ``run_in_threadpool``, never on the event loop.
+"""
+import hashlib
+import os
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO
+
+from src.app.core.config import settings
+from src.app.core.metrics import metrics
+
+_seconds = metrics.summary("upload.seconds")
+_throughput = metrics.summary("upload.mib_per_second")
+_bytes = metrics.counter("upload.bytes")
+_deduplicated = metrics.counter("upload.deduplicated")
+_rejected = metrics.counter("upload.rejected_too_large")
+
+
+class UploadTooLargeError(Exception):
+    def __init__(self, max_bytes: int):
+        super().__init__(f"upload exceeds {max_bytes} bytes")
+        self.max_bytes = max_bytes
+
+
+@dataclass(frozen=True)
+class StoredBlob:
+    sha256: str
+    size: int
+    path: str            # relative to the working directory, as kept in Idea.file_path
+    deduplicated: bool
+
+
+def check_size(size: int, max_bytes: int) -> None:
+    if size > max_bytes:
+        _rejected.inc()
+        raise UploadTooLargeError(max_bytes)
+
+
+def relative_path(sha256: str) -> str:
+    return os.path.join(settings.upload_dir, sha256[:2], sha256[2:4], sha256)
+
+
+def blob_path(sha256: str) -> Path:
+    return Path(relative_path(sha256))
+
+
+def store(fileobj: BinaryIO, max_bytes: int | None = None) -> StoredBlob:
+    """Stream ``fileobj`` into the store; raises ``UploadTooLargeError`` past ``max_bytes``."""
+    max_bytes = settings.upload_max_bytes if max_bytes is None else max_bytes
+    chunk_size = settings.upload_chunk_bytes
+    tmp_dir = Path(settings.upload_dir) / ".tmp"
+    tmp_dir.mkdir(parents=True, exist_ok=True)
+
+    started = time.perf_counter()
+    digest, size = hashlib.sha256(), 0
+    fd, tmp_name = tempfile.mkstemp(dir=tmp_dir)
+    try:
+        with os.fdopen(fd, "wb") as out:
+            while chunk := fileobj.read(chunk_size):
+                size += len(chunk)
+                check_size(size, max_bytes)
+                digest.update(chunk)
+                out.write(chunk)
+        sha256 = digest.hexdigest()
+        final = blob_path(sha256)
+        deduplicated = final.exists()
+        if deduplicated:
+            os.unlink(tmp_name)
+            os.utime(final)  # fresh mtime: the collector's grace period now covers this upload
+            _deduplicated.inc()
+        else:
+            final.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(tmp_name, final)  # atomic: readers never see a partial blob
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        raise
+
+    elapsed = time.perf_counter() - started
+    _seconds.observe(elapsed)
+    _bytes.inc(size)
+    if elapsed > 0:
+        _throughput.observe(size / 2**20 / elapsed)
+    return StoredBlob(sha256=sha256, size=size, path=relative_path(sha256), deduplicated=deduplicated)
@@ -0,0 +1,60 @@
+"""
+Request size cap for uploads, enforced while the body arrives.
+
+``storage.store`` checks ``upload_max_bytes`` as it copies, but by then
+Starlette's multipart parser has received the whole request and spooled the
+file. This middleware bounds the request itself on the upload routes. A
+Content-Length over the cap is refused with 413 before any of the body is
+read. A body without one (chunked) is counted as it is received and cut off
+at the first message past the cap; the parser then drops what it spooled.
+The cap is ``upload_max_bytes`` plus ``upload_form_overhead_bytes`` for the
+other form fields and the multipart framing.
+"""
+from fastapi import HTTPException
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.app.core.config import settings
+from src.app.core.metrics import metrics
+
+# (method, path) of every route that takes a file
+UPLOAD_ROUTES = {("POST", "/api/ideas")}
+
+_rejected = metrics.counter("upload.rejected_too_large")
+
+
+def _detail() -> str:
+    return f"Attachment exceeds {settings.upload_max_bytes} bytes"
+
+
+class UploadLimitMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or (scope["method"], scope["path"]) not in UPLOAD_ROUTES:
+            await self.app(scope, receive, send)
+            return
+        limit = settings.upload_max_bytes + settings.upload_form_overhead_bytes
+        length = Headers(scope=scope).get("content-length", "")
+        if length.isdigit() and int(length) > limit:
+            _rejected.inc()
+            response = JSONResponse({"detail": _detail()}, status_code=413)
+            await response(scope, receive, send)
+            return
+
+        received = 0
+
+        async def limited_receive() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit:
+                    _rejected.inc()
+                    # FastAPI re-raises an HTTPException from body parsing as is
+                    raise HTTPException(status_code=413, detail=_detail())
+            return message
+
+        await self.app(scope, limited_receive, send)
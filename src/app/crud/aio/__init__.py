@@ -0,0 +1,5 @@
+"""Async mirrors of the ``src.app.crud`` modules for ``async def`` routers.
+
+Each module keeps the same function names and signatures as its sync
+counterpart but takes an ``AsyncSession`` (see ``get_async_db``).
+"""
@@ -0,0 +1,21 @@
+from sqlalchemy import update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.app.core.storage import StoredBlob
+from src.app.models.attachment import Attachment
+
+
+async def add_reference(db: AsyncSession, blob: StoredBlob) -> None:
+    """Count one more idea pointing at ``blob``, in the caller's transaction."""
+    stmt = sqlite_insert(Attachment).values(sha256=blob.sha256, size=blob.size, refcount=1)
+    await db.execute(stmt.on_conflict_do_update(
+        index_elements=["sha256"], set_={"refcount": Attachment.refcount + 1}
+    ))
+
+
+async def release(db: AsyncSession, sha256: str) -> None:
+    """Count one idea fewer, in the caller's transaction. The blob stays until collected."""
+    await db.execute(
+        update(Attachment).where(Attachment.sha256 == sha256, Attachment.refcount > 0)
+        .values(refcount=Attachment.refcount - 1)
+    )
@@ -0,0 +1,19 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.app.models.event import CalendarEvent
+from src.app.schemas.event import EventCreate
+
+
+async def get_events_for_user(db: AsyncSession, user_id: str) -> list[CalendarEvent]:
+    result = await db.execute(
+        select(CalendarEvent).where(CalendarEvent.user_id == user_id).order_by(CalendarEvent.date.asc())
+    )
+    return list(result.scalars().all())
+
+
+async def create_event(db: AsyncSession, user_id: str, data: EventCreate) -> CalendarEvent:
+    event = CalendarEvent(user_id=user_id, title=data.title, date=data.date, color=data.color)
+    db.add(event)
+    await db.commit()
+    await db.refresh(event)
+    return event
@@ -0,0 +1,123 @@
+from datetime import date
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+from src.app.models.idea import Idea
+from src.app.models.stats import UserIdeaStats
+from src.app.schemas.idea import IdeaCreate, IdeaEvaluationItem
+from src.app.core import notification_stream, pagination
+from src.app.core.dashboard_cache import dashboard_cache
+from src.app.db import search
+from src.app.crud.tag import parse_tags
+from src.app.crud.aio import tag as crud_tag
+from src.app.crud.aio import attachment as crud_attachment
+from src.app.crud.aio import notification as crud_notif
+from src.app.core.storage import StoredBlob
+from src.app.crud.idea import (
+    tagged, page, public_rows, stats_from_counters, daily_rollup, admin_stats_from_rollup,
+    plan_evaluations, evaluation_statement, review_notifications,
+)
+
+def _with_people():
+    return select(Idea).options(joinedload(Idea.owner), joinedload(Idea.reviewer))
+
+
+async def create_idea(db: AsyncSession, idea: IdeaCreate, user_id: str, file_path: str = None,
+                      attachment: StoredBlob = None, attachment_name: str = None):
+    db_idea = Idea(
+        **idea.model_dump(),
+        user_id=user_id,
+        file_path=attachment.path if attachment else file_path,
+        attachment_sha256=attachment.sha256 if attachment else None,
+        attachment_name=attachment_name,
+    )
+    db.add(db_idea)
+    await db.flush()
+    await crud_tag.link_tags(db, db_idea.id, parse_tags(db_idea.tags))
+    if attachment:
+        await crud_attachment.add_reference(db, attachment)
+    await db.commit()
+    dashboard_cache.invalidate()
+    # Reload with relationships
+    return await get_idea(db, db_idea.id)
+
+async def get_user_ideas(db: AsyncSession, user_id: str, skip: int = 0, limit: int = 100, after: pagination.Position | None = None, tag: str = None):
+    stmt = _with_people().where(Idea.user_id == user_id)
+    if tag:
+        stmt = stmt.where(tagged(tag))
+    result = await db.execute(page(stmt, skip, limit, after))
+    return list(result.scalars().all())
+
+async def get_user_idea_rows(db: AsyncSession, user_id: str, skip: int = 0, limit: int = 100, after: pagination.Position | None = None, tag: str = None):
+    stmt = public_rows().where(Idea.user_id == user_id)
+    if tag:
+        stmt = stmt.where(tagged(tag))
+    return (await db.execute(page(stmt, skip, limit, after))).mappings().all()
+
+async def get_all_idea_rows(db: AsyncSession, skip: int = 0, limit: int = 100, after: pagination.Position | None = None, tag: str = None):
+    stmt = public_rows().where(tagged(tag)) if tag else public_rows()
+    return (await db.execute(page(stmt, skip, limit, after))).mappings().all()
+
+async def get_idea_rows_by_ids(db: AsyncSession, idea_ids: list[str]) -> dict:
+    rows = (await db.execute(public_rows().where(Idea.id.in_(idea_ids)))).mappings().all()
+    return {row["id"]: row for row in rows}
+
+async def search_ideas(db: AsyncSession, query: str, user_id: str = None, limit: int = 20, after: tuple[float, int] = None) -> list[dict]:
+    match = search.match_expression(query)
+    if match is None:
+        return []
+    hits = (await db.execute(search.hits_statement(match, user_id, after, limit))).all()
+    rows = await get_idea_rows_by_ids(db, [h.id for h in hits])
+    return [{"row": rows[h.id], "rank": h.rank, "docid": h.docid, "snippet": h.snippet} for h in hits]
+
+async def get_idea(db: AsyncSession, idea_id: str):
+    result = await db.execute(_with_people().where(Idea.id == idea_id).execution_options(populate_existing=True))
+    return result.scalars().first()
+
+async def delete_idea(db: AsyncSession, idea_id: str) -> bool:
+    db_idea = await db.get(Idea, idea_id)
+    if db_idea:
+        if db_idea.attachment_sha256:
+            await crud_attachment.release(db, db_idea.attachment_sha256)
+        await db.delete(db_idea)
+        await db.commit()
+        dashboard_cache.invalidate()
+        return True
+    return False
+
+async def get_all_ideas(db: AsyncSession, skip: int = 0, limit: int = 100, after: pagination.Position | None = None, tag: str = None):
+    stmt = _with_people().where(tagged(tag)) if tag else _with_people()
+    result = await db.execute(page(stmt, skip, limit, after))
+    return list(result.scalars().all())
+
+async def evaluate_idea(db: AsyncSession, idea_id: str, status: str, comment: str = None, reviewed_by_id: str = None):
+    db_idea = await get_idea(db, idea_id)
+    if db_idea:
+        db_idea.status = status
+        db_idea.admin_comment = comment
+        if reviewed_by_id:
+            db_idea.reviewed_by_id = reviewed_by_id
+        await db.commit()
+        dashboard_cache.invalidate()
+        # Reload with relationships for reviewer identity
+        return await get_idea(db, idea_id)
+    return db_idea
+
+async def evaluate_ideas(db: AsyncSession, items: list[IdeaEvaluationItem], reviewed_by_id: str) -> list[dict]:
+    found = await db.execute(select(Idea.id, Idea.user_id, Idea.title).where(Idea.id.in_({i.idea_id for i in items})))
+    ideas = {row.id: row for row in found}
+    comments_by_status, applied, results = plan_evaluations(items, ideas)
+    for status, comments in comments_by_status.items():
+        await db.execute(evaluation_statement(status, comments, reviewed_by_id))
+    notes = await crud_notif.create_notifications(db, review_notifications(ideas, applied))
+    await db.commit()
+    dashboard_cache.invalidate()
+    notification_stream.publish(notes)
+    return results
+
+async def get_user_stats(db: AsyncSession, user_id: str) -> dict:
+    return stats_from_counters(await db.get(UserIdeaStats, user_id))
+
+async def get_admin_stats(db: AsyncSession, start: date | None = None, end: date | None = None,
+                          bucket: str = "day") -> dict:
+    return admin_stats_from_rollup(await db.execute(daily_rollup(start, end, bucket)), bucket)
@@ -0,0 +1,57 @@
+import uuid
+from datetime import datetime
+from sqlalchemy import insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.app.core import notification_stream
+from src.app.models.notification import Notification
+from src.app.models.stats import UserNotificationStats
+from src.app.schemas.notification import NotificationCreate
+from src.app.crud.notification import BULK_INSERT_ROWS
+
+async def create_notification(db: AsyncSession, notif: NotificationCreate):
+    db_notif = Notification(**notif.model_dump())
+    db.add(db_notif)
+    await db.commit()
+    await db.refresh(db_notif)
+    notification_stream.publish([db_notif])
+    return db_notif
+
+async def create_notifications(db: AsyncSession, notifs: list[NotificationCreate]) -> list[dict]:
+    """Insert many notifications in the caller's transaction; no commit. See the sync version."""
+    now = datetime.utcnow()
+    rows = [{"id": str(uuid.uuid4()), "created_at": now, "is_read": False, **n.model_dump()} for n in notifs]
+    for start in range(0, len(rows), BULK_INSERT_ROWS):
+        batch = rows[start:start + BULK_INSERT_ROWS]
+        await db.execute(insert(Notification).values(batch))
+        numbered = dict((await db.execute(
+            select(Notification.id, Notification.seq).where(Notification.id.in_([row["id"] for row in batch]))
+        )).all())
+        for row in batch:
+            row["seq"] = numbered[row["id"]]
+    return rows
+
+async def get_user_notifications(db: AsyncSession, user_id: str, limit: int = 20):
+    result = await db.execute(
+        select(Notification).where(Notification.user_id == user_id).order_by(Notification.created_at.desc()).limit(limit)
+    )
+    return list(result.scalars().all())
+
+async def get_notifications_since(db: AsyncSession, user_id: str, since: int, limit: int):
+    result = await db.execute(
+        select(Notification)
+        .where(Notification.user_id == user_id, Notification.seq > since)
+        .order_by(Notification.seq)
+        .limit(limit)
+    )
+    return list(result.scalars().all())
+
+async def get_unread_count(db: AsyncSession, user_id: str) -> int:
+    counters = await db.get(UserNotificationStats, user_id)
+    return counters.unread if counters else 0
+
+async def mark_all_as_read(db: AsyncSession, user_id: str):
+    await db.execute(
+        update(Notification).where(Notification.user_id == user_id, Notification.is_read.is_(False)).values(is_read=True)
+    )
+    await db.commit()
+    return True
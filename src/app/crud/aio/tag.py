@@ -0,0 +1,22 @@
+from sqlalchemy import select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.app.models.tag import Tag, IdeaTag
+from src.app.crud.tag import facets_statement, facets_from_rows
+
+
+async def link_tags(db: AsyncSession, idea_id: str, names: list[str]) -> None:
+    """Attach ``names`` to an idea, creating missing tags, in the caller's transaction."""
+    if not names:
+        return
+    await db.execute(sqlite_insert(Tag).values([{"name": name} for name in names]).on_conflict_do_nothing(index_elements=["name"]))
+    tag_ids = (await db.scalars(select(Tag.id).where(Tag.name.in_(names)))).all()
+    await db.execute(
+        sqlite_insert(IdeaTag).values([{"idea_id": idea_id, "tag_id": tag_id} for tag_id in tag_ids])
+        .on_conflict_do_nothing()
+    )
+
+
+async def get_facets(db: AsyncSession, user_id: str | None = None) -> dict[str, list[dict]]:
+    """Tag, category and status counts over all ideas, or one author's; most common first."""
+    return facets_from_rows(await db.execute(facets_statement(user_id)))
@@ -0,0 +1,46 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.app.models.todo import Todo
+from src.app.schemas.todo import TodoCreate, TodoUpdate
+
+
+async def get_todos(db: AsyncSession, user_id: str) -> list[Todo]:
+    result = await db.execute(select(Todo).where(Todo.user_id == user_id).order_by(Todo.created_at.asc()))
+    return list(result.scalars().all())
+
+
+async def create_todo(db: AsyncSession, user_id: str, data: TodoCreate) -> Todo:
+    todo = Todo(
+        user_id=user_id,
+        title=data.title,
+        description=data.description,
+        date=data.date,
+        start_time=data.start_time,
+        end_time=data.end_time,
+        tags=data.tags,
+        assigned_by=data.assigned_by
+    )
+    db.add(todo)
+    await db.commit()
+    await db.refresh(todo)
+    return todo
+
+
+async def update_todo(db: AsyncSession, todo_id: str, user_id: str, data: TodoUpdate) -> Todo | None:
+    todo = await db.scalar(select(Todo).where(Todo.id == todo_id, Todo.user_id == user_id))
+    if not todo:
+        return None
+    for field, value in data.model_dump(exclude_none=True).items():
+        setattr(todo, field, value)
+    await db.commit()
+    await db.refresh(todo)
+    return todo
+
+
+async def delete_todo(db: AsyncSession, todo_id: str, user_id: str) -> bool:
+    todo = await db.scalar(select(Todo).where(Todo.id == todo_id, Todo.user_id == user_id))
+    if not todo:
+        return False
+    await db.delete(todo)
+    await db.commit()
+    return True
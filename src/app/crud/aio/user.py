@@ -0,0 +1,80 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.app.models.user import User
+from src.app.schemas.user import UserCreate, UserProfile
+from src.app.core import hashing
+from src.app.core.auth_cache import principal_cache
+from src.app.core.dashboard_cache import dashboard_cache
+from src.app.crud.user import users_with_stats, user_stats_page
+
+
+async def get_user_by_email(db: AsyncSession, email: str):
+    return await db.scalar(select(User).where(User.email == email))
+
+
+async def get_user_by_id(db: AsyncSession, user_id: str):
+    return await db.scalar(select(User).where(User.id == user_id))
+
+
+async def get_users_by_role(db: AsyncSession, role: str):
+    result = await db.execute(select(User).where(User.role == role))
+    return list(result.scalars().all())
+
+
+async def create_user(db: AsyncSession, user: UserCreate):
+    hashed_password = await hashing.hash_password(user.password)
+    db_user = User(
+        email=user.email,
+        hashed_password=hashed_password,
+        role="submitter"
+    )
+    db.add(db_user)
+    await db.commit()
+    await db.refresh(db_user)
+    return db_user
+
+
+async def change_password(db: AsyncSession, user: User, new_hashed_password: str) -> User:
+    user.hashed_password = new_hashed_password
+    await db.commit()
+    principal_cache.invalidate_user(user.id)
+    await db.refresh(user)
+    return user
+
+
+async def update_profile(db: AsyncSession, user: User, data: UserProfile) -> User:
+    """Partial update — only overwrites fields that are explicitly provided (non-None)."""
+    update_data = data.model_dump(exclude_none=True)
+    for field, value in update_data.items():
+        setattr(user, field, value)
+    await db.commit()
+    principal_cache.invalidate_user(user.id)
+    await db.refresh(user)
+    return user
+
+
+async def get_users_with_stats(db: AsyncSession, limit: int, sort: str = "email", descending: bool = False,
+                               after: tuple | None = None, email: str | None = None) -> list:
+    return (await db.execute(user_stats_page(limit, sort, descending, after, email))).mappings().all()
+
+
+async def get_user_with_stats(db: AsyncSession, user_id: str):
+    return (await db.execute(users_with_stats().where(User.id == user_id))).mappings().first()
+
+
+async def get_all_users_with_stats(db: AsyncSession) -> list[dict]:
+    """Return all users with their idea stats, ordered by email."""
+    rows = (await db.execute(users_with_stats().order_by(User.email, User.id))).mappings()
+    return [dict(row) for row in rows]
+
+
+async def set_user_role(db: AsyncSession, user_id: str, role: str) -> User | None:
+    user = await db.get(User, user_id)
+    if not user:
+        return None
+    user.role = role
+    await db.commit()
+    dashboard_cache.invalidate()
+    principal_cache.invalidate_user(user.id)
+    await db.refresh(user)
+    return user
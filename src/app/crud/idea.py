@@ -1,28 +1,107 @@
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import func
+from sqlalchemy.orm import Session, aliased, joinedload
+from collections import defaultdict
+from datetime import date
+from sqlalchemy import case, func, select, update
 from src.app.models.idea import Idea
-from src.app.schemas.idea import IdeaCreate
+from src.app.models.stats import UserIdeaStats, IdeaDailyStats
+from src.app.models.tag import Tag, IdeaTag
+from src.app.models.user import User
+from src.app.crud import tag as crud_tag
+from src.app.crud import attachment as crud_attachment
+from src.app.crud import notification as crud_notif
+from src.app.core.storage import StoredBlob
+from src.app.schemas.idea import IdeaCreate, IdeaPublic, IdeaEvaluationItem
+from src.app.schemas.notification import NotificationCreate
+from src.app.schemas.user import PublicProfile
+from src.app.core import notification_stream, pagination
+from src.app.core.dashboard_cache import dashboard_cache
+from src.app.db import search
 
-def create_idea(db: Session, idea: IdeaCreate, user_id: str, file_path: str = None):
+def create_idea(db: Session, idea: IdeaCreate, user_id: str, file_path: str = None,
+                attachment: StoredBlob = None, attachment_name: str = None):
+    """``attachment`` is a blob already in the store; the idea takes a reference to it."""
     db_idea = Idea(
         **idea.model_dump(),
         user_id=user_id,
-        file_path=file_path
+        file_path=attachment.path if attachment else file_path,
+        attachment_sha256=attachment.sha256 if attachment else None,
+        attachment_name=attachment_name,
     )
     db.add(db_idea)
+    db.flush()
+    crud_tag.link_tags(db, db_idea.id, crud_tag.parse_tags(db_idea.tags))
+    if attachment:
+        crud_attachment.add_reference(db, attachment)
     db.commit()
+    dashboard_cache.invalidate()
     db.refresh(db_idea)
     # Reload with relationships
     return db.query(Idea).options(joinedload(Idea.owner), joinedload(Idea.reviewer)).filter(Idea.id == db_idea.id).first()
 
-def get_user_ideas(db: Session, user_id: str, skip: int = 0, limit: int = 100):
+def tagged(tag: str):
+    """Filter for ideas carrying ``tag`` (any case), resolved through ix_idea_tags_tag_id_idea_id."""
+    return Idea.id.in_(select(IdeaTag.idea_id).join(Tag).where(Tag.name == tag.strip().casefold()))
+
+def page(stmt, skip: int, limit: int, after: pagination.Position | None):
+    """Newest first. With ``after`` (a decoded cursor), seek past it instead of offsetting."""
+    stmt = stmt.order_by(*pagination.keyset_order(Idea))
+    if after is not None:
+        stmt = stmt.where(pagination.after(Idea, after))
+    elif skip:
+        stmt = stmt.offset(skip)
+    return stmt.limit(limit)
+
+def _with_people():
+    return select(Idea).options(joinedload(Idea.owner), joinedload(Idea.reviewer))
+
+def get_user_ideas(db: Session, user_id: str, skip: int = 0, limit: int = 100, after: pagination.Position | None = None, tag: str = None):
+    stmt = _with_people().where(Idea.user_id == user_id)
+    if tag:
+        stmt = stmt.where(tagged(tag))
+    return list(db.scalars(page(stmt, skip, limit, after)))
+
+# Column-projected reads for the list endpoints: exactly the IdeaPublic fields,
+# with author/reviewer profile columns joined in as author_<field>/reviewer_<field>.
+# No ORM objects or identity map; see src.app.api.serializers for the other half.
+IDEA_FIELDS = tuple(f for f in IdeaPublic.model_fields if f not in ("author", "reviewer"))
+PROFILE_FIELDS = tuple(PublicProfile.model_fields)
+_Author = aliased(User, name="author")
+_Reviewer = aliased(User, name="reviewer")
+
+def public_rows():
     return (
-        db.query(Idea)
-        .options(joinedload(Idea.owner), joinedload(Idea.reviewer))
-        .filter(Idea.user_id == user_id)
-        .offset(skip).limit(limit).all()
+        select(
+            *(getattr(Idea, f) for f in IDEA_FIELDS),
+            *(getattr(_Author, f).label(f"author_{f}") for f in PROFILE_FIELDS),
+            *(getattr(_Reviewer, f).label(f"reviewer_{f}") for f in PROFILE_FIELDS),
+        )
+        .outerjoin(_Author, _Author.id == Idea.user_id)
+        .outerjoin(_Reviewer, _Reviewer.id == Idea.reviewed_by_id)
     )
 
+def get_user_idea_rows(db: Session, user_id: str, skip: int = 0, limit: int = 100, after: pagination.Position | None = None, tag: str = None):
+    stmt = public_rows().where(Idea.user_id == user_id)
+    if tag:
+        stmt = stmt.where(tagged(tag))
+    return db.execute(page(stmt, skip, limit, after)).mappings().all()
+
+def get_all_idea_rows(db: Session, skip: int = 0, limit: int = 100, after: pagination.Position | None = None, tag: str = None):
+    stmt = public_rows().where(tagged(tag)) if tag else public_rows()
+    return db.execute(page(stmt, skip, limit, after)).mappings().all()
+
+def get_idea_rows_by_ids(db: Session, idea_ids: list[str]) -> dict:
+    rows = db.execute(public_rows().where(Idea.id.in_(idea_ids))).mappings().all()
+    return {row["id"]: row for row in rows}
+
+def search_ideas(db: Session, query: str, user_id: str = None, limit: int = 20, after: tuple[float, int] = None) -> list[dict]:
+    """Ranked full-text hits as {"row", "rank", "docid", "snippet"}; ``row`` is a public idea row."""
+    match = search.match_expression(query)
+    if match is None:
+        return []
+    hits = db.execute(search.hits_statement(match, user_id, after, limit)).all()
+    rows = get_idea_rows_by_ids(db, [h.id for h in hits])
+    return [{"row": rows[h.id], "rank": h.rank, "docid": h.docid, "snippet": h.snippet} for h in hits]
+
 def get_idea(db: Session, idea_id: str):
     return (
         db.query(Idea)
@@ -34,17 +113,17 @@ def get_idea(db: Session, idea_id: str):
 def delete_idea(db: Session, idea_id: str) -> bool:
     db_idea = db.query(Idea).filter(Idea.id == idea_id).first()
     if db_idea:
+        if db_idea.attachment_sha256:
+            crud_attachment.release(db, db_idea.attachment_sha256)
         db.delete(db_idea)
         db.commit()
+        dashboard_cache.invalidate()
         return True
     return False
 
-def get_all_ideas(db: Session, skip: int = 0, limit: int = 100):
-    return (
-        db.query(Idea)
-        .options(joinedload(Idea.owner), joinedload(Idea.reviewer))
-        .offset(skip).limit(limit).all()
-    )
+def get_all_ideas(db: Session, skip: int = 0, limit: int = 100, after: pagination.Position | None = None, tag: str = None):
+    stmt = _with_people().where(tagged(tag)) if tag else _with_people()
+    return list(db.scalars(page(stmt, skip, limit, after)))
 
 def evaluate_idea(db: Session, idea_id: str, status: str, comment: str = None, reviewed_by_id: str = None):
     db_idea = get_idea(db, idea_id)
@@ -54,44 +133,120 @@ def evaluate_idea(db: Session, idea_id: str, status: str, comment: str = None, r
         if reviewed_by_id:
             db_idea.reviewed_by_id = reviewed_by_id
         db.commit()
+        dashboard_cache.invalidate()
         db.refresh(db_idea)
         # Reload with relationships for reviewer identity
         return get_idea(db, idea_id)
     return db_idea
 
-def get_user_stats(db: Session, user_id: str) -> dict:
-    ideas = db.query(Idea).filter(Idea.user_id == user_id).all()
-    total = len(ideas)
-    accepted = sum(1 for i in ideas if i.status == "accepted")
-    rejected = sum(1 for i in ideas if i.status == "rejected")
-    pending = total - accepted - rejected
+def plan_evaluations(items: list[IdeaEvaluationItem], ideas: dict):
+    """Sort a batch against the ``ideas`` found: comments per status to apply, the items
+    applied, and the per-item results. Unknown or repeated ideas are skipped and reported.
+    """
+    comments_by_status: dict[str, dict[str, str | None]] = defaultdict(dict)
+    applied, results = [], []
+    for item in items:
+        error = None
+        if item.idea_id not in ideas:
+            error = "Idea not found"
+        elif any(item.idea_id in comments for comments in comments_by_status.values()):
+            error = "Idea appears more than once in the batch"
+        else:
+            comments_by_status[item.status][item.idea_id] = item.admin_comment
+            applied.append(item)
+        results.append({"idea_id": item.idea_id, "ok": error is None,
+                        "status": item.status if error is None else None, "error": error})
+    return comments_by_status, applied, results
+
+def evaluation_statement(status: str, comments: dict[str, str | None], reviewed_by_id: str):
+    """One UPDATE for every idea given ``status``, each keeping its own comment (CASE on id)."""
+    return (
+        update(Idea).where(Idea.id.in_(comments))
+        .values(status=status, reviewed_by_id=reviewed_by_id, admin_comment=case(comments, value=Idea.id))
+        .execution_options(synchronize_session=False)
+    )
+
+def review_notifications(ideas: dict, applied: list[IdeaEvaluationItem]) -> list[NotificationCreate]:
+    return [
+        NotificationCreate(user_id=ideas[i.idea_id].user_id, type="idea_review",
+                           message=f"Your idea '{ideas[i.idea_id].title}' was reviewed: {i.status}.")
+        for i in applied
+    ]
+
+def evaluate_ideas(db: Session, items: list[IdeaEvaluationItem], reviewed_by_id: str) -> list[dict]:
+    """Apply many evaluations in one transaction and notify each author.
+
+    One UPDATE per distinct status (comments via CASE on id) and one bulk notification
+    insert, whatever the batch size. Unknown or repeated ideas are skipped and reported;
+    returns {"idea_id", "ok", "status", "error"} per item, in input order.
+    """
+    found = db.execute(select(Idea.id, Idea.user_id, Idea.title).where(Idea.id.in_({i.idea_id for i in items})))
+    ideas = {row.id: row for row in found}
+    comments_by_status, applied, results = plan_evaluations(items, ideas)
+    for status, comments in comments_by_status.items():
+        db.execute(evaluation_statement(status, comments, reviewed_by_id))
+    notes = crud_notif.create_notifications(db, review_notifications(ideas, applied))
+    db.commit()
+    dashboard_cache.invalidate()
+    notification_stream.publish(notes)
+    return results
+
+def stats_from_counters(counters: UserIdeaStats | None) -> dict:
+    """API shape of an author's counters; no row yet means no ideas yet."""
+    if counters is None:
+        return {"total": 0, "accepted": 0, "rejected": 0, "pending": 0, "success_rate": 0.0}
+    total, accepted = counters.total, counters.accepted
     success_rate = round(float(accepted / total) * 100, 1) if total else 0.0
-    return {"total": total, "accepted": accepted, "rejected": rejected, "pending": pending, "success_rate": success_rate}
-
-def get_admin_stats(db: Session) -> dict:
-    ideas = db.query(Idea).all()
-    total = len(ideas)
-    accepted = sum(1 for i in ideas if i.status == "accepted")
-    rejected = sum(1 for i in ideas if i.status == "rejected")
-    pending = total - accepted - rejected
-    acceptance_rate = round(float(accepted / total) * 100, 1) if total else 0.0
+    return {"total": total, "accepted": accepted, "rejected": counters.rejected,
+            "pending": counters.pending, "success_rate": success_rate}
 
-    daily_rows = (
-        db.query(
-            func.strftime('%Y-%m-%d', Idea.created_at).label('date'),
-            func.count(Idea.id).label('count')
-        )
-        .group_by(func.strftime('%Y-%m-%d', Idea.created_at))
-        .order_by(func.strftime('%Y-%m-%d', Idea.created_at))
-        .all()
+def get_user_stats(db: Session, user_id: str) -> dict:
+    """One primary-key read of the trigger-maintained counters (src.app.db.aggregates)."""
+    return stats_from_counters(db.get(UserIdeaStats, user_id))
+
+# Bucket label (its first day, 'YYYY-MM-DD') for each rollup day; weeks start on Monday
+STATS_BUCKETS = {
+    "day": IdeaDailyStats.day,
+    "week": func.date(IdeaDailyStats.day, "weekday 0", "-6 days"),
+    "month": func.strftime("%Y-%m-01", IdeaDailyStats.day),
+}
+
+def daily_rollup(start: date | None = None, end: date | None = None, bucket: str = "day"):
+    """Submitted/accepted/rejected per bucket from ``idea_daily_stats``, oldest first.
+
+    ``start``/``end`` are inclusive days; buckets cut by them count only the days in range.
+    """
+    label = STATS_BUCKETS[bucket]
+    submitted = func.sum(IdeaDailyStats.submitted)
+    query = (
+        select(label.label("date"), submitted.label("count"),
+               func.sum(IdeaDailyStats.accepted).label("accepted"),
+               func.sum(IdeaDailyStats.rejected).label("rejected"))
+        .group_by(label).having(submitted > 0).order_by(label)
     )
-    daily_submissions = [{"date": row.date, "count": row.count} for row in daily_rows]
+    if start is not None:
+        query = query.where(IdeaDailyStats.day >= start.isoformat())
+    if end is not None:
+        query = query.where(IdeaDailyStats.day <= end.isoformat())
+    return query
 
+def admin_stats_from_rollup(rows, bucket: str = "day") -> dict:
+    """Totals over the range, summed from its buckets (one row per bucket, never per idea)."""
+    buckets = [{"date": r.date, "count": r.count, "accepted": r.accepted, "rejected": r.rejected} for r in rows]
+    total = sum(b["count"] for b in buckets)
+    accepted = sum(b["accepted"] for b in buckets)
+    rejected = sum(b["rejected"] for b in buckets)
+    acceptance_rate = round(float(accepted / total) * 100, 1) if total else 0.0
     return {
         "total": total,
         "accepted": accepted,
         "rejected": rejected,
-        "pending": pending,
+        "pending": total - accepted - rejected,
         "acceptance_rate": acceptance_rate,
-        "daily_submissions": daily_submissions,
+        "bucket": bucket,
+        "daily_submissions": buckets,
     }
+
+def get_admin_stats(db: Session, start: date | None = None, end: date | None = None, bucket: str = "day") -> dict:
+    """Counts for the ideas submitted between ``start`` and ``end``, read from the daily rollup."""
+    return admin_stats_from_rollup(db.execute(daily_rollup(start, end, bucket)), bucket)
@@ -1,21 +1,60 @@
+import uuid
+from datetime import datetime
+from sqlalchemy import insert, select
 from sqlalchemy.orm import Session
+from src.app.core import notification_stream
 from src.app.models.notification import Notification
+from src.app.models.stats import UserNotificationStats
 from src.app.schemas.notification import NotificationCreate
 
+# Rows per multi-row INSERT: 6 bound parameters each stays under the 999-variable
+# limit of SQLite builds older than 3.32
+BULK_INSERT_ROWS = 150
+
 def create_notification(db: Session, notif: NotificationCreate):
     db_notif = Notification(**notif.model_dump())
     db.add(db_notif)
     db.commit()
     db.refresh(db_notif)
+    notification_stream.publish([db_notif])
     return db_notif
 
+def create_notifications(db: Session, notifs: list[NotificationCreate]) -> list[dict]:
+    """Insert many notifications with multi-row INSERTs in the caller's transaction; no commit.
+
+    Returns the rows written, with the ``seq`` the trigger gave each (src.app.db.sequences);
+    pass them to notification_stream.publish once committed.
+    """
+    now = datetime.utcnow()
+    rows = [{"id": str(uuid.uuid4()), "created_at": now, "is_read": False, **n.model_dump()} for n in notifs]
+    for start in range(0, len(rows), BULK_INSERT_ROWS):
+        batch = rows[start:start + BULK_INSERT_ROWS]
+        db.execute(insert(Notification).values(batch))
+        numbered = dict(db.execute(
+            select(Notification.id, Notification.seq).where(Notification.id.in_([row["id"] for row in batch]))
+        ).all())
+        for row in batch:
+            row["seq"] = numbered[row["id"]]
+    return rows
+
 def get_user_notifications(db: Session, user_id: str, limit: int = 20):
     return db.query(Notification).filter(Notification.user_id == user_id).order_by(Notification.created_at.desc()).limit(limit).all()
 
-def get_unread_count(db: Session, user_id: str):
-    return db.query(Notification).filter(Notification.user_id == user_id, Notification.is_read == False).count()
+def get_notifications_since(db: Session, user_id: str, since: int, limit: int):
+    """Notifications numbered after ``since`` in the user's commit order, oldest first."""
+    return db.scalars(
+        select(Notification)
+        .where(Notification.user_id == user_id, Notification.seq > since)
+        .order_by(Notification.seq)
+        .limit(limit)
+    ).all()
+
+def get_unread_count(db: Session, user_id: str) -> int:
+    """One primary-key read of the trigger-maintained counter (src.app.db.aggregates)."""
+    counters = db.get(UserNotificationStats, user_id)
+    return counters.unread if counters else 0
 
 def mark_all_as_read(db: Session, user_id: str):
-    db.query(Notification).filter(Notification.user_id == user_id, Notification.is_read == False).update({"is_read": True})
+    db.query(Notification).filter(Notification.user_id == user_id, Notification.is_read.is_(False)).update({"is_read": True})
     db.commit()
     return True
@@ -0,0 +1,72 @@
+import json
+from sqlalchemy import select, text
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+from src.app.models.tag import Tag, IdeaTag
+
+MAX_TAGS_PER_IDEA = 20
+MAX_TAG_LENGTH = 50
+
+def parse_tags(raw: str | None) -> list[str]:
+    """Normalise ``Idea.tags`` into distinct, case-folded names, in entry order.
+
+    Accepts the comma-separated form the API takes ("AI, LLM") and the
+    JSON-list form some older rows hold ('["AI","LLM"]').
+    """
+    if not raw or not raw.strip():
+        return []
+    raw = raw.strip()
+    items = None
+    if raw.startswith("["):
+        try:
+            decoded = json.loads(raw)
+            items = [str(item) for item in decoded] if isinstance(decoded, list) else None
+        except ValueError:
+            items = None
+    if items is None:
+        items = raw.strip("[]").split(",")
+    names = (item.strip().strip("\"'#").strip().casefold() for item in items)
+    unique = dict.fromkeys(name[:MAX_TAG_LENGTH] for name in names if name)
+    return list(unique)[:MAX_TAGS_PER_IDEA]
+
+def link_tags(db: Session, idea_id: str, names: list[str]) -> None:
+    """Attach ``names`` to an idea, creating missing tags, in the caller's transaction."""
+    if not names:
+        return
+    db.execute(sqlite_insert(Tag).values([{"name": name} for name in names]).on_conflict_do_nothing(index_elements=["name"]))
+    tag_ids = db.scalars(select(Tag.id).where(Tag.name.in_(names))).all()
+    db.execute(
+        sqlite_insert(IdeaTag).values([{"idea_id": idea_id, "tag_id": tag_id} for tag_id in tag_ids])
+        .on_conflict_do_nothing()
+    )
+
+# All three facets in one statement (one round trip, one read snapshot)
+_FACETS_SQL = """
+SELECT 'tags' AS facet, tags.name AS value, count(*) AS n
+  FROM idea_tags JOIN tags ON tags.id = idea_tags.tag_id
+  JOIN ideas ON ideas.id = idea_tags.idea_id {where}
+  GROUP BY tags.name
+UNION ALL
+SELECT 'categories', category, count(*) FROM ideas {where} GROUP BY category
+UNION ALL
+SELECT 'statuses', coalesce(status, 'submitted'), count(*) FROM ideas {where} GROUP BY coalesce(status, 'submitted')
+"""
+
+def facets_statement(user_id: str | None = None):
+    """``_FACETS_SQL`` over all ideas, or bound to one author's."""
+    if user_id is None:
+        return text(_FACETS_SQL.format(where=""))
+    return text(_FACETS_SQL.format(where="WHERE ideas.user_id = :user_id")).bindparams(user_id=user_id)
+
+def facets_from_rows(rows) -> dict[str, list[dict]]:
+    """Group (facet, value, count) rows by facet, most common first."""
+    facets = {"tags": [], "categories": [], "statuses": []}
+    for facet, value, count in rows:
+        facets[facet].append({"value": value, "count": count})
+    for counts in facets.values():
+        counts.sort(key=lambda c: (-c["count"], c["value"]))
+    return facets
+
+def get_facets(db: Session, user_id: str | None = None) -> dict[str, list[dict]]:
+    """Tag, category and status counts over all ideas, or one author's; most common first."""
+    return facets_from_rows(db.execute(facets_statement(user_id)))
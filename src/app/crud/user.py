@@ -1,8 +1,11 @@
+from sqlalchemy import case, func, select, tuple_
 from sqlalchemy.orm import Session
 from src.app.models.user import User
-from src.app.models.idea import Idea
+from src.app.models.stats import UserIdeaStats
 from src.app.schemas.user import UserCreate, UserProfile
 from src.app.core.security import get_password_hash
+from src.app.core.auth_cache import principal_cache
+from src.app.core.dashboard_cache import dashboard_cache
 
 
 def get_user_by_email(db: Session, email: str):
@@ -33,6 +36,7 @@ def create_user(db: Session, user: UserCreate):
 def change_password(db: Session, user: User, new_hashed_password: str) -> User:
     user.hashed_password = new_hashed_password
     db.commit()
+    principal_cache.invalidate_user(user.id)
     db.refresh(user)
     return user
 
@@ -43,31 +47,61 @@ def update_profile(db: Session, user: User, data: UserProfile) -> User:
     for field, value in update_data.items():
         setattr(user, field, value)
     db.commit()
+    principal_cache.invalidate_user(user.id)
     db.refresh(user)
     return user
 
 
+def _counter(column):
+    return func.coalesce(column, 0)
+
+# Sortable columns of the admin user table; success_rate is computed in SQL so it can be sorted and paged on
+USER_STATS_COLUMNS = {
+    "email": User.email,
+    "total": _counter(UserIdeaStats.total),
+    "accepted": _counter(UserIdeaStats.accepted),
+    "success_rate": case(
+        (UserIdeaStats.total > 0, func.round(UserIdeaStats.accepted * 100.0 / UserIdeaStats.total, 1)), else_=0.0
+    ),
+}
+
+def users_with_stats():
+    """Users LEFT JOIN their maintained idea counters: one row per user, no per-user queries."""
+    return (
+        select(User.id, User.email, User.role, User.is_active,
+               USER_STATS_COLUMNS["total"].label("total"), USER_STATS_COLUMNS["accepted"].label("accepted"),
+               _counter(UserIdeaStats.rejected).label("rejected"), USER_STATS_COLUMNS["success_rate"].label("success_rate"))
+        .outerjoin(UserIdeaStats, UserIdeaStats.user_id == User.id)
+    )
+
+def user_stats_page(limit: int, sort: str = "email", descending: bool = False,
+                    after: tuple | None = None, email: str | None = None):
+    """One page of ``users_with_stats()`` ordered by ``sort`` then id, after the keyset ``after``.
+
+    ``email`` keeps users whose email contains it (case-insensitive).
+    """
+    key, query = USER_STATS_COLUMNS[sort], users_with_stats()
+    if email:
+        query = query.where(User.email.icontains(email, autoescape=True))
+    if after is not None:
+        position = tuple_(key, User.id)
+        query = query.where(position < tuple_(*after) if descending else position > tuple_(*after))
+    order = (key.desc(), User.id.desc()) if descending else (key.asc(), User.id.asc())
+    return query.order_by(*order).limit(limit)
+
+def get_users_with_stats(db: Session, limit: int, sort: str = "email", descending: bool = False,
+                         after: tuple | None = None, email: str | None = None) -> list:
+    """A page of the admin user table as row mappings (id, email, role, is_active, counts, success_rate)."""
+    return db.execute(user_stats_page(limit, sort, descending, after, email)).mappings().all()
+
+def get_user_with_stats(db: Session, user_id: str):
+    """One row of the admin user table, or None."""
+    return db.execute(users_with_stats().where(User.id == user_id)).mappings().first()
+
 def get_all_users_with_stats(db: Session) -> list[dict]:
-    """Return all users with aggregated idea stats for the admin user table."""
-    users = db.query(User).all()
-    result = []
-    for user in users:
-        ideas = db.query(Idea).filter(Idea.user_id == user.id).all()
-        total = len(ideas)
-        accepted = sum(1 for i in ideas if i.status == "accepted")
-        rejected = sum(1 for i in ideas if i.status == "rejected")
-        rate = round((accepted / total * 100), 1) if total > 0 else 0.0
-        result.append({
-            "id": user.id,
-            "email": user.email,
-            "role": user.role,
-            "is_active": user.is_active,
-            "total": total,
-            "accepted": accepted,
-            "rejected": rejected,
-            "success_rate": rate,
-        })
-    return result
+    """Return all users with their idea stats, ordered by email."""
+    rows = db.execute(users_with_stats().order_by(User.email, User.id)).mappings()
+    return [dict(row) for row in rows]
 
 
 def set_user_role(db: Session, user_id: str, role: str) -> User | None:
@@ -76,5 +110,7 @@ def set_user_role(db: Session, user_id: str, role: str) -> User | None:
         return None
     user.role = role
     db.commit()
+    dashboard_cache.invalidate()
+    principal_cache.invalidate_user(user.id)
     db.refresh(user)
     return user
@@ -0,0 +1,169 @@
+"""
+Trigger-maintained aggregates over ``ideas`` and ``notifications``.
+
+  - ``user_idea_stats``: each author's total/accepted/rejected/pending counts
+  - ``idea_daily_stats``: ideas submitted per UTC day (by ``created_at``), and
+    how many of those are accepted/rejected
+  - ``user_notification_stats``: each user's total and unread notifications
+
+Triggers on the source table adjust these on every insert, delete, and change
+to a column an aggregate is keyed or counted on, in the same transaction as
+the write. That covers the crud helpers, bulk UPDATEs (a batch evaluation,
+mark-all-read), and rows added directly through the ORM. Reads cost a
+primary-key lookup or a range scan over days, however many rows there are.
+
+The DDL runs from migrations (0007, 0008, 0010) and from ``create_all``
+(table events, as in src.app.db.search). The reconcile command recomputes
+every counter with one GROUP BY over its source table and reports any drift
+it corrects:
+
+    uv run python -m src.app.db.aggregates reconcile [--dry-run]
+"""
+import argparse
+import sys
+import time
+from dataclasses import dataclass
+
+from sqlalchemy import DDL, event, text
+from sqlalchemy.engine import Connection
+
+_STATUS = "coalesce({row}.status, 'submitted')"
+_ACCEPTED = f"({_STATUS} = 'accepted')"
+_REJECTED = f"({_STATUS} = 'rejected')"
+_PENDING = f"({_STATUS} NOT IN ('accepted', 'rejected'))"
+
+
+@dataclass(frozen=True)
+class Aggregate:
+    """Counters in ``table``, one row per ``key``, summed from ``source``.
+
+    ``key_sql`` and ``flags`` are SQL templates over ``{row}`` (``new``/``old``
+    in a trigger, ``source`` when recomputing); each flag is one source row's
+    contribution to the matching counter. ``watched`` are the source columns
+    whose update can move a row between keys or counters.
+    """
+    table: str
+    key: str
+    key_sql: str
+    counters: tuple[str, ...]
+    flags: tuple[str, ...]
+    watched: tuple[str, ...]
+    source: str = "ideas"
+
+    def _add(self, row: str) -> str:
+        columns = ", ".join(self.counters)
+        values = ", ".join(flag.format(row=row) for flag in self.flags)
+        updates = ", ".join(f"{c} = {c} + excluded.{c}" for c in self.counters)
+        key = self.key_sql.format(row=row)
+        # SELECT ... WHERE rather than VALUES: a row with no key (say, no created_at) counts nowhere
+        return (f"INSERT INTO {self.table} ({self.key}, {columns}) SELECT {key}, {values} WHERE {key} IS NOT NULL "
+                f"ON CONFLICT({self.key}) DO UPDATE SET {updates};")
+
+    def _subtract(self, row: str) -> str:
+        updates = ", ".join(f"{c} = {c} - {flag.format(row=row)}" for c, flag in zip(self.counters, self.flags))
+        return f"UPDATE {self.table} SET {updates} WHERE {self.key} = {self.key_sql.format(row=row)};"
+
+    @property
+    def create_statements(self) -> list[str]:
+        changed = " OR ".join(f"old.{c} IS NOT new.{c}" for c in self.watched)
+        return [
+            f"CREATE TRIGGER IF NOT EXISTS {self.table}_ai AFTER INSERT ON {self.source} BEGIN {self._add('new')} END",
+            f"CREATE TRIGGER IF NOT EXISTS {self.table}_ad AFTER DELETE ON {self.source} "
+            f"BEGIN {self._subtract('old')} END",
+            f"CREATE TRIGGER IF NOT EXISTS {self.table}_au AFTER UPDATE OF {', '.join(self.watched)} ON {self.source} "
+            f"WHEN {changed} BEGIN {self._subtract('old')} {self._add('new')} END",
+        ]
+
+    @property
+    def drop_statements(self) -> list[str]:
+        return [f"DROP TRIGGER IF EXISTS {self.table}_{suffix}" for suffix in ("ai", "ad", "au")]
+
+    @property
+    def actual_sql(self) -> str:
+        key = self.key_sql.format(row=self.source)
+        sums = ", ".join(f"sum({flag.format(row=self.source)}) AS {c}" for c, flag in zip(self.counters, self.flags))
+        return f"SELECT {key} AS {self.key}, {sums} FROM {self.source} WHERE {key} IS NOT NULL GROUP BY {key}"
+
+    def reconcile(self, conn: Connection, dry_run: bool = False) -> list[dict]:
+        """Recompute this table from its source; returns the rows that had drifted.
+
+        Each drift entry is {"table", "key", "stored": {...}, "actual": {...}},
+        with zeros for a side that has no row. Unless ``dry_run``, the table is
+        rewritten to match.
+        """
+        zero = dict.fromkeys(self.counters, 0)
+
+        def by_key(result):
+            return {row._mapping[self.key]: {c: row._mapping[c] for c in self.counters} for row in result}
+
+        actual = by_key(conn.execute(text(self.actual_sql)))
+        stored = by_key(conn.execute(text(f"SELECT {self.key}, {', '.join(self.counters)} FROM {self.table}")))
+        drift = [
+            {"table": self.table, "key": key, "stored": stored.get(key, zero), "actual": actual.get(key, zero)}
+            for key in sorted(actual.keys() | stored.keys())
+            if stored.get(key, zero) != actual.get(key, zero)
+        ]
+        if drift and not dry_run:
+            conn.execute(text(f"DELETE FROM {self.table}"))
+            conn.execute(text(f"INSERT INTO {self.table} ({self.key}, {', '.join(self.counters)}) {self.actual_sql}"))
+        return drift
+
+
+USER_STATS = Aggregate(
+    table="user_idea_stats", key="user_id", key_sql="{row}.user_id",
+    counters=("total", "accepted", "rejected", "pending"), flags=("1", _ACCEPTED, _REJECTED, _PENDING),
+    watched=("status", "user_id"),
+)
+DAILY_STATS = Aggregate(
+    table="idea_daily_stats", key="day", key_sql="strftime('%Y-%m-%d', {row}.created_at)",
+    counters=("submitted", "accepted", "rejected"), flags=("1", _ACCEPTED, _REJECTED),
+    watched=("status", "created_at"),
+)
+NOTIFICATION_STATS = Aggregate(
+    table="user_notification_stats", key="user_id", key_sql="{row}.user_id",
+    counters=("total", "unread"), flags=("1", "(coalesce({row}.is_read, 0) = 0)"),
+    watched=("is_read", "user_id"), source="notifications",
+)
+AGGREGATES = (USER_STATS, DAILY_STATS, NOTIFICATION_STATS)
+
+CREATE_STATEMENTS = [s for aggregate in AGGREGATES for s in aggregate.create_statements]
+DROP_STATEMENTS = [s for aggregate in AGGREGATES for s in aggregate.drop_statements]
+
+
+def attach_to(table) -> None:
+    """Create/drop the triggers of the aggregates over ``table`` in create_all/drop_all."""
+    for aggregate in AGGREGATES:
+        if aggregate.source != table.name:
+            continue
+        for statement in aggregate.create_statements:
+            # DDL %-formats its text; the strftime patterns must survive that
+            event.listen(table, "after_create", DDL(statement.replace("%", "%%")).execute_if(dialect="sqlite"))
+        for statement in aggregate.drop_statements:
+            event.listen(table, "before_drop", DDL(statement).execute_if(dialect="sqlite"))
+
+
+def reconcile(conn: Connection, dry_run: bool = False) -> list[dict]:
+    """Reconcile every aggregate table; returns the drift found in all of them."""
+    return [entry for aggregate in AGGREGATES for entry in aggregate.reconcile(conn, dry_run=dry_run)]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Maintenance for the trigger-maintained aggregates.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    reconcile_cmd = sub.add_parser("reconcile", help="recompute the aggregate tables from their sources")
+    reconcile_cmd.add_argument("--dry-run", action="store_true", help="report drift without fixing it")
+    args = parser.parse_args(argv)
+    from src.app.db.session import engine
+
+    started = time.perf_counter()
+    with engine.begin() as conn:
+        drift = reconcile(conn, dry_run=args.dry_run)
+    for entry in drift:
+        print(f"  {entry['table']} {entry['key']}: stored {entry['stored']} actual {entry['actual']}")
+    verb = "found" if args.dry_run else "fixed"
+    print(f"[aggregates] {verb} drift in {len(drift)} rows in {(time.perf_counter() - started) * 1000:.0f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
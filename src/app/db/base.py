@@ -0,0 +1,12 @@
+# Import every model so Base.metadata is complete for Alembic and schema checks.
+from src.app.db.session import Base  # noqa: F401
+from src.app.models.user import User  # noqa: F401
+from src.app.models.idea import Idea  # noqa: F401
+from src.app.models.tag import Tag, IdeaTag  # noqa: F401
+from src.app.models.attachment import Attachment  # noqa: F401
+from src.app.models.stats import UserIdeaStats, IdeaDailyStats, UserNotificationStats  # noqa: F401
+from src.app.models.version import CollectionVersion  # noqa: F401
+from src.app.models.sequence import NotificationSequence  # noqa: F401
+from src.app.models.todo import Todo  # noqa: F401
+from src.app.models.event import CalendarEvent  # noqa: F401
+from src.app.models.notification import Notification  # noqa: F401
@@ -0,0 +1,55 @@
+"""
+Index helpers shared by the Alembic migrations and the schema check.
+
+    uv run python -m src.app.db.indexes            # exit 1 if a model index is missing
+"""
+import sys
+import time
+
+from sqlalchemy import MetaData, inspect, text
+from sqlalchemy.engine import Connection, Engine
+
+# One CREATE INDEX per transaction; readers keep going under WAL, and writers
+# only ever wait for a single index build instead of the whole set.
+def create_indexes_in_batches(op, specs: list[tuple[str, str, list[str]]], log=print) -> None:
+    """Build ``(name, table, columns)`` indexes one committed statement at a time."""
+    for name, table, columns in specs:
+        started = time.perf_counter()
+        with op.get_context().autocommit_block():
+            op.execute(text(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({', '.join(columns)})"))
+        log(f"  built {name} in {(time.perf_counter() - started) * 1000:.0f} ms")
+    with op.get_context().autocommit_block():
+        op.execute(text("ANALYZE"))  # refresh planner statistics for the new indexes
+
+
+def missing_indexes(bind: Engine | Connection, metadata: MetaData | None = None) -> list[str]:
+    """Return ``table.index`` names declared on the models but absent from the database."""
+    if metadata is None:
+        from src.app.db.base import Base
+        metadata = Base.metadata
+    inspector = inspect(bind)
+    missing = []
+    for table in metadata.sorted_tables:
+        present = (
+            {ix["name"] for ix in inspector.get_indexes(table.name)}
+            if inspector.has_table(table.name) else set()
+        )
+        missing.extend(f"{table.name}.{ix.name}" for ix in table.indexes if ix.name not in present)
+    return missing
+
+
+def main() -> int:
+    from src.app.db.session import engine
+
+    missing = missing_indexes(engine)
+    for name in missing:
+        print(f"[missing] {name}")
+    if missing:
+        print("Run `uv run alembic upgrade head` to create them.")
+        return 1
+    print("[indexes] all model indexes present")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
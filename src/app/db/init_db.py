@@ -0,0 +1,69 @@
+"""
+Once-per-deployment bootstrap, called from the FastAPI lifespan.
+
+Every worker calls init_db() on startup. An exclusive file lock serialises them.
+The first worker migrates the database to the Alembic head. Later workers see
+the schema is already at head after one SELECT on alembic_version and return.
+"""
+import os
+from contextlib import contextmanager
+from pathlib import Path
+
+from src.app.core.config import settings
+
+ROOT = Path(__file__).resolve().parents[3]
+LOCK_PATH = ROOT / ".startup.lock"
+
+
+@contextmanager
+def _exclusive_lock(path: Path):
+    with open(path, "a+b") as fh:
+        if os.name == "nt":
+            import msvcrt
+            fh.seek(0)
+            msvcrt.locking(fh.fileno(), msvcrt.LK_LOCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(fh.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if os.name == "nt":
+                fh.seek(0)
+                msvcrt.locking(fh.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(fh.fileno(), fcntl.LOCK_UN)
+
+
+def _alembic_config():
+    # Imported lazily: Alembic is only needed by the worker that migrates.
+    from alembic.config import Config
+
+    cfg = Config(str(ROOT / "alembic.ini"))
+    cfg.attributes["configure_logger"] = False  # keep uvicorn's logging setup
+    return cfg
+
+
+def schema_is_current(cfg, engine) -> bool:
+    from alembic.runtime.migration import MigrationContext
+    from alembic.script import ScriptDirectory
+
+    with engine.connect() as conn:
+        current = set(MigrationContext.configure(conn).get_current_heads())
+    return current == set(ScriptDirectory.from_config(cfg).get_heads())
+
+
+def init_db() -> None:
+    os.makedirs(settings.upload_dir, exist_ok=True)
+    if not settings.migrate_on_startup:
+        return
+    from src.app.db import session
+
+    with _exclusive_lock(LOCK_PATH):
+        cfg = _alembic_config()
+        url = session.engine.url.render_as_string(hide_password=False)
+        cfg.set_main_option("sqlalchemy.url", url.replace("%", "%%"))
+        if schema_is_current(cfg, session.engine):
+            return
+        from alembic import command
+        command.upgrade(cfg, "head")
@@ -0,0 +1,157 @@
+"""
+Full-text search over ideas with SQLite FTS5.
+
+``ideas_fts`` is an external-content FTS5 index on ``ideas``. It stores only
+the inverted index, not a second copy of the text. It is keyed by
+``ideas.search_docid``, an explicit INTEGER column, not by the implicit rowid:
+``ideas`` has a string primary key, so ``VACUUM`` may renumber its rowids and
+leave a rowid-keyed index pointing at the wrong rows. The insert trigger gives
+each new idea the next docid (one past the highest in use), then indexes it.
+Triggers keep the index in step with every insert, delete, and update of an
+indexed column, in the same transaction as the write. Status or comment
+updates don't touch it.
+
+The DDL runs in three places: migrations 0004/0012, ``create_all`` (through
+the table events below, so the test database gets it too), and the rebuild
+command. The command repopulates the index from ``ideas``. Run it after
+restoring a database from outside:
+
+    uv run python -m src.app.db.search rebuild
+"""
+import html
+import sys
+import time
+
+from sqlalchemy import DDL, event, text
+from sqlalchemy.engine import Connection
+
+FTS_TABLE = "ideas_fts"
+DOCID = "search_docid"
+COLUMNS = ("title", "description", "problem_statement", "solution", "tags")
+# bm25 column weights, in COLUMNS order: a title or tag hit outranks one in the body
+WEIGHTS = (10.0, 4.0, 2.0, 2.0, 8.0)
+
+_cols = ", ".join(COLUMNS)
+_new = ", ".join(f"new.{c}" for c in COLUMNS)
+_old = ", ".join(f"old.{c}" for c in COLUMNS)
+
+def create_statements(key: str = DOCID) -> list[str]:
+    """The index, its rank weights and its triggers, keyed on the ``ideas`` column ``key``.
+
+    Revision 0004 keyed them on the implicit ``rowid``; its migration (and the
+    downgrade of 0012) pass ``key="rowid"`` to build that schema.
+    """
+    # A new idea takes the next docid before it is indexed; rowid needs no assigning
+    assign = "" if key == "rowid" else (
+        f"UPDATE ideas SET {key} = (SELECT coalesce(max({key}), 0) + 1 FROM ideas) "
+        f"WHERE id = new.id AND {key} IS NULL; "
+    )
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+        f"{_cols}, content='ideas', content_rowid='{key}', tokenize='unicode61 remove_diacritics 2')",
+        # Persist the weights so `ORDER BY rank` uses them without repeating bm25(...)
+        f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rank) VALUES('rank', 'bm25({', '.join(map(str, WEIGHTS))})')",
+        f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON ideas BEGIN {assign}"
+        f"INSERT INTO {FTS_TABLE}(rowid, {_cols}) SELECT {key}, {_cols} FROM ideas WHERE id = new.id; END",
+        f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON ideas BEGIN "
+        f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {_cols}) VALUES ('delete', old.{key}, {_old}); END",
+        f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE OF {_cols} ON ideas BEGIN "
+        f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {_cols}) VALUES ('delete', old.{key}, {_old}); "
+        f"INSERT INTO {FTS_TABLE}(rowid, {_cols}) VALUES (new.{key}, {_new}); END",
+    ]
+
+
+CREATE_STATEMENTS = create_statements()
+
+DROP_STATEMENTS = [
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_ai",
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_ad",
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_au",
+    f"DROP TABLE IF EXISTS {FTS_TABLE}",
+]
+
+
+def is_search_table(name: str) -> bool:
+    """The FTS table and its shadow tables, which the models don't (and can't) declare."""
+    return name == FTS_TABLE or name.startswith(f"{FTS_TABLE}_")
+
+
+def attach_to(table) -> None:
+    """Create/drop the search index alongside ``table`` in create_all/drop_all."""
+    for statement in CREATE_STATEMENTS:
+        event.listen(table, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+    for statement in DROP_STATEMENTS:
+        event.listen(table, "before_drop", DDL(statement).execute_if(dialect="sqlite"))
+
+
+def rebuild(conn: Connection) -> None:
+    """Re-read every idea into the index, then merge its segments."""
+    conn.execute(text(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES('rebuild')"))
+    conn.execute(text(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES('optimize')"))
+
+
+def match_expression(query: str) -> str | None:
+    """Turn free text into an FTS5 query: every word must match, the last as a prefix.
+
+    Words are quoted, so user input can never be parsed as FTS5 syntax
+    (AND/OR/NEAR, column filters, unbalanced quotes).
+    """
+    words = query.split()
+    if not words:
+        return None
+    phrases = ['"' + word.replace('"', '""') + '"' for word in words]
+    phrases[-1] += "*"
+    return " ".join(phrases)
+
+
+# Snippet highlight markers: control characters, so they can't collide with idea text
+_MARK_OPEN, _MARK_CLOSE = "\x02", "\x03"
+
+
+def hits_statement(match: str, user_id: str | None, after: tuple[float, int] | None, limit: int):
+    """Ranked hits as (id, docid, rank, snippet), best first; ``rank`` is bm25, lower is better.
+
+    ``user_id`` restricts to one author's ideas; ``after`` is the (rank, docid)
+    of the last hit already served.
+    """
+    where = [f"{FTS_TABLE} MATCH :match"]
+    params = {"match": match, "limit": limit}
+    if user_id is not None:
+        where.append("ideas.user_id = :user_id")
+        params["user_id"] = user_id
+    if after is not None:
+        where.append(f"({FTS_TABLE}.rank, {FTS_TABLE}.rowid) > (:after_rank, :after_docid)")
+        params["after_rank"], params["after_docid"] = after
+    return text(
+        f"SELECT ideas.id, {FTS_TABLE}.rowid AS docid, {FTS_TABLE}.rank AS rank, "
+        f"snippet({FTS_TABLE}, -1, char(2), char(3), '…', 16) AS snippet "
+        f"FROM {FTS_TABLE} JOIN ideas ON ideas.{DOCID} = {FTS_TABLE}.rowid "
+        f"WHERE {' AND '.join(where)} "
+        f"ORDER BY {FTS_TABLE}.rank, {FTS_TABLE}.rowid LIMIT :limit"
+    ).bindparams(**params)
+
+
+def snippet_html(snippet: str) -> str:
+    """Escape the idea text and turn the match markers into <mark> tags."""
+    return html.escape(snippet).replace(_MARK_OPEN, "<mark>").replace(_MARK_CLOSE, "</mark>")
+
+
+def main(argv: list[str] | None = None) -> int:
+    from src.app.db.session import engine
+
+    args = sys.argv[1:] if argv is None else argv
+    if args != ["rebuild"]:
+        print("usage: python -m src.app.db.search rebuild")
+        return 2
+    started = time.perf_counter()
+    with engine.begin() as conn:
+        for statement in CREATE_STATEMENTS:
+            conn.execute(text(statement))
+        rebuild(conn)
+        count = conn.execute(text("SELECT count(*) FROM ideas")).scalar()
+    print(f"[search] indexed {count} ideas in {(time.perf_counter() - started) * 1000:.0f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,51 @@
+"""
+Per-user sequence numbers for notifications, in commit order.
+
+``created_at`` is read from the clock when a row is built, before its
+transaction commits, and the uuid ``id`` that breaks ties is random. A writer
+that stamped its rows first can commit last, so a client that has already
+fetched past that timestamp would never be sent them. ``?since=`` and the
+long-poll page over ``seq`` instead.
+
+A trigger numbers every inserted notification: it bumps its user's counter in
+``notification_sequences`` and copies the new value into the row's ``seq``, in
+the same transaction. SQLite runs one write transaction at a time, so each
+user's numbers are handed out in commit order: once a reader sees ``seq`` n,
+every row numbered below n is committed too. The counter only goes up, so a
+number is never reused after its row is deleted.
+"""
+from sqlalchemy import DDL, event
+
+SEQUENCES_TABLE = "notification_sequences"
+
+
+def create_statements() -> list[str]:
+    return [
+        f"CREATE TRIGGER IF NOT EXISTS notifications_seq_ai AFTER INSERT ON notifications BEGIN "
+        f"INSERT INTO {SEQUENCES_TABLE} (user_id, last_seq) VALUES (new.user_id, 1) "
+        f"ON CONFLICT(user_id) DO UPDATE SET last_seq = last_seq + 1; "
+        f"UPDATE notifications SET seq = (SELECT last_seq FROM {SEQUENCES_TABLE} WHERE user_id = new.user_id) "
+        f"WHERE id = new.id; END",
+    ]
+
+
+def drop_statements() -> list[str]:
+    return ["DROP TRIGGER IF EXISTS notifications_seq_ai"]
+
+
+def backfill_statements() -> list[str]:
+    """Number existing notifications per user in (created_at, id) order and start each counter there."""
+    return [
+        "UPDATE notifications SET seq = numbered.seq FROM ("
+        "SELECT id, row_number() OVER (PARTITION BY user_id ORDER BY created_at, id) AS seq FROM notifications"
+        ") AS numbered WHERE numbered.id = notifications.id",
+        f"INSERT INTO {SEQUENCES_TABLE} (user_id, last_seq) SELECT user_id, max(seq) FROM notifications GROUP BY user_id",
+    ]
+
+
+def attach_to(table) -> None:
+    """Create/drop the numbering trigger alongside ``notifications`` in create_all/drop_all."""
+    for statement in create_statements():
+        event.listen(table, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+    for statement in drop_statements():
+        event.listen(table, "before_drop", DDL(statement).execute_if(dialect="sqlite"))
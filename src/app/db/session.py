@@ -1,23 +1,110 @@
 from sqlalchemy.orm import DeclarativeBase
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from src.app.core.config import settings
+from src.app.core.metrics import metrics
 
 # SQLite for local dev
 SQLALCHEMY_DATABASE_URL = "sqlite:///./sql_app.db"
+ASYNC_SQLALCHEMY_DATABASE_URL = "sqlite+aiosqlite:///./sql_app.db"
 
-# Synchronous engine for now (simple start)
+
+def sqlite_pragmas(read_only: bool = False) -> list[str]:
+    """Connection profile: WAL so readers never wait on the writer, plus cache tuning."""
+    pragmas = [
+        f"PRAGMA journal_mode={settings.sqlite_journal_mode}",
+        f"PRAGMA synchronous={settings.sqlite_synchronous}",
+        f"PRAGMA busy_timeout={settings.sqlite_busy_timeout_ms}",
+        f"PRAGMA cache_size=-{settings.sqlite_cache_size_kib}",
+        f"PRAGMA mmap_size={settings.sqlite_mmap_size}",
+        "PRAGMA foreign_keys=ON",
+    ]
+    if read_only:
+        pragmas.append("PRAGMA query_only=ON")
+    return pragmas
+
+
+def apply_sqlite_profile(engine, read_only: bool = False) -> None:
+    """Run the pragma profile on every new DBAPI connection of ``engine``."""
+    pragmas = sqlite_pragmas(read_only)
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection, _record):
+        cursor = dbapi_connection.cursor()
+        for pragma in pragmas:
+            cursor.execute(pragma)
+        cursor.close()
+
+
+# Writer engine — every mutation goes through this small pool (SQLite has one writer anyway)
 engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
+    SQLALCHEMY_DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    pool_size=settings.writer_pool_size,
+    max_overflow=settings.writer_max_overflow,
 )
+apply_sqlite_profile(engine)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Read-only engine — GET endpoints. query_only makes an accidental write fail loudly.
+read_engine = create_engine(
+    SQLALCHEMY_DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    pool_size=settings.reader_pool_size,
+    max_overflow=settings.reader_max_overflow,
+)
+apply_sqlite_profile(read_engine, read_only=True)
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
+
+# Async engine over the same database — used by `async def` routers so a slow
+# query never parks a threadpool worker. Pick per router via get_db / get_async_db.
+async_engine = create_async_engine(ASYNC_SQLALCHEMY_DATABASE_URL)
+apply_sqlite_profile(async_engine.sync_engine)
+AsyncSessionLocal = async_sessionmaker(
+    async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+)
+
 class Base(DeclarativeBase):
     pass
 
+# Requests holding a writer session. SQLite serialises writes, so any beyond the
+# writer pool's capacity are effectively queued on the database.
+_writer_sessions = metrics.gauge("db.writer_sessions")
+# Requests holding an aiosqlite session. Those connect through async_engine's own
+# pool, never the writer pool, so they stay out of writer_queue_depth().
+_async_sessions = metrics.gauge("db.async_sessions")
+
+
+def writer_queue_depth() -> int:
+    """Writer sessions open beyond what the writer pool can serve at once."""
+    capacity = settings.writer_pool_size + settings.writer_max_overflow
+    return max(0, _writer_sessions.value - capacity)
+
 def get_db():
     db = SessionLocal()
+    _writer_sessions.inc()
     try:
         yield db
     finally:
+        _writer_sessions.dec()
         db.close()
+
+def get_session_factory():
+    """Writer session factory for work that outlives the request, such as background tasks."""
+    return SessionLocal
+
+def get_read_db():
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+async def get_async_db():
+    _async_sessions.inc()
+    try:
+        async with AsyncSessionLocal() as db:
+            yield db
+    finally:
+        _async_sessions.dec()
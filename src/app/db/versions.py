@@ -0,0 +1,101 @@
+"""
+Per-user version counters behind the list endpoints' ETags.
+
+``collection_versions`` holds one counter per (user, collection). Triggers on
+each collection's table bump the owner's counter on every insert, update and
+delete, in the same transaction as the write. Every crud function moves it,
+and so do bulk statements (the notification fan-out, batch evaluation) and
+rows written directly through the ORM.
+
+A list endpoint reads its counter (one primary-key lookup) before the list.
+When the client's If-None-Match still names that version it answers 304
+without running the list query. A write racing the request can only make the
+body newer than its ETag, which costs the client one extra 200 later, never a
+stale 304.
+
+Idea responses also embed the author's and reviewer's public profile, so a
+profile change on ``users`` bumps the "ideas" counter of everyone whose list
+shows that user: the author of each of their ideas and of each idea they reviewed.
+"""
+import hashlib
+
+from sqlalchemy import DDL, event, select
+from sqlalchemy.orm import Session
+
+from src.app.models.version import CollectionVersion
+
+VERSIONS_TABLE = "collection_versions"
+
+# Collection name -> the table whose rows it lists, keyed by their user_id
+COLLECTIONS = {
+    "ideas": "ideas",
+    "todos": "todos",
+    "events": "calendar_events",
+    "notifications": "notifications",
+}
+
+
+def _bump(row: str, collection: str, when: str = "1") -> str:
+    # INSERT ... SELECT needs a WHERE before ON CONFLICT to parse as an upsert
+    return (f"INSERT INTO {VERSIONS_TABLE} (user_id, collection, version) "
+            f"SELECT {row}.user_id, '{collection}', 1 WHERE {when} "
+            f"ON CONFLICT(user_id, collection) DO UPDATE SET version = version + 1;")
+
+
+def create_statements(collection: str) -> list[str]:
+    table = COLLECTIONS[collection]
+    return [
+        f"CREATE TRIGGER IF NOT EXISTS {table}_version_ai AFTER INSERT ON {table} BEGIN "
+        f"{_bump('new', collection)} END",
+        f"CREATE TRIGGER IF NOT EXISTS {table}_version_ad AFTER DELETE ON {table} BEGIN "
+        f"{_bump('old', collection)} END",
+        # A row handed to another user leaves one list and joins another
+        f"CREATE TRIGGER IF NOT EXISTS {table}_version_au AFTER UPDATE ON {table} BEGIN "
+        f"{_bump('old', collection)} {_bump('new', collection, 'new.user_id IS NOT old.user_id')} END",
+    ]
+
+
+def drop_statements(collection: str) -> list[str]:
+    table = COLLECTIONS[collection]
+    return [f"DROP TRIGGER IF EXISTS {table}_version_{suffix}" for suffix in ("ai", "ad", "au")]
+
+
+# The users columns an idea response embeds (schemas.user.PublicProfile)
+PROFILE_COLUMNS = ("email", "avatar_url", "bio", "github_link", "linkedin_link", "studio_name")
+
+
+def create_profile_statements() -> list[str]:
+    changed = " OR ".join(f"new.{column} IS NOT old.{column}" for column in PROFILE_COLUMNS)
+    return [
+        f"CREATE TRIGGER IF NOT EXISTS users_profile_version_au AFTER UPDATE ON users WHEN {changed} BEGIN "
+        f"INSERT INTO {VERSIONS_TABLE} (user_id, collection, version) "
+        f"SELECT DISTINCT user_id, 'ideas', 1 FROM ideas WHERE user_id = new.id OR reviewed_by_id = new.id "
+        f"ON CONFLICT(user_id, collection) DO UPDATE SET version = version + 1; END",
+    ]
+
+
+def drop_profile_statements() -> list[str]:
+    return ["DROP TRIGGER IF EXISTS users_profile_version_au"]
+
+
+def attach_to(table, collection: str) -> None:
+    """Create/drop ``collection``'s triggers alongside its ``table`` in create_all/drop_all."""
+    create, drop = create_statements(collection), drop_statements(collection)
+    if collection == "ideas":
+        create, drop = create + create_profile_statements(), drop + drop_profile_statements()
+    for statement in create:
+        event.listen(table, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+    for statement in drop:
+        event.listen(table, "before_drop", DDL(statement).execute_if(dialect="sqlite"))
+
+
+def get_version(db: Session, user_id: str, collection: str) -> int:
+    version = db.scalar(select(CollectionVersion.version).where(
+        CollectionVersion.user_id == user_id, CollectionVersion.collection == collection))
+    return version or 0
+
+
+def etag(collection: str, version: int, user_id: str, query: str = "") -> str:
+    """Weak ETag for one user's view of ``collection`` at ``version``, with these query parameters."""
+    variant = hashlib.sha256(f"{user_id}?{query}".encode()).hexdigest()[:16]
+    return f'W/"{collection}-{version}-{variant}"'
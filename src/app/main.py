@@ -1,36 +1,50 @@
+import asyncio
+from contextlib import asynccontextmanager, suppress
 from fastapi import FastAPI
-from fastapi.staticfiles import StaticFiles
-from src.app.api import auth, admin, ideas, users, todos, events
-from src.app.db.session import engine, Base
-import src.app.models.todo    # noqa: F401
-import src.app.models.event   # noqa: F401
-import src.app.models.notification # noqa: F401 
-import os
+from fastapi.concurrency import run_in_threadpool
+from src.app.api import auth, admin, ideas, users, todos, events, notifications
+from src.app.core import hashing
+from src.app.core.admission import AdmissionMiddleware
+from src.app.core.assets import PrecompressedStaticFiles, serving_dir
+from src.app.core.compression import APIGZipMiddleware
+from src.app.core.config import settings
+from src.app.core.responses import default_response_class
+from src.app.core.upload_limit import UploadLimitMiddleware
+from src.app.db.init_db import init_db
+from src.app.tasks import attachment_gc, notification_retention
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Schema migration + upload dir; cheap no-op for every worker after the first
+    await run_in_threadpool(init_db)
+    await hashing.warm_up()
+    tasks = []
+    if settings.attachment_gc_interval_seconds > 0:
+        tasks.append(asyncio.create_task(attachment_gc.run_periodically()))
+    if settings.notification_retention_interval_seconds > 0:
+        tasks.append(asyncio.create_task(notification_retention.run_periodically()))
+    yield
+    for task in tasks:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+    await run_in_threadpool(hashing.shutdown)
 
-# Create tables for dev
-Base.metadata.create_all(bind=engine)
 
 app = FastAPI(
     title="Innovat-EPAM-Portal API",
     description="User Authentication and Project Portal API",
-    version="0.1.0"
+    version="0.1.0",
+    lifespan=lifespan,
+    default_response_class=default_response_class,
 )
+app.add_middleware(AdmissionMiddleware)
+app.add_middleware(APIGZipMiddleware)
+app.add_middleware(UploadLimitMiddleware)
 
-app.include_router(auth.router, prefix="/api")
-app.include_router(admin.router, prefix="/api")
-app.include_router(ideas.router, prefix="/api")
-app.include_router(users.router, prefix="/api")
-app.include_router(todos.router, prefix="/api")
-app.include_router(events.router, prefix="/api")
-
-# Need to import notifications router
-from src.app.api.notifications import router as notifications_router
-app.include_router(notifications_router, prefix="/api")
-
-# Mount upload directory
-if not os.path.exists("uploads"):
-    os.makedirs("uploads")
-app.mount("/uploads", StaticFiles(directory="uploads"), name="uploads")
+for module in (auth, admin, ideas, users, todos, events, notifications):
+    app.include_router(module.router, prefix="/api")
 
-# Mount static files
-app.mount("/", StaticFiles(directory="static", html=True), name="static")
+# Built assets (python -m src.app.core.assets build) when present, else static/ as is
+app.mount("/", PrecompressedStaticFiles(directory=serving_dir(), html=True), name="static")
@@ -0,0 +1,16 @@
+from datetime import datetime, timezone
+from sqlalchemy import Column, Integer, String, DateTime
+from src.app.db.session import Base
+
+class Attachment(Base):
+    """One row per stored blob (src.app.core.storage), keyed by content hash.
+
+    ``refcount`` is the number of ideas that point at the blob; a blob at zero
+    may be garbage-collected.
+    """
+    __tablename__ = "attachments"
+
+    sha256 = Column(String(64), primary_key=True)
+    size = Column(Integer, nullable=False)
+    refcount = Column(Integer, nullable=False, default=0)
+    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
@@ -1,5 +1,6 @@
 import uuid
-from sqlalchemy import Column, String, ForeignKey
+from sqlalchemy import Column, String, ForeignKey, Index
+from src.app.db import versions
 from src.app.db.session import Base
 
 
@@ -9,11 +10,15 @@ def _uuid():
 
 class CalendarEvent(Base):
     __tablename__ = "calendar_events"
+    __table_args__ = (Index("ix_calendar_events_user_id_date", "user_id", "date"),)
 
     id = Column(String, primary_key=True, index=True, default=_uuid)
-    user_id = Column(String, ForeignKey("users.id"), nullable=False, index=True)
+    user_id = Column(String, ForeignKey("users.id"), nullable=False)
     title = Column(String, nullable=False)
     date = Column(String, nullable=False)   # "YYYY-MM-DD"
     time = Column(String, nullable=True)    # "HH:MM"
     description = Column(String, nullable=True)
     color = Column(String, default="#06b6d4")
+
+
+versions.attach_to(CalendarEvent.__table__, "events")
@@ -1,24 +1,37 @@
-from sqlalchemy import Column, String, Text, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime, timezone
 import uuid
 
+from src.app.db import aggregates, search, versions
 from src.app.db.session import Base
 
 class Idea(Base):
     __tablename__ = "ideas"
+    __table_args__ = (
+        Index("ix_ideas_user_id_created_at_id", "user_id", "created_at", "id"),  # my ideas feed (keyset)
+        Index("ix_ideas_created_at_id", "created_at", "id"),                     # admin feed (keyset)
+        Index("ix_ideas_status_created_at", "status", "created_at"),             # admin status views
+        Index("ix_ideas_reviewed_by_id", "reviewed_by_id"),
+        Index("ix_ideas_category", "category"),                                  # category facet
+        Index("ix_ideas_attachment_sha256", "attachment_sha256"),                # blob -> ideas
+        Index("ix_ideas_search_docid", "search_docid", unique=True),             # search hit -> idea
+    )
 
     id = Column(String, primary_key=True, index=True, default=lambda: str(uuid.uuid4()))
     title = Column(String, nullable=False)
     description = Column(Text, nullable=False)
     category = Column(String, nullable=False)
     file_path = Column(String, nullable=True)
+    attachment_sha256 = Column(String(64), nullable=True)  # content-addressed blob, see models.attachment
+    attachment_name = Column(String, nullable=True)        # file name as uploaded
     status = Column(String, default="submitted")
     admin_comment = Column(Text, nullable=True)
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    search_docid = Column(Integer, nullable=True)  # key of ideas_fts, set by its insert trigger (src.app.db.search)
 
     # Rich content (Phase 2)
-    tags = Column(String, nullable=True)               # JSON-encoded list, e.g. '["AI","LLM"]'
+    tags = Column(String, nullable=True)               # as entered, comma-separated; normalised copy in idea_tags
     problem_statement = Column(Text, nullable=True)
     solution = Column(Text, nullable=True)
 
@@ -28,3 +41,9 @@ class Idea(Base):
 
     owner = relationship("User", back_populates="ideas", foreign_keys=[user_id])
     reviewer = relationship("User", foreign_keys=[reviewed_by_id])
+    tag_links = relationship("IdeaTag", cascade="all, delete-orphan")
+
+
+search.attach_to(Idea.__table__)
+aggregates.attach_to(Idea.__table__)
+versions.attach_to(Idea.__table__, "ideas")
@@ -1,7 +1,8 @@
 import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey
+from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Index, Integer
 from sqlalchemy.orm import relationship
+from src.app.db import aggregates, sequences, versions
 from src.app.db.session import Base
 
 def _uuid():
@@ -9,12 +10,25 @@ def _uuid():
 
 class Notification(Base):
     __tablename__ = "notifications"
+    __table_args__ = (
+        # Covers the bell feed (user, newest first) and the unread filter
+        Index("ix_notifications_user_id_is_read_created_at", "user_id", "is_read", "created_at"),
+        # ?since= and the long-poll: the user's rows past a sequence number
+        Index("ix_notifications_user_id_seq", "user_id", "seq"),
+    )
 
     id = Column(String, primary_key=True, index=True, default=_uuid)
-    user_id = Column(String, ForeignKey("users.id"), nullable=False, index=True)
+    user_id = Column(String, ForeignKey("users.id"), nullable=False)
     message = Column(String, nullable=False)
     is_read = Column(Boolean, default=False)
     type = Column(String, nullable=False) # e.g. "idea_review", "task_assigned", "new_idea"
     created_at = Column(DateTime, default=datetime.utcnow)
+    # Position in the user's commit order, set by a trigger on insert (src.app.db.sequences)
+    seq = Column(Integer)
 
     user = relationship("User")
+
+
+aggregates.attach_to(Notification.__table__)
+versions.attach_to(Notification.__table__, "notifications")
+sequences.attach_to(Notification.__table__)
@@ -0,0 +1,9 @@
+from sqlalchemy import Column, Integer, String, ForeignKey
+from src.app.db.session import Base
+
+class NotificationSequence(Base):
+    """The last ``seq`` handed to one of the user's notifications, by a trigger (src.app.db.sequences)."""
+    __tablename__ = "notification_sequences"
+
+    user_id = Column(String, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    last_seq = Column(Integer, nullable=False, default=0)
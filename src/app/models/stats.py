@@ -0,0 +1,35 @@
+from sqlalchemy import Column, Integer, String, ForeignKey
+from src.app.db.session import Base
+
+class UserIdeaStats(Base):
+    """Per-author idea counts, kept current by triggers on ``ideas`` (src.app.db.aggregates).
+
+    ``pending`` is every idea that is neither accepted nor rejected.
+    """
+    __tablename__ = "user_idea_stats"
+
+    user_id = Column(String, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    total = Column(Integer, nullable=False, default=0)
+    accepted = Column(Integer, nullable=False, default=0)
+    rejected = Column(Integer, nullable=False, default=0)
+    pending = Column(Integer, nullable=False, default=0)
+
+class IdeaDailyStats(Base):
+    """Ideas submitted per UTC day of ``created_at``, and how many of them are accepted/rejected.
+
+    Kept current by triggers on ``ideas`` (src.app.db.aggregates); ``day`` is 'YYYY-MM-DD'.
+    """
+    __tablename__ = "idea_daily_stats"
+
+    day = Column(String(10), primary_key=True)
+    submitted = Column(Integer, nullable=False, default=0)
+    accepted = Column(Integer, nullable=False, default=0)
+    rejected = Column(Integer, nullable=False, default=0)
+
+class UserNotificationStats(Base):
+    """Per-user notification counts, kept current by triggers on ``notifications`` (src.app.db.aggregates)."""
+    __tablename__ = "user_notification_stats"
+
+    user_id = Column(String, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    total = Column(Integer, nullable=False, default=0)
+    unread = Column(Integer, nullable=False, default=0)
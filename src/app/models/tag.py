@@ -0,0 +1,19 @@
+from sqlalchemy import Column, Integer, String, ForeignKey, Index
+from src.app.db.session import Base
+
+class Tag(Base):
+    """One row per distinct tag, stored case-folded ("AI" and "ai" are the same tag)."""
+    __tablename__ = "tags"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String, unique=True, nullable=False)
+
+class IdeaTag(Base):
+    __tablename__ = "idea_tags"
+    __table_args__ = (
+        # ?tag= filter: tag -> ideas. The primary key covers idea -> tags.
+        Index("ix_idea_tags_tag_id_idea_id", "tag_id", "idea_id"),
+    )
+
+    idea_id = Column(String, ForeignKey("ideas.id", ondelete="CASCADE"), primary_key=True)
+    tag_id = Column(Integer, ForeignKey("tags.id", ondelete="CASCADE"), primary_key=True)
@@ -1,6 +1,7 @@
 import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey
+from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Index
+from src.app.db import versions
 from src.app.db.session import Base
 
 
@@ -10,9 +11,10 @@ def _uuid():
 
 class Todo(Base):
     __tablename__ = "todos"
+    __table_args__ = (Index("ix_todos_user_id_date", "user_id", "date"),)
 
     id = Column(String, primary_key=True, index=True, default=_uuid)
-    user_id = Column(String, ForeignKey("users.id"), nullable=False, index=True)
+    user_id = Column(String, ForeignKey("users.id"), nullable=False)
     title = Column(String, nullable=False)
     description = Column(String, nullable=True)
     date = Column(String, nullable=True) # "YYYY-MM-DD" mapped to calendar
@@ -22,3 +24,6 @@ class Todo(Base):
     assigned_by = Column(String, ForeignKey("users.id"), nullable=True) # Admin ID who assigned
     done = Column(Boolean, default=False)
     created_at = Column(DateTime, default=datetime.utcnow)
+
+
+versions.attach_to(Todo.__table__, "todos")
@@ -0,0 +1,10 @@
+from sqlalchemy import Column, Integer, String, ForeignKey
+from src.app.db.session import Base
+
+class CollectionVersion(Base):
+    """Bumped by triggers whenever one of the user's rows in ``collection`` changes (src.app.db.versions)."""
+    __tablename__ = "collection_versions"
+
+    user_id = Column(String, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    collection = Column(String, primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
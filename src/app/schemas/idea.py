@@ -17,6 +17,24 @@ class IdeaEvaluation(BaseModel):
     status: str
     admin_comment: Optional[str] = None
 
+class IdeaEvaluationItem(IdeaEvaluation):
+    idea_id: str
+
+class IdeaBatchEvaluation(BaseModel):
+    # Bounded so each status group's UPDATE stays within SQLite's bound-parameter limit
+    items: List[IdeaEvaluationItem] = Field(..., min_length=1, max_length=200)
+
+class IdeaEvaluationResult(BaseModel):
+    idea_id: str
+    ok: bool
+    status: Optional[str] = None
+    error: Optional[str] = None
+
+class IdeaBatchEvaluationResult(BaseModel):
+    succeeded: int
+    failed: int
+    results: List[IdeaEvaluationResult]
+
 class Idea(IdeaBase):
     """Internal/backward-compatible schema. Still used by existing tests."""
     model_config = ConfigDict(from_attributes=True)
@@ -46,3 +64,16 @@ class IdeaPublic(IdeaBase):
     solution: Optional[str] = None
     author: Optional[PublicProfile] = None
     reviewer: Optional[PublicProfile] = None
+
+class IdeaSearchHit(IdeaPublic):
+    """A search result: the idea plus an HTML-escaped excerpt with <mark>ed matches."""
+    snippet: str
+
+class FacetCount(BaseModel):
+    value: str
+    count: int
+
+class IdeaFacets(BaseModel):
+    tags: List[FacetCount]
+    categories: List[FacetCount]
+    statuses: List[FacetCount]
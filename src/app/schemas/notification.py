@@ -17,5 +17,10 @@ class Notification(BaseModel):
     is_read: bool
     type: str
     created_at: datetime
+    # Position in the user's commit order: what X-Latest-Cursor and ?since= carry
+    seq: int
 
     model_config = {"from_attributes": True}
+
+class UnreadCount(BaseModel):
+    unread: int
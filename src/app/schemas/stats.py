@@ -1,5 +1,9 @@
+from datetime import datetime
 from pydantic import BaseModel
-from typing import List
+from typing import List, Literal, Optional
+
+from src.app.schemas.idea import IdeaPublic
+from src.app.schemas.user import UserAdminView
 
 class UserStats(BaseModel):
     total: int
@@ -8,9 +12,13 @@ class UserStats(BaseModel):
     pending: int
     success_rate: float  # (accepted / total) * 100, 0.0 if total == 0
 
+StatsBucket = Literal["day", "week", "month"]
+
 class DailyCount(BaseModel):
-    date: str  # "YYYY-MM-DD"
-    count: int
+    date: str  # "YYYY-MM-DD", first day of the bucket
+    count: int  # submitted
+    accepted: int = 0
+    rejected: int = 0
 
 class AdminStats(BaseModel):
     total: int
@@ -18,4 +26,13 @@ class AdminStats(BaseModel):
     rejected: int
     pending: int
     acceptance_rate: float
+    bucket: StatsBucket = "day"
     daily_submissions: List[DailyCount]
+
+class AdminDashboard(BaseModel):
+    """What the admin dashboard opens with, as one cached snapshot."""
+    generated_at: datetime
+    stats: AdminStats
+    ideas: List[IdeaPublic]  # newest first, the first page of /api/admin/ideas
+    ideas_next_cursor: Optional[str] = None
+    top_users: List[UserAdminView]  # most ideas submitted
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, EmailStr, ConfigDict, Field
-from typing import Optional
+from typing import Literal, Optional
 
 class UserBase(BaseModel):
     email: EmailStr
@@ -43,6 +43,9 @@ class PasswordChange(BaseModel):
     current_password: str
     new_password: str = Field(..., min_length=8)
 
+UserSort = Literal["email", "total", "accepted", "success_rate"]
+SortOrder = Literal["asc", "desc"]
+
 class UserAdminView(BaseModel):
     """Admin view: user stats for the user management table."""
     model_config = ConfigDict(from_attributes=True)
@@ -0,0 +1,159 @@
+"""
+Orphaned attachment collection.
+
+A file in the upload store is garbage once no idea points at it:
+  - content-addressed blobs (``ab/cd/<sha256>``) whose hash no idea carries
+  - flat pre-store uploads (``<uuid>.<ext>``) whose path no idea carries
+  - temp files under ``.tmp`` left behind by interrupted uploads
+
+The ideas table decides what is referenced, not ``attachments.refcount``, so a
+drifted count can neither leak nor lose a file. Files younger than the grace
+period are skipped. An upload writes its blob, or touches the one it
+deduplicated against, before the idea that references it commits.
+
+Runs every ``attachment_gc_interval_seconds`` from the app lifespan, or by hand:
+
+    python -m src.app.tasks.attachment_gc [--dry-run]
+"""
+import argparse
+import asyncio
+import os
+import re
+import sys
+import time
+from pathlib import Path
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import delete, exists, select
+from sqlalchemy.orm import Session
+
+from src.app.core.config import settings
+from src.app.core.metrics import metrics
+from src.app.models.attachment import Attachment
+from src.app.models.idea import Idea
+
+_SHA256 = re.compile(r"[0-9a-f]{64}")
+
+_runs = metrics.counter("attachment_gc.runs")
+_deleted = metrics.counter("attachment_gc.deleted_files")
+_reclaimed = metrics.counter("attachment_gc.reclaimed_bytes")
+_seconds = metrics.summary("attachment_gc.seconds")
+_last_run: dict = {}
+metrics.register_collector("attachment_gc.last_run", lambda: dict(_last_run))
+
+
+def _blob_sha256(parts: tuple[str, ...]) -> str | None:
+    if len(parts) == 3 and _SHA256.fullmatch(parts[2]) and parts[:2] == (parts[2][:2], parts[2][2:4]):
+        return parts[2]
+    return None
+
+
+def _orphans(db: Session, root: Path, cutoff: float) -> tuple[int, list[tuple[Path, int]]]:
+    blobs = set(db.scalars(select(Idea.attachment_sha256).where(Idea.attachment_sha256.is_not(None))))
+    legacy = {
+        os.path.normpath(p) for p in
+        db.scalars(select(Idea.file_path).where(Idea.attachment_sha256.is_(None), Idea.file_path.is_not(None)))
+    }
+    scanned, orphans = 0, []
+    for path in root.rglob("*"):
+        if not path.is_file():
+            continue
+        scanned += 1
+        stat = path.stat()
+        if stat.st_mtime > cutoff:
+            continue
+        parts = path.relative_to(root).parts
+        sha256 = _blob_sha256(parts)
+        if parts[0] == ".tmp":
+            orphaned = True
+        elif sha256 is not None:
+            orphaned = sha256 not in blobs
+        elif len(parts) == 1:
+            orphaned = os.path.normpath(os.path.join(settings.upload_dir, parts[0])) not in legacy
+        else:
+            orphaned = False  # not ours: leave it alone
+        if orphaned:
+            orphans.append((path, stat.st_size))
+    return scanned, orphans
+
+
+def collect(db: Session, dry_run: bool | None = None, grace_seconds: int | None = None) -> dict:
+    """Delete (or with ``dry_run``, only report) unreferenced files; returns run stats."""
+    dry_run = settings.attachment_gc_dry_run if dry_run is None else dry_run
+    grace_seconds = settings.attachment_gc_grace_seconds if grace_seconds is None else grace_seconds
+    started = time.perf_counter()
+    cutoff = time.time() - grace_seconds
+    root = Path(settings.upload_dir)
+
+    scanned, orphans = _orphans(db, root, cutoff) if root.is_dir() else (0, [])
+    deleted_rows, reclaimed, deleted = 0, 0, 0
+    if dry_run:
+        reclaimed, deleted = sum(size for _, size in orphans), len(orphans)
+    else:
+        # Rows for blobs no idea references; an upload that still wants one re-creates it (upsert)
+        deleted_rows = db.execute(
+            delete(Attachment).where(~exists().where(Idea.attachment_sha256 == Attachment.sha256))
+        ).rowcount
+        db.commit()
+        for path, size in orphans:
+            try:
+                if path.stat().st_mtime > cutoff:
+                    continue  # deduplicated against since the scan
+                path.unlink()
+            except FileNotFoundError:
+                continue  # another worker got there first
+            reclaimed, deleted = reclaimed + size, deleted + 1
+        _deleted.inc(deleted)
+        _reclaimed.inc(reclaimed)
+
+    elapsed = time.perf_counter() - started
+    _runs.inc()
+    _seconds.observe(elapsed)
+    stats = {
+        "dry_run": dry_run,
+        "scanned_files": scanned,
+        "orphaned_files": len(orphans),
+        "deleted_files": deleted,
+        "reclaimed_bytes": reclaimed,
+        "deleted_rows": deleted_rows,
+        "seconds": round(elapsed, 6),
+    }
+    _last_run.clear()
+    _last_run.update(stats)
+    return stats
+
+
+def _collect_once() -> dict:
+    from src.app.db.session import SessionLocal
+
+    with SessionLocal() as db:
+        return collect(db)
+
+
+async def run_periodically() -> None:
+    """Lifespan task: collect every ``attachment_gc_interval_seconds`` until cancelled."""
+    while True:
+        await asyncio.sleep(settings.attachment_gc_interval_seconds)
+        try:
+            await run_in_threadpool(_collect_once)
+        except Exception as exc:  # keep collecting on the next tick
+            print(f"[attachment_gc] run failed: {exc!r}", file=sys.stderr)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Delete attachment files no idea references.")
+    parser.add_argument("--dry-run", action="store_true", help="report what would be deleted")
+    parser.add_argument("--grace-seconds", type=int, default=None)
+    args = parser.parse_args(argv)
+    from src.app.db.session import SessionLocal
+
+    with SessionLocal() as db:
+        stats = collect(db, dry_run=args.dry_run, grace_seconds=args.grace_seconds)
+    verb = "would reclaim" if stats["dry_run"] else "reclaimed"
+    print(f"[attachment_gc] {verb} {stats['reclaimed_bytes']} bytes in {stats['orphaned_files']} files "
+          f"(scanned {stats['scanned_files']}) in {stats['seconds'] * 1000:.0f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
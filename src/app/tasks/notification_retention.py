@@ -0,0 +1,189 @@
+"""
+Notification retention.
+
+Nothing else ever deletes a notification, so the table only grows. A
+notification is dropped once either rule says so:
+  - it has been read and is older than ``notification_retention_read_days``
+  - it is not among its user's newest ``notification_retention_max_per_user``
+
+Users come from ``user_notification_stats``: the age rule is one index range
+per user, and only users whose ``total`` is over the cap pay for finding the
+oldest notification they keep. Rows are deleted oldest first, ``batch_size``
+at a time, each batch in its own short transaction followed by a pause, so a
+writer waits on one batch at most. The triggers on ``notifications`` keep the
+unread counters and list versions in step with every batch.
+
+With ``notification_retention_archive_dir`` set, every deleted row is first
+appended to ``notifications-<UTC time>.ndjson.gz`` there, one JSON object per
+line. The archive is flushed before each batch commits, so a crash mid-run
+never loses a row that was deleted.
+
+Runs every ``notification_retention_interval_seconds`` from the app lifespan, or by hand:
+
+    python -m src.app.tasks.notification_retention [--dry-run]
+"""
+import argparse
+import asyncio
+import gzip
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import and_, delete, func, or_, select
+from sqlalchemy.orm import Session
+
+from src.app.core import pagination
+from src.app.core.config import settings
+from src.app.core.metrics import metrics
+from src.app.models.notification import Notification
+from src.app.models.stats import UserNotificationStats
+from src.app.schemas.notification import Notification as NotificationSchema
+
+_runs = metrics.counter("notification_retention.runs")
+_deleted = metrics.counter("notification_retention.deleted_rows")
+_seconds = metrics.summary("notification_retention.seconds")
+_last_run: dict = {}
+metrics.register_collector("notification_retention.last_run", lambda: dict(_last_run))
+
+
+def _expired(db: Session, user_id: str, total: int, cutoff: datetime | None, max_per_user: int):
+    """The notifications of ``user_id`` the policy drops, as a where clause (None: none)."""
+    rules = []
+    if cutoff is not None:
+        rules.append(and_(Notification.is_read.is_(True), Notification.created_at < cutoff))
+    if 0 < max_per_user < total:
+        oldest_kept = db.execute(
+            select(Notification.created_at, Notification.id)
+            .where(Notification.user_id == user_id)
+            .order_by(*pagination.keyset_order(Notification))
+            .offset(max_per_user - 1).limit(1)
+        ).first()
+        if oldest_kept is not None:
+            rules.append(pagination.after(Notification, tuple(oldest_kept)))
+    return and_(Notification.user_id == user_id, or_(*rules)) if rules else None
+
+
+def _open_archive(archive_dir: str):
+    path = Path(archive_dir)
+    path.mkdir(parents=True, exist_ok=True)
+    path = path / f"notifications-{datetime.utcnow():%Y%m%dT%H%M%SZ}.ndjson.gz"
+    return path, gzip.open(path, "ab")  # a second run in the same second appends a gzip member
+
+
+def prune(
+    db: Session,
+    dry_run: bool = False,
+    read_days: int | None = None,
+    max_per_user: int | None = None,
+    archive_dir: str | None = None,
+) -> dict:
+    """Delete (or with ``dry_run``, only count) what the retention policy drops; returns run stats."""
+    read_days = settings.notification_retention_read_days if read_days is None else read_days
+    max_per_user = settings.notification_retention_max_per_user if max_per_user is None else max_per_user
+    archive_dir = settings.notification_retention_archive_dir if archive_dir is None else archive_dir
+    batch_size = max(1, settings.notification_retention_batch_size)
+    pause = settings.notification_retention_pause_ms / 1000
+    started = time.perf_counter()
+    cutoff = datetime.utcnow() - timedelta(days=read_days) if read_days > 0 else None
+
+    if cutoff is None and max_per_user <= 0:
+        users = []
+    else:
+        floor = 0 if cutoff is not None else max_per_user
+        users = db.execute(
+            select(UserNotificationStats.user_id, UserNotificationStats.total)
+            .where(UserNotificationStats.total > floor)
+        ).all()
+    db.commit()  # end the read before deleting, so it holds nothing while batches run
+
+    deleted, batches, archive_path, archive = 0, 0, None, None
+    try:
+        for user_id, total in users:
+            where = _expired(db, user_id, total, cutoff, max_per_user)
+            if where is None:
+                continue
+            if dry_run:
+                deleted += db.scalar(select(func.count()).select_from(Notification).where(where))
+                continue
+            while True:
+                rows = db.scalars(
+                    select(Notification).where(where)
+                    .order_by(Notification.created_at, Notification.id).limit(batch_size)
+                ).all()
+                if not rows:
+                    break
+                if archive_dir:
+                    if archive is None:
+                        archive_path, archive = _open_archive(archive_dir)
+                    archive.write(b"".join(NotificationSchema.model_validate(n).model_dump_json().encode() + b"\n"
+                                           for n in rows))
+                    archive.flush()
+                db.execute(delete(Notification).where(Notification.id.in_([n.id for n in rows]))
+                           .execution_options(synchronize_session=False))
+                db.commit()
+                deleted, batches = deleted + len(rows), batches + 1
+                _deleted.inc(len(rows))
+                if len(rows) < batch_size:
+                    break
+                time.sleep(pause)  # let queued writers take the lock
+    finally:
+        if archive is not None:
+            archive.close()
+        db.rollback()
+
+    elapsed = time.perf_counter() - started
+    _runs.inc()
+    _seconds.observe(elapsed)
+    stats = {
+        "dry_run": dry_run,
+        "users_checked": len(users),
+        "deleted_rows": deleted,
+        "batches": batches,
+        "archive": str(archive_path) if archive_path else None,
+        "seconds": round(elapsed, 6),
+    }
+    _last_run.clear()
+    _last_run.update(stats)
+    return stats
+
+
+def _prune_once() -> dict:
+    from src.app.db.session import SessionLocal
+
+    with SessionLocal() as db:
+        return prune(db)
+
+
+async def run_periodically() -> None:
+    """Lifespan task: prune every ``notification_retention_interval_seconds`` until cancelled."""
+    while True:
+        await asyncio.sleep(settings.notification_retention_interval_seconds)
+        try:
+            await run_in_threadpool(_prune_once)
+        except Exception as exc:  # keep pruning on the next tick
+            print(f"[notification_retention] run failed: {exc!r}", file=sys.stderr)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Delete notifications past the retention policy.")
+    parser.add_argument("--dry-run", action="store_true", help="report what would be deleted")
+    parser.add_argument("--read-days", type=int, default=None)
+    parser.add_argument("--max-per-user", type=int, default=None)
+    parser.add_argument("--archive-dir", default=None)
+    args = parser.parse_args(argv)
+    from src.app.db.session import SessionLocal
+
+    with SessionLocal() as db:
+        stats = prune(db, dry_run=args.dry_run, read_days=args.read_days,
+                      max_per_user=args.max_per_user, archive_dir=args.archive_dir)
+    verb = "would delete" if stats["dry_run"] else "deleted"
+    archived = f", archived to {stats['archive']}" if stats["archive"] else ""
+    print(f"[notification_retention] {verb} {stats['deleted_rows']} notifications of {stats['users_checked']} users "
+          f"in {stats['batches']} batches in {stats['seconds'] * 1000:.0f} ms{archived}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
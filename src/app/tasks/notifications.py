@@ -0,0 +1,59 @@
+"""
+Notification fan-out, run after the response is sent.
+
+Request handlers commit their own change, then queue the fan-out as a
+FastAPI background task. The task resolves the recipients, writes all their
+notifications with one bulk insert in one short transaction, and retries with
+exponential backoff when the write fails (e.g. SQLite busy). The submitter no
+longer waits on N commits, and the write lock is held once, briefly.
+
+Tasks live in the worker's memory. A batch that fails every attempt is
+counted in ``notifications.fanout_failed``. A batch queued by a worker that
+dies before running it is lost. These are best-effort alerts, not records.
+"""
+import sys
+import time
+from collections.abc import Callable
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from src.app.core import notification_stream
+from src.app.core.config import settings
+from src.app.core.metrics import metrics
+from src.app.crud import notification as crud_notif
+from src.app.models.user import User
+from src.app.schemas.notification import NotificationCreate
+
+_lag = metrics.summary("notifications.fanout_lag_seconds")
+_rows = metrics.counter("notifications.fanout_rows")
+_retries = metrics.counter("notifications.fanout_retries")
+_failed = metrics.counter("notifications.fanout_failed")
+
+
+def fan_out_to_role(session_factory: Callable[[], Session], role: str, message: str, type: str,
+                    queued_at: float) -> None:
+    """Notify every user with ``role``; ``queued_at`` is the ``time.monotonic()`` it was queued at."""
+    delay = settings.fanout_retry_delay_ms / 1000
+    for attempt in range(1, settings.fanout_max_attempts + 1):
+        try:
+            with session_factory() as db:
+                user_ids = db.scalars(select(User.id).where(User.role == role)).all()
+                notes = crud_notif.create_notifications(db, [
+                    NotificationCreate(user_id=user_id, message=message, type=type) for user_id in user_ids
+                ])
+                db.commit()
+        except Exception as exc:
+            if attempt == settings.fanout_max_attempts:
+                _failed.inc()
+                print(f"[notifications] fan-out to {role!r} failed after {attempt} attempts: {exc!r}",
+                      file=sys.stderr)
+                return
+            _retries.inc()
+            time.sleep(delay)
+            delay *= 2
+        else:
+            notification_stream.publish(notes)
+            _rows.inc(len(user_ids))
+            _lag.observe(time.monotonic() - queued_at)
+            return
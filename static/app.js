@@ -9,11 +9,13 @@ const state = {
     user: null,
     allIdeas: [],          // cached for client-side filter
     adminIdeas: [],
+    adminStats: null,      // last dashboard snapshot's stats, for chart redraws
     activeFilter: 'all',
     chart: null,
     sidebarCollapsed: localStorage.getItem('sidebarCollapsed') === 'true',
     selectedTags: new Set(),
     currentStep: 1,
+    assignableUsers: null,  // admin task-assignment dropdown
 };
 
 // ─── DOM shortcut ─────────────────────────────────────────────────────────────
@@ -39,6 +41,43 @@ async function apiFetch(path, opts = {}) {
     return res;
 }
 
+// Attachments need the bearer token, so they are fetched and opened as blob URLs.
+// The endpoint sends ETag + immutable caching, so repeat opens come from the HTTP cache.
+// A blob: URL runs in this origin without the server's CSP sandbox, so only types that
+// cannot carry script are shown inline; anything else (HTML, SVG, ...) is downloaded.
+const INLINE_ATTACHMENT_TYPES = ['image/png', 'image/jpeg', 'image/gif', 'image/webp', 'application/pdf'];
+
+async function openAttachment(ideaId) {
+    const win = window.open('', '_blank');
+    const res = await apiFetch(`/api/ideas/${ideaId}/attachment`);
+    if (!res.ok) { win?.close(); return; }
+    const served = (res.headers.get('Content-Type') || '').split(';')[0].trim().toLowerCase();
+    const inline = INLINE_ATTACHMENT_TYPES.includes(served);
+    const blob = new Blob([await res.arrayBuffer()], { type: inline ? served : 'application/octet-stream' });
+    const url = URL.createObjectURL(blob);
+    if (inline) {
+        if (win) win.location = url; else window.location = url;
+    } else {
+        win?.close();
+        const disposition = res.headers.get('Content-Disposition') || '';
+        const encoded = /filename\*=utf-8''([^;]+)/i.exec(disposition);
+        const plain = /filename="([^"]+)"/i.exec(disposition);
+        const link = Object.assign(document.createElement('a'), {
+            href: url, download: encoded ? decodeURIComponent(encoded[1]) : plain ? plain[1] : 'attachment',
+        });
+        document.body.appendChild(link);
+        link.click();
+        link.remove();
+    }
+    setTimeout(() => URL.revokeObjectURL(url), 60000);
+}
+document.addEventListener('click', e => {
+    const link = e.target.closest('[data-attachment]');
+    if (!link) return;
+    e.preventDefault();
+    openAttachment(link.dataset.attachment);
+});
+
 // ─── Theme ────────────────────────────────────────────────────────────────────
 function applyTheme(theme) {
     document.body.classList.toggle('light', theme !== 'dark');
@@ -141,7 +180,7 @@ function routeTo(view) {
 
     // Load data for view
     if (view === 'feed') loadMyIdeas();
-    if (view === 'admin') { loadAllIdeas(); loadAdminStats(); }
+    if (view === 'admin') loadAdminDashboard();
     if (view === 'profile') loadProfile();
     if (view === 'workspace') loadWorkspace();
     if (view === 'users') loadUsersView();
@@ -229,6 +268,7 @@ async function init() {
                 $('auth-view').classList.add('hidden');
                 $('app-shell').classList.remove('hidden');
                 routeTo(user.role === 'admin' ? 'admin' : 'feed');
+                openNotifStream();
                 return;
             }
         } catch (_) { /* fall through */ }
@@ -283,8 +323,9 @@ $('auth-toggle-btn').addEventListener('click', () => {
 });
 
 function logout() {
-    state.token = null; state.user = null;
+    state.token = null; state.user = null; state.assignableUsers = null;
     localStorage.removeItem('token');
+    closeNotifStream();
     $('auth-view').classList.remove('hidden');
     $('app-shell').classList.add('hidden');
     closeDropdown();
@@ -399,31 +440,43 @@ document.querySelectorAll('.filter-chip').forEach(chip => {
     chip.addEventListener('click', () => applyFilter(chip.dataset.filter));
 });
 
-// Search
+// Search — server-side full text (GET /api/ideas/search), debounced while typing
+let searchTimer = null;
+let searchSeq = 0;
 $('search-input').addEventListener('input', e => {
-    const q = e.target.value.toLowerCase();
-    if (!q) { applyFilter(state.activeFilter); return; }
-    const src = state.user?.role === 'admin' ? state.adminIdeas : state.allIdeas;
-    const containerId = state.user?.role === 'admin' ? 'admin-feed' : 'idea-feed';
-    renderFeed(src.filter(i => i.title.toLowerCase().includes(q) || i.description.toLowerCase().includes(q)), containerId, state.user?.role === 'admin');
+    const q = e.target.value.trim();
+    const isAdmin = state.user?.role === 'admin';
+    const containerId = isAdmin ? 'admin-feed' : 'idea-feed';
+    clearTimeout(searchTimer);
+    if (!q) {
+        searchSeq++;
+        if (isAdmin) renderFeed(state.adminIdeas, containerId, true);
+        else applyFilter(state.activeFilter);
+        return;
+    }
+    searchTimer = setTimeout(async () => {
+        const seq = ++searchSeq;
+        const res = await apiFetch(`/api/ideas/search?q=${encodeURIComponent(q)}&limit=50`);
+        if (!res.ok || seq !== searchSeq) return;   // a newer keystroke already won
+        renderFeed(await res.json(), containerId, isAdmin);
+    }, 200);
 });
 
-// ─── Admin Feed ───────────────────────────────────────────────────────────────
-async function loadAllIdeas() {
+// ─── Admin Dashboard: Feed, Stats + Chart ─────────────────────────────────────
+// The dashboard opens from one cached snapshot: stats, the newest ideas and the top users.
+async function loadAdminDashboard() {
     showSkeletons('admin-feed', 6);
-    const res = await apiFetch('/api/admin/ideas');
+    const res = await apiFetch('/api/admin/dashboard');
     if (!res.ok) return;
-    state.adminIdeas = await res.json();
+    const d = await res.json();
+    state.adminIdeas = d.ideas;
     $('admin-count').textContent = `${state.adminIdeas.length} submission${state.adminIdeas.length !== 1 ? 's' : ''}`;
     renderFeed(state.adminIdeas, 'admin-feed', true);
+    renderAdminStats(d.stats);
 }
 
-// ─── Admin Stats + Chart ──────────────────────────────────────────────────────
-async function loadAdminStats() {
-    const res = await apiFetch('/api/admin/stats');
-    if (!res.ok) return;
-    const d = await res.json();
-
+function renderAdminStats(d) {
+    state.adminStats = d;
     $('kpi-total').textContent = d.total;
     $('kpi-accepted').textContent = d.accepted;
     $('kpi-pending').textContent = d.pending ?? (d.total - d.accepted - d.rejected);
@@ -437,10 +490,9 @@ async function loadAdminStats() {
     renderSplineChart(d.daily_submissions || []);
 }
 
+// Theme changes only restyle the chart: redraw it from the stats already loaded
 function rebuildChart() {
-    const res = apiFetch('/api/admin/stats').then(r => r.ok ? r.json() : null).then(d => {
-        if (d) renderSplineChart(d.daily_submissions || []);
-    });
+    if (state.adminStats) renderSplineChart(state.adminStats.daily_submissions || []);
 }
 
 function renderSplineChart(data) {
@@ -538,7 +590,7 @@ function buildTimeline(idea) {
     const rName = reviewer?.email?.split('@')[0] || 'Admin';
 
     const attach = idea.file_path
-        ? `<a href="/${idea.file_path}" target="_blank"
+        ? `<a href="#" data-attachment="${idea.id}"
               style="display:inline-flex;align-items:center;gap:0.375rem;font-size:0.8125rem;font-weight:600;color:var(--accent);text-decoration:none;margin-top:0.625rem">
               📎 Download attachment</a>`
         : '';
@@ -618,7 +670,7 @@ function openReviewDrawer(idea) {
     const prob = $('rd-problem-row'), sol = $('rd-solution-row'), att = $('rd-attach-row');
     if (idea.problem_statement) { prob.classList.remove('hidden'); $('rd-problem').textContent = idea.problem_statement; } else prob.classList.add('hidden');
     if (idea.solution) { sol.classList.remove('hidden'); $('rd-solution').textContent = idea.solution; } else sol.classList.add('hidden');
-    if (idea.file_path) { att.classList.remove('hidden'); $('rd-attach-link').href = `/${idea.file_path}`; } else att.classList.add('hidden');
+    if (idea.file_path) { att.classList.remove('hidden'); $('rd-attach-link').dataset.attachment = idea.id; } else att.classList.add('hidden');
 
     $('review-drawer').classList.add('open');
     $('drawer-overlay').classList.add('visible');
@@ -635,8 +687,7 @@ async function submitReview(status) {
     if (res.ok) {
         showToast(`Idea ${status} successfully!`);
         closeDrawers();
-        loadAllIdeas();
-        loadAdminStats();
+        loadAdminDashboard();
     } else {
         showToast((await res.json()).detail || 'Evaluation failed.', 'error');
     }
@@ -714,7 +765,7 @@ async function deleteIdea(id) {
     if (res.ok) {
         showToast('Idea deleted successfully.');
         loadMyIdeas();
-        if (state.user?.role === 'admin') loadAllIdeas();
+        if (state.user?.role === 'admin') loadAdminDashboard();
     } else {
         const err = await res.json();
         const msg = typeof err.detail === 'string' ? err.detail : (Array.isArray(err.detail) && err.detail.length ? err.detail[0].msg : 'Failed to delete idea.');
@@ -803,24 +854,41 @@ $('change-password-form').addEventListener('submit', async e => {
 
 // ─── Notification Bell ────────────────────────────────────────────────────────
 let notifications = [];
+let unreadCount = 0;          // from /api/notifications/unread-count, then kept up locally
 
 async function loadNotifs() {
     try {
-        const res = await fetch('/api/notifications', {
-            headers: { 'Authorization': `Bearer ${localStorage.getItem('token')}` }
-        });
+        const [res, count] = await Promise.all([
+            apiFetch('/api/notifications'),
+            apiFetch('/api/notifications/unread-count'),
+        ]);
         if (res.ok) {
-            notifications = await res.json();
-            updateNotifBadge();
-            if (!$('notif-panel').classList.contains('hidden')) {
-                renderNotifPanel();
-            }
+            mergeNotifs(await res.json());
+            lastNotifEventId ??= res.headers.get('X-Latest-Cursor');
         }
+        if (count.ok) unreadCount = (await count.json()).unread;
+        updateNotifBadge();
+        if (!$('notif-panel').classList.contains('hidden')) renderNotifPanel();
     } catch (err) { console.error('Error fetching notifications:', err); }
 }
 
+// A fetched list replaces ours, except for pushed notifications committed after anything in it
+function mergeNotifs(fresh) {
+    const seen = new Set(fresh.map(n => n.id));
+    const newest = Math.max(0, ...fresh.map(n => n.seq));
+    const pushed = notifications.filter(n => !seen.has(n.id) && n.seq > newest);
+    notifications = [...pushed, ...fresh].slice(0, 20);
+}
+
+function addNotif(n) {
+    if (notifications.some(x => x.id === n.id)) return;
+    notifications = [n, ...notifications].slice(0, 20);
+    if (!n.is_read) unreadCount += 1;
+    updateNotifBadge();
+    if (!$('notif-panel').classList.contains('hidden')) renderNotifPanel();
+}
+
 function updateNotifBadge() {
-    const unreadCount = notifications.filter(n => !n.is_read).length;
     const badge = $('notif-badge');
     const countEl = $('notif-count');
 
@@ -876,15 +944,108 @@ function toggleNotifPanel() {
 
 async function clearNotifs() {
     try {
-        await fetch('/api/notifications/read', {
-            method: 'PATCH',
-            headers: { 'Authorization': `Bearer ${localStorage.getItem('token')}` }
-        });
-        await loadNotifs(); // reload state
+        const res = await apiFetch('/api/notifications/read', { method: 'PATCH' });
+        if (!res.ok) return;
+        notifications = notifications.map(n => ({ ...n, is_read: true }));
+        unreadCount = 0;
+        updateNotifBadge();
+        if (!$('notif-panel').classList.contains('hidden')) renderNotifPanel();
     } catch (err) { console.error('Failed to mark read', err); }
 }
 
-setInterval(loadNotifs, 10000); // Polling every 10 seconds
+// New notifications are pushed over /api/notifications/stream (SSE). It is read with
+// fetch rather than EventSource so the token travels in a header, not the URL. While
+// the stream is unavailable (old browser, buffering proxy, too many tabs) the bell
+// long-polls ?since=<latest>&wait= instead, which returns as soon as something arrives.
+const NOTIF_POLL_MS = 10000;          // pause after a failed long-poll
+const NOTIF_WAIT_SECONDS = 25;
+const NOTIF_STREAM_RETRY_MS = 30000;
+let notifStream = null;       // AbortController of the open stream
+let notifPolling = false;
+let notifPollRun = 0;         // a restarted poll loop retires the previous one
+let lastNotifEventId = null;  // newest position seen: Last-Event-ID for the stream, ?since= for polls
+
+async function longPollNotifs(run) {
+    while (notifPolling && run === notifPollRun && state.token) {
+        try {
+            if (!lastNotifEventId) await loadNotifs();
+            const since = encodeURIComponent(lastNotifEventId || '');
+            const res = await apiFetch(`/api/notifications?since=${since}&wait=${NOTIF_WAIT_SECONDS}`, { cache: 'no-store' });
+            // A cursor from before a server upgrade no longer parses: the next round starts from the list
+            if (res.status === 400) lastNotifEventId = null;
+            if (!res.ok) throw new Error(`notification poll: ${res.status}`);
+            const cursor = res.headers.get('X-Latest-Cursor');
+            if (run !== notifPollRun) return;
+            (await res.json()).forEach(addNotif);
+            if (cursor) lastNotifEventId = cursor;
+        } catch (err) {
+            console.warn(err);
+            await new Promise(resolve => setTimeout(resolve, NOTIF_POLL_MS));
+        }
+    }
+}
+
+function startNotifPolling() {
+    if (notifPolling) return;
+    notifPolling = true;
+    longPollNotifs(++notifPollRun);
+}
+
+function stopNotifPolling() {
+    notifPolling = false;
+    notifPollRun++;
+}
+
+async function openNotifStream() {
+    if (notifStream || !state.token) return;
+    const controller = new AbortController();
+    notifStream = controller;
+    let retryMs = NOTIF_STREAM_RETRY_MS;
+    try {
+        const headers = { 'Authorization': `Bearer ${state.token}`, 'Accept': 'text/event-stream' };
+        if (lastNotifEventId) headers['Last-Event-ID'] = lastNotifEventId;
+        const res = await fetch('/api/notifications/stream', { headers, signal: controller.signal, cache: 'no-store' });
+        if (res.status === 400) lastNotifEventId = null; // an id from before a server upgrade
+        if (!res.ok || !res.body) throw new Error(`notification stream: ${res.status}`);
+        stopNotifPolling();
+        loadNotifs(); // what came before the stream opened; ids dedupe the overlap
+        const reader = res.body.pipeThrough(new TextDecoderStream()).getReader();
+        let buffer = '';
+        for (;;) {
+            const { value, done } = await reader.read();
+            if (done) break;
+            buffer += value;
+            let end;
+            while ((end = buffer.indexOf('\n\n')) >= 0) {
+                const fields = {};
+                for (const line of buffer.slice(0, end).split('\n')) {
+                    const colon = line.indexOf(':');
+                    if (colon > 0) fields[line.slice(0, colon)] = line.slice(colon + 1).replace(/^ /, '');
+                }
+                buffer = buffer.slice(end + 2);
+                if (fields.retry) retryMs = Number(fields.retry);
+                if (fields.id) lastNotifEventId = fields.id;
+                if (fields.event === 'notification') addNotif(JSON.parse(fields.data));
+            }
+        }
+    } catch (err) {
+        if (controller.signal.aborted) return; // logged out
+        console.warn('Notification stream unavailable, polling instead:', err);
+        startNotifPolling();
+        retryMs = NOTIF_STREAM_RETRY_MS;
+    }
+    if (notifStream !== controller) return;
+    notifStream = null;
+    setTimeout(openNotifStream, retryMs);
+}
+
+function closeNotifStream() {
+    notifStream?.abort();
+    notifStream = null;
+    stopNotifPolling();
+    lastNotifEventId = null;
+    notifications = [];
+}
 
 document.addEventListener('click', e => {
     if (!e.target.closest('#notif-btn') && !$('notif-panel').classList.contains('hidden')) {
@@ -913,7 +1074,7 @@ function routeTo(view) {
     closeSidebar();
 
     if (view === 'feed') loadMyIdeas();
-    if (view === 'admin') { loadAllIdeas(); loadAdminStats(); }
+    if (view === 'admin') loadAdminDashboard();
     if (view === 'profile') loadProfile();
     if (view === 'workspace') loadWorkspace();
     if (view === 'users') loadUsersView();
@@ -989,14 +1150,10 @@ async function openTaskModal(prefillDate = null) {
     // If admin, populate users dropdown
     if (state.currentUser?.role === 'admin') {
         $('task-assign-group').classList.remove('hidden');
-        const res = await apiFetch('/api/admin/users');
-        if (res.ok) {
-            const users = await res.json();
-            const select = $('task-assign');
-            select.innerHTML = `<option value="">Myself</option>` + users.map(u =>
-                `<option value="${u.id}">${u.email} (${u.role})</option>`
-            ).join('');
-        }
+        const users = await getAssignableUsers();
+        $('task-assign').innerHTML = `<option value="">Myself</option>` + users.map(u =>
+            `<option value="${u.id}">${u.email} (${u.role})</option>`
+        ).join('');
     } else {
         $('task-assign-group').classList.add('hidden');
     }
@@ -1272,21 +1429,60 @@ async function saveCalendarEvent() {
 }
 
 // ─── Users Management View (Admin) ────────────────────────────────────────────
+// The table pages through /api/admin/users (sorted and filtered server-side) with X-Next-Cursor.
+const USERS_PAGE_SIZE = 50;
+let _usersCursor = null;
+let _usersShown = 0;
+let _usersFilterTimer = null;
+
+function usersQuery(cursor) {
+    const params = new URLSearchParams({ limit: USERS_PAGE_SIZE, sort: $('users-sort').value });
+    const email = $('users-filter').value.trim();
+    if (email) params.set('email', email);
+    if (cursor) params.set('cursor', cursor);
+    return `/api/admin/users?${params}`;
+}
+
 async function loadUsersView() {
+    _usersCursor = null;
+    _usersShown = 0;
     $('users-tbody').innerHTML = '';
-    const res = await apiFetch('/api/admin/users');
+    await loadMoreUsers();
+}
+
+async function loadMoreUsers() {
+    const res = await apiFetch(usersQuery(_usersCursor));
     if (!res.ok) { showToast('Failed to load users.', 'error'); return; }
     const users = await res.json();
-    $('users-count').textContent = `${users.length} registered user${users.length !== 1 ? 's' : ''}`;
-    $('users-tbody').innerHTML = users.map(u => renderUserRow(u)).join('');
+    _usersCursor = res.headers.get('X-Next-Cursor');
+    const offset = _usersShown;
+    _usersShown += users.length;
+    $('users-tbody').insertAdjacentHTML('beforeend', users.map((u, i) => renderUserRow(u, offset + i)).join(''));
+    $('users-count').textContent = `${_usersShown}${_usersCursor ? '+' : ''} user${_usersShown !== 1 ? 's' : ''}`;
+    $('users-more').classList.toggle('hidden', !_usersCursor);
 
     // Render sparklines after DOM is updated
-    users.forEach((u, idx) => {
-        const canvas = document.getElementById(`spark-${idx}`);
+    users.forEach((u, i) => {
+        const canvas = document.getElementById(`spark-${offset + i}`);
         if (canvas) renderSparkline(canvas, [u.total, u.accepted, u.rejected]);
     });
 }
 
+function filterUsers() {
+    clearTimeout(_usersFilterTimer);
+    _usersFilterTimer = setTimeout(loadUsersView, 250);
+}
+
+// Task assignment only needs id/email/role: fetched once per session, refreshed after a role change.
+async function getAssignableUsers() {
+    if (!state.assignableUsers) {
+        const res = await apiFetch('/api/admin/users?limit=500');
+        if (!res.ok) return [];
+        state.assignableUsers = await res.json();
+    }
+    return state.assignableUsers;
+}
+
 function renderUserRow(user, idx) {
     const letter = user.email[0].toUpperCase();
     const roleBadge = user.role === 'admin'
@@ -1349,6 +1545,7 @@ async function toggleUserRole(userId, currentRole) {
     });
     if (res.ok) {
         showToast(`User ${label}!`);
+        state.assignableUsers = null;
         loadUsersView();
     } else {
         showToast((await res.json()).detail || 'Role update failed.', 'error');
@@ -1,46 +1,122 @@
+import asyncio
+import os
+from types import SimpleNamespace
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from src.app.main import app
-from src.app.db.session import Base, get_db
+from src.app.core.config import settings
+from src.app.core.auth_cache import principal_cache
+from src.app.core.dashboard_cache import dashboard_cache
+from src.app.core.ratelimit import rate_limiter
+from src.app.crud.user import get_user_by_email
+from src.app.db.base import Base
+from src.app.db.session import get_db, get_read_db, get_async_db, get_session_factory
 
-SQLALCHEMY_DATABASE_URL = "sqlite:///./test_all.db"
-engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-
-@pytest.fixture(scope="session", autouse=True)
-def setup_db():
+@pytest.fixture(autouse=True)
+def database(tmp_path, monkeypatch):
+    """A fresh database and upload dir under tmp_path for each test, behind the app's session dependencies."""
+    path = tmp_path / "test.db"
+    engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False})
+    # Read-only twin of the test engine, mirroring get_read_db's query_only profile
+    read_engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False})
+    event.listen(read_engine, "connect", lambda conn, _: conn.execute("PRAGMA query_only=ON"))
+    # NullPool: TestClient runs each request on its own event loop
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{path}", poolclass=NullPool)
+    sessions = SimpleNamespace(
+        sync=sessionmaker(autocommit=False, autoflush=False, bind=engine),
+        read=sessionmaker(autocommit=False, autoflush=False, bind=read_engine),
+        aio=async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False),
+        async_engine=async_engine,
+    )
+    # What the lifespan's init_db() does at startup (TestClient here never enters it)
+    monkeypatch.setattr(settings, "upload_dir", str(tmp_path / "uploads"))
+    os.makedirs(settings.upload_dir)
     Base.metadata.create_all(bind=engine)
-    yield
-    Base.metadata.drop_all(bind=engine)
 
-@pytest.fixture(autouse=True)
-def clean_tables():
-    # Clean tables before each test
-    with engine.connect() as conn:
-        for table in reversed(Base.metadata.sorted_tables):
-            conn.execute(table.delete())
-        conn.commit()
-    yield
-
-def override_get_db():
-    try:
-        db = TestingSessionLocal()
-        yield db
-    finally:
-        db.close()
+    def override_get_db():
+        try:
+            db = sessions.sync()
+            yield db
+        finally:
+            db.close()
+
+    def override_get_read_db():
+        try:
+            db = sessions.read()
+            yield db
+        finally:
+            db.close()
 
-app.dependency_overrides[get_db] = override_get_db
+    async def override_get_async_db():
+        async with sessions.aio() as db:
+            yield db
+
+    monkeypatch.setitem(app.dependency_overrides, get_db, override_get_db)
+    monkeypatch.setitem(app.dependency_overrides, get_read_db, override_get_read_db)
+    monkeypatch.setitem(app.dependency_overrides, get_async_db, override_get_async_db)
+    monkeypatch.setitem(app.dependency_overrides, get_session_factory, lambda: sessions.sync)
+    # Same email + same second => same JWT; never let a principal outlive its row
+    principal_cache.clear()
+    dashboard_cache.invalidate()
+    rate_limiter.clear()
+    yield sessions
+    engine.dispose()
+    read_engine.dispose()
+
+@pytest.fixture
+def upload_dir(database, tmp_path):
+    return tmp_path / "uploads"
+
+@pytest.fixture(autouse=True)
+def no_rate_limit(monkeypatch):
+    # Every test client shares one IP; test_admission.py turns limiting back on
+    monkeypatch.setattr(settings, "rate_limit_enabled", False)
 
 @pytest.fixture
 def client():
     return TestClient(app)
 
 @pytest.fixture
-def db():
-    db = TestingSessionLocal()
+def db(database):
+    db = database.sync()
     try:
         yield db
     finally:
         db.close()
+
+@pytest.fixture
+def register_login(client):
+    """Register ``email`` and log in; returns the bearer headers."""
+    def register_login(email, password="password"):
+        client.post("/api/auth/register", json={"email": email, "password": password})
+        res = client.post("/api/auth/login", data={"username": email, "password": password})
+        return {"Authorization": f"Bearer {res.json()['access_token']}"}
+    return register_login
+
+@pytest.fixture
+def make_admin(client, db):
+    """Register ``email`` as an admin and log in; returns the bearer headers."""
+    def make_admin(email, password="password"):
+        client.post("/api/auth/register", json={"email": email, "password": password})
+        get_user_by_email(db, email).role = "admin"
+        db.commit()
+        res = client.post("/api/auth/login", data={"username": email, "password": password})
+        return {"Authorization": f"Bearer {res.json()['access_token']}"}
+    return make_admin
+
+@pytest.fixture
+def run_async(database):
+    """Run `fn(async_session)` to completion on a fresh event loop."""
+    def runner(fn):
+        async def main():
+            try:
+                async with database.aio() as adb:
+                    return await fn(adb)
+            finally:
+                await database.async_engine.dispose()
+        return asyncio.run(main())
+    return runner
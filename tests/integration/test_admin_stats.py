@@ -0,0 +1,78 @@
+"""
+test_admin_stats.py — /api/admin/stats reads the trigger-maintained daily rollup:
+from/to ranges, day/week/month buckets, and no scan of the ideas table.
+"""
+from datetime import datetime
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from src.app.crud.user import get_user_by_email
+from src.app.db import aggregates
+from src.app.models.idea import Idea
+
+def _seed(db, email):
+    """Mon 5 Jan (accepted), Wed 7 Jan x2 (one rejected), Mon 12 Jan, Tue 3 Feb 2026."""
+    user_id = get_user_by_email(db, email).id
+    days = [("2026-01-05 09:00", "accepted"), ("2026-01-07 10:00", "rejected"), ("2026-01-07 23:59", "submitted"),
+            ("2026-01-12 08:00", "submitted"), ("2026-02-03 12:00", "submitted")]
+    ideas = [Idea(title=f"Rollup {n}", description="Long enough description", category="AI", user_id=user_id,
+                  status=status, created_at=datetime.fromisoformat(at)) for n, (at, status) in enumerate(days)]
+    db.add_all(ideas)
+    db.commit()
+    return ideas
+
+
+def test_buckets_and_ranges(client, db, make_admin):
+    admin = make_admin("rollup_admin@example.com")
+    _seed(db, "rollup_admin@example.com")
+
+    daily = client.get("/api/admin/stats", headers=admin).json()
+    assert (daily["total"], daily["accepted"], daily["rejected"], daily["pending"]) == (5, 1, 1, 3)
+    assert daily["acceptance_rate"] == 20.0
+    assert [(b["date"], b["count"]) for b in daily["daily_submissions"]] == [
+        ("2026-01-05", 1), ("2026-01-07", 2), ("2026-01-12", 1), ("2026-02-03", 1)]
+
+    weekly = client.get("/api/admin/stats?bucket=week", headers=admin).json()
+    assert weekly["bucket"] == "week"
+    assert [(b["date"], b["count"], b["accepted"], b["rejected"]) for b in weekly["daily_submissions"]] == [
+        ("2026-01-05", 3, 1, 1), ("2026-01-12", 1, 0, 0), ("2026-02-02", 1, 0, 0)]
+
+    monthly = client.get("/api/admin/stats?bucket=month&from=2026-01-06&to=2026-02-28", headers=admin).json()
+    assert [(b["date"], b["count"]) for b in monthly["daily_submissions"]] == [("2026-01-01", 3), ("2026-02-01", 1)]
+    assert (monthly["total"], monthly["accepted"], monthly["rejected"]) == (4, 0, 1)
+
+
+def test_rollup_follows_evaluation_and_delete(client, db, make_admin):
+    admin = make_admin("rollup_writer@example.com")
+    ideas = _seed(db, "rollup_writer@example.com")
+
+    client.patch(f"/api/admin/ideas/{ideas[4].id}/evaluate", headers=admin, json={"status": "accepted"})
+    client.delete(f"/api/ideas/{ideas[0].id}", headers=admin)
+    stats = client.get("/api/admin/stats?from=2026-01-01&to=2026-02-28", headers=admin).json()
+    assert (stats["total"], stats["accepted"], stats["rejected"]) == (4, 1, 1)
+    assert stats["daily_submissions"][0]["date"] == "2026-01-07"  # the emptied day drops out
+    assert aggregates.reconcile(db.connection(), dry_run=True) == []
+
+
+def test_stats_never_read_the_ideas_table(client, db, make_admin):
+    admin = make_admin("rollup_reader@example.com")
+    _seed(db, "rollup_reader@example.com")
+
+    statements = []
+    def listener(conn, cursor, statement, *args):
+        statements.append(statement)
+    event.listen(Engine, "before_cursor_execute", listener)
+    try:
+        assert client.get("/api/admin/stats?bucket=month", headers=admin).json()["total"] == 5
+    finally:
+        event.remove(Engine, "before_cursor_execute", listener)
+    assert not any("FROM ideas" in s for s in statements)
+    assert sum("FROM idea_daily_stats" in s for s in statements) == 1
+
+
+def test_stats_parameters_are_validated(client, db, make_admin):
+    admin = make_admin("rollup_params@example.com")
+    assert client.get("/api/admin/stats?from=2026-02-01&to=2026-01-01", headers=admin).status_code == 400
+    assert client.get("/api/admin/stats?bucket=year", headers=admin).status_code == 422
+    assert client.get("/api/admin/stats?from=yesterday", headers=admin).status_code == 422
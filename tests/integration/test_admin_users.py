@@ -57,3 +57,69 @@ def test_self_role_demotion_prevention(client, db):
     )
     assert response.status_code == 400
     assert "cannot change your own role" in response.json()["detail"]
+
+def _seed_authors(client, db, counts):
+    """Register authors and give each ``(accepted, rejected, pending)`` ideas."""
+    from src.app.models.idea import Idea
+    for email, (accepted, rejected, pending) in counts.items():
+        client.post("/api/auth/register", json={"email": email, "password": "password"})
+        user_id = get_user_by_email(db, email).id
+        statuses = ["accepted"] * accepted + ["rejected"] * rejected + ["submitted"] * pending
+        db.add_all(Idea(title=f"Idea {n}", description="Long enough description", category="AI",
+                        user_id=user_id, status=s) for n, s in enumerate(statuses))
+    db.commit()
+
+def test_list_users_is_one_query_and_pages_by_sort(client, db):
+    from sqlalchemy import event
+    from sqlalchemy.engine import Engine
+    token = _make_admin(client, db, "pager@example.com")
+    headers = {"Authorization": f"Bearer {token}"}
+    _seed_authors(client, db, {
+        "ann@example.com": (3, 1, 0), "bob@example.com": (1, 0, 0), "cid@example.com": (0, 2, 1),
+        "dee@example.com": (2, 0, 0),
+    })
+
+    statements = []
+    def listener(conn, cursor, statement, *args):
+        statements.append(statement)
+    event.listen(Engine, "before_cursor_execute", listener)
+    try:
+        first = client.get("/api/admin/users?sort=total&limit=2", headers=headers)
+    finally:
+        event.remove(Engine, "before_cursor_execute", listener)
+    assert [u["email"] for u in first.json()] == ["ann@example.com", "cid@example.com"]
+    assert sum("FROM users" in s for s in statements) == 2  # the auth lookup and the page
+    assert not any("FROM ideas" in s for s in statements)
+
+    cursor = first.headers["X-Next-Cursor"]
+    rest = client.get(f"/api/admin/users?sort=total&limit=2&cursor={cursor}", headers=headers)
+    assert [u["email"] for u in rest.json()] == ["dee@example.com", "bob@example.com"]
+    last = client.get(f"/api/admin/users?sort=total&limit=2&cursor={rest.headers['X-Next-Cursor']}", headers=headers)
+    assert [u["email"] for u in last.json()] == ["pager@example.com"]
+    assert "X-Next-Cursor" not in last.headers
+
+    by_rate = client.get("/api/admin/users?sort=success_rate&limit=3", headers=headers).json()
+    assert [u["success_rate"] for u in by_rate] == [100.0, 100.0, 75.0]
+    assert {u["email"] for u in by_rate[:2]} == {"bob@example.com", "dee@example.com"}  # ties go by id
+    ascending = client.get("/api/admin/users?sort=accepted&order=asc&limit=2", headers=headers).json()
+    assert [u["accepted"] for u in ascending] == [0, 0]
+
+def test_list_users_filters_by_email(client, db):
+    token = _make_admin(client, db, "filterer@example.com")
+    headers = {"Authorization": f"Bearer {token}"}
+    for email in ("alpha_1@corp.io", "alpha%2@corp.io", "beta@corp.io"):
+        client.post("/api/auth/register", json={"email": email, "password": "password"})
+    assert [u["email"] for u in client.get("/api/admin/users?email=ALPHA", headers=headers).json()] == [
+        "alpha%2@corp.io", "alpha_1@corp.io"]
+    assert [u["email"] for u in client.get("/api/admin/users?email=a%25", headers=headers).json()] == [
+        "alpha%2@corp.io"]  # LIKE wildcards in the filter are literal
+    assert client.get("/api/admin/users?cursor=garbage", headers=headers).status_code == 400
+
+def test_role_update_returns_the_target_row(client, db):
+    token = _make_admin(client, db, "promoter@example.com")
+    _seed_authors(client, db, {"rising@example.com": (1, 1, 0)})
+    user_id = get_user_by_email(db, "rising@example.com").id
+    res = client.patch(f"/api/admin/users/{user_id}/role", json={"role": "admin"},
+                       headers={"Authorization": f"Bearer {token}"})
+    assert res.json() == {"id": user_id, "email": "rising@example.com", "role": "admin", "is_active": True,
+                          "total": 2, "accepted": 1, "rejected": 1, "success_rate": 50.0}
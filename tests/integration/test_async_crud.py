@@ -0,0 +1,166 @@
+"""
+test_async_crud.py — The async crud mirrors (src.app.crud.aio) against the test database.
+Each test drives its coroutine through the `run_async` fixture.
+"""
+import asyncio
+import importlib
+import inspect
+import pkgutil
+
+import pytest
+
+from src.app.core.config import settings
+from src.app.core.metrics import metrics
+from src.app import crud
+from src.app.crud import idea as crud_idea
+from src.app.crud.aio import idea as aio_idea
+from src.app.crud.aio import notification as aio_notification
+from src.app.crud.aio import tag as aio_tag
+from src.app.crud.aio import todo as aio_todo
+from src.app.crud.aio import user as aio_user
+from src.app.db import session
+from src.app.schemas.idea import IdeaCreate, IdeaEvaluationItem
+from src.app.schemas.todo import TodoCreate, TodoUpdate
+from src.app.schemas.user import UserCreate
+
+# Every sync crud module; a new one without an aio twin fails the parity test below
+SYNC_MODULES = sorted(m.name for m in pkgutil.iter_modules(crud.__path__) if not m.ispkg)
+
+
+def test_async_user_and_idea_roundtrip(run_async, db):
+    async def scenario(adb):
+        user = await aio_user.create_user(adb, UserCreate(email="async@example.com", password="password"))
+        idea = await aio_idea.create_idea(
+            adb, IdeaCreate(title="Async Idea", description="Created on the async path.", category="AI"), user_id=user.id
+        )
+        stats = await aio_idea.get_user_stats(adb, user.id)
+        return user.id, idea, stats
+
+    user_id, idea, stats = run_async(scenario)
+    assert idea.owner.email == "async@example.com"
+    assert stats["total"] == 1 and stats["pending"] == 1
+    # Visible through the sync crud as well
+    assert crud_idea.get_user_ideas(db, user_id=user_id)[0].title == "Async Idea"
+
+
+def test_async_todo_update_and_delete(run_async):
+    async def scenario(adb):
+        user = await aio_user.create_user(adb, UserCreate(email="async_todo@example.com", password="password"))
+        todo = await aio_todo.create_todo(adb, user.id, TodoCreate(title="Async task"))
+        updated = await aio_todo.update_todo(adb, todo.id, user.id, TodoUpdate(done=True))
+        other = await aio_todo.delete_todo(adb, todo.id, "someone-else")
+        deleted = await aio_todo.delete_todo(adb, todo.id, user.id)
+        return updated, other, deleted, await aio_todo.get_todos(adb, user.id)
+
+    updated, other, deleted, remaining = run_async(scenario)
+    assert updated.done is True
+    assert other is False and deleted is True
+    assert remaining == []
+
+
+def test_async_users_with_stats(run_async):
+    async def scenario(adb):
+        user = await aio_user.create_user(adb, UserCreate(email="async_stats@example.com", password="password"))
+        idea = await aio_idea.create_idea(
+            adb, IdeaCreate(title="Stat Idea", description="Counts towards stats.", category="AI"), user_id=user.id
+        )
+        await aio_idea.evaluate_idea(adb, idea.id, status="accepted")
+        return await aio_user.get_all_users_with_stats(adb)
+
+    rows = run_async(scenario)
+    assert rows == [{
+        "id": rows[0]["id"], "email": "async_stats@example.com", "role": "submitter", "is_active": True,
+        "total": 1, "accepted": 1, "rejected": 0, "success_rate": 100.0,
+    }]
+
+
+def test_async_keyset_page_matches_sync(run_async, db):
+    async def scenario(adb):
+        user = await aio_user.create_user(adb, UserCreate(email="async_pages@example.com", password="password"))
+        for n in range(5):
+            await aio_idea.create_idea(
+                adb, IdeaCreate(title=f"Paged {n}", description="Paged on the async path.", category="AI"), user_id=user.id
+            )
+        first = await aio_idea.get_user_ideas(adb, user.id, limit=2)
+        last = first[-1]
+        rest = await aio_idea.get_user_ideas(adb, user.id, after=(last.created_at, last.id))
+        return user.id, [i.id for i in first + rest]
+
+    user_id, ids = run_async(scenario)
+    assert ids == [i.id for i in crud_idea.get_user_ideas(db, user_id=user_id)]
+
+
+def test_async_search_finds_new_idea(run_async):
+    async def scenario(adb):
+        user = await aio_user.create_user(adb, UserCreate(email="async_search@example.com", password="password"))
+        await aio_idea.create_idea(
+            adb, IdeaCreate(title="Hydroponic farm", description="Indexed by the insert trigger.", category="AI"), user_id=user.id
+        )
+        return await aio_idea.search_ideas(adb, "hydro", user_id=user.id)
+
+    hits = run_async(scenario)
+    assert [h["row"]["title"] for h in hits] == ["Hydroponic farm"]
+    assert "\x02Hydroponic\x03" in hits[0]["snippet"]
+
+
+def test_async_sessions_stay_out_of_writer_queue(monkeypatch):
+    # aiosqlite sessions never take a writer-pool connection
+    monkeypatch.setattr(settings, "writer_pool_size", 0)
+    monkeypatch.setattr(settings, "writer_max_overflow", 0)
+
+    async def scenario():
+        sessions = session.get_async_db()
+        await anext(sessions)
+        try:
+            return session.writer_queue_depth(), metrics.gauge("db.async_sessions").value
+        finally:
+            await sessions.aclose()
+
+    depth, open_async = asyncio.run(scenario())
+    assert depth == 0 and open_async == 1
+    assert metrics.gauge("db.async_sessions").value == 0
+
+
+def _takes_session(fn):
+    params = list(inspect.signature(fn).parameters)
+    return bool(params) and params[0] == "db"
+
+
+@pytest.mark.parametrize("name", SYNC_MODULES)
+def test_every_sync_crud_function_has_an_async_mirror(name):
+    sync = importlib.import_module(f"src.app.crud.{name}")
+    aio = importlib.import_module(f"src.app.crud.aio.{name}")
+    for fn_name, fn in inspect.getmembers(sync, inspect.isfunction):
+        if fn.__module__ != sync.__name__ or not _takes_session(fn):
+            continue
+        mirror = getattr(aio, fn_name, None)
+        assert inspect.iscoroutinefunction(mirror), f"crud.aio.{name}.{fn_name} is missing"
+        expected = [(p.name, p.kind, p.default) for p in inspect.signature(fn).parameters.values()]
+        actual = [(p.name, p.kind, p.default) for p in inspect.signature(mirror).parameters.values()]
+        assert actual == expected, f"crud.aio.{name}.{fn_name} signature differs"
+
+
+def test_async_batch_evaluation_notifies_in_sequence(run_async):
+    async def scenario(adb):
+        user = await aio_user.create_user(adb, UserCreate(email="async_batch@example.com", password="password"))
+        ideas = [
+            await aio_idea.create_idea(
+                adb, IdeaCreate(title=f"Batch {n}", description="Reviewed in one batch.", category="AI", tags="AI"),
+                user_id=user.id,
+            )
+            for n in range(2)
+        ]
+        results = await aio_idea.evaluate_ideas(adb, [
+            IdeaEvaluationItem(idea_id=ideas[0].id, status="accepted", admin_comment="Good"),
+            IdeaEvaluationItem(idea_id="missing", status="rejected"),
+            IdeaEvaluationItem(idea_id=ideas[1].id, status="rejected"),
+        ], reviewed_by_id=user.id)
+        notes = await aio_notification.get_notifications_since(adb, user.id, since=0, limit=10)
+        rows = await aio_idea.get_user_idea_rows(adb, user.id)
+        return results, notes, rows, await aio_tag.get_facets(adb, user.id)
+
+    results, notes, rows, facets = run_async(scenario)
+    assert [r["ok"] for r in results] == [True, False, True]
+    assert [n.seq for n in notes] == [1, 2]
+    assert sorted(r["status"] for r in rows) == ["accepted", "rejected"]
+    assert facets["tags"] == [{"value": "ai", "count": 2}]
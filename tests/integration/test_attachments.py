@@ -0,0 +1,186 @@
+"""
+test_attachments.py — Idea uploads land in the content-addressed store: sharded by SHA-256,
+deduplicated with a reference count, capped in size while streaming, and measured. They are
+served with ETag/Range/immutable caching, and the collector reclaims what nothing references.
+"""
+import asyncio
+import hashlib
+import io
+import os
+
+import httpx
+import pytest
+
+from src.app.core import storage
+from src.app.core.config import settings
+from src.app.core.metrics import metrics
+from src.app.main import app
+from src.app.models.attachment import Attachment
+from src.app.models.idea import Idea
+from src.app.tasks import attachment_gc
+
+def _submit(client, headers, content: bytes, filename="deck.pdf", title="Shared deck"):
+    return client.post(
+        "/api/ideas",
+        data={"title": title, "description": "Long enough description", "category": "AI"},
+        files={"attachment": (filename, io.BytesIO(content), "application/pdf")},
+        headers=headers,
+    )
+
+def test_duplicate_uploads_share_one_blob(client, db, upload_dir, register_login):
+    headers = register_login("uploader@example.com")
+    content = b"%PDF-1.7 quarterly deck" * 100
+    sha256 = hashlib.sha256(content).hexdigest()
+
+    first = _submit(client, headers, content, filename="deck.pdf")
+    second = _submit(client, headers, content, filename="copy of deck.pdf", title="Same deck again")
+    assert first.status_code == second.status_code == 201
+    assert first.json()["file_path"] == second.json()["file_path"] == storage.relative_path(sha256)
+
+    blob = upload_dir / sha256[:2] / sha256[2:4] / sha256
+    assert blob.read_bytes() == content
+    assert [p for p in upload_dir.rglob("*") if p.is_file()] == [blob]
+    row = db.get(Attachment, sha256)
+    assert (row.size, row.refcount) == (len(content), 2)
+    names = {i.attachment_name for i in db.query(Idea).filter(Idea.attachment_sha256 == sha256)}
+    assert names == {"deck.pdf", "copy of deck.pdf"}
+
+
+def test_delete_releases_the_reference(client, db, upload_dir, register_login):
+    headers = register_login("releaser@example.com")
+    idea_id = _submit(client, headers, b"one of a kind").json()["id"]
+    sha256 = hashlib.sha256(b"one of a kind").hexdigest()
+
+    assert client.delete(f"/api/ideas/{idea_id}", headers=headers).status_code == 204
+    db.expire_all()
+    assert db.get(Attachment, sha256).refcount == 0
+    assert storage.blob_path(sha256).exists()  # collected later, not on the request path
+
+
+def test_oversized_upload_is_rejected_mid_stream(client, db, upload_dir, monkeypatch, register_login):
+    headers = register_login("big@example.com")
+    monkeypatch.setattr(settings, "upload_max_bytes", 1000)
+    monkeypatch.setattr(settings, "upload_chunk_bytes", 256)
+    rejected = metrics.counter("upload.rejected_too_large").value
+
+    res = _submit(client, headers, b"x" * 1001)
+    assert res.status_code == 413
+    assert db.query(Idea).count() == 0
+    assert [p for p in upload_dir.rglob("*") if p.is_file()] == []
+
+    # Streaming check, independent of the size the multipart parser reports
+    with pytest.raises(storage.UploadTooLargeError):
+        storage.store(io.BytesIO(b"x" * 1001))
+    assert os.listdir(upload_dir / ".tmp") == []
+    assert metrics.counter("upload.rejected_too_large").value == rejected + 2
+    assert _submit(client, headers, b"x" * 1000).status_code == 201
+
+
+def test_oversized_request_is_cut_off_while_received(client, db, upload_dir, monkeypatch, register_login):
+    headers = register_login("huge@example.com")
+    monkeypatch.setattr(settings, "upload_max_bytes", 1000)
+    monkeypatch.setattr(settings, "upload_form_overhead_bytes", 1000)
+    request = httpx.Request("POST", "http://testserver/api/ideas", headers=headers, files={
+        "attachment": ("deck.pdf", io.BytesIO(b"x" * 100_000), "application/pdf")},
+        data={"title": "Huge deck", "description": "Long enough description", "category": "AI"})
+    body = request.read()
+
+    # Content-Length over the cap: refused before the body is read
+    res = client.post("/api/ideas", content=body, headers=dict(request.headers))
+    assert res.status_code == 413 and res.json()["detail"] == "Attachment exceeds 1000 bytes"
+
+    # No Content-Length: cut off at the first chunk past the cap, not after the whole body
+    chunks = [body[i:i + 500] for i in range(0, len(body), 500)]
+    sent, messages = 0, []
+
+    async def receive():
+        nonlocal sent
+        sent += 1
+        return {"type": "http.request", "body": chunks[sent - 1], "more_body": sent < len(chunks)}
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {"type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "POST",
+             "scheme": "http", "path": "/api/ideas", "raw_path": b"/api/ideas", "query_string": b"",
+             "root_path": "", "client": ("127.0.0.1", 50000), "server": ("testserver", 80),
+             "headers": [(k.encode(), v.encode()) for k, v in request.headers.items() if k != "content-length"]}
+    asyncio.run(app(scope, receive, send))
+    assert messages[0]["status"] == 413
+    assert sent == 5  # 2000 bytes allowed: the fifth 500-byte chunk crosses it
+    assert db.query(Idea).count() == 0
+
+
+def test_uploads_are_timed(client, upload_dir, register_login):
+    headers = register_login("timed@example.com")
+    before = metrics.summary("upload.seconds").count
+    _submit(client, headers, b"timed content")
+    snapshot = metrics.snapshot()
+    assert snapshot["upload.seconds"]["count"] == before + 1
+    assert snapshot["upload.bytes"] >= len(b"timed content")
+    assert "upload.mib_per_second" in snapshot
+
+
+def test_attachment_endpoint_caches_and_ranges(client, db, upload_dir, register_login):
+    owner = register_login("owner_dl@example.com")
+    other = register_login("other_dl@example.com")
+    content = b"0123456789" * 10
+    idea_id = _submit(client, owner, content, filename="plan.pdf").json()["id"]
+    url = f"/api/ideas/{idea_id}/attachment"
+
+    res = client.get(url, headers=owner)
+    assert res.status_code == 200 and res.content == content
+    assert res.headers["etag"] == f'"{hashlib.sha256(content).hexdigest()}"'
+    assert "immutable" in res.headers["cache-control"]
+    assert res.headers["content-type"] == "application/pdf"
+    assert 'filename="plan.pdf"' in res.headers["content-disposition"]
+    assert res.headers["x-content-type-options"] == "nosniff"
+
+    assert client.get(url, headers=other).status_code == 403
+    not_modified = client.get(url, headers={**owner, "If-None-Match": res.headers["etag"]})
+    assert not_modified.status_code == 304 and not_modified.content == b""
+    partial = client.get(url, headers={**owner, "Range": "bytes=10-19"})
+    assert partial.status_code == 206 and partial.content == content[10:20]
+    assert partial.headers["content-range"] == f"bytes 10-19/{len(content)}"
+
+
+def test_legacy_attachments_are_served_and_revalidated(client, db, upload_dir, register_login):
+    headers = register_login("legacy_dl@example.com")
+    legacy = upload_dir / "0b9f-legacy.txt"
+    legacy.write_bytes(b"flat upload")
+    idea_id = _submit(client, headers, b"placeholder").json()["id"]
+    idea = db.get(Idea, idea_id)
+    idea.file_path, idea.attachment_sha256, idea.attachment_name = str(legacy), None, None
+    db.commit()
+
+    res = client.get(f"/api/ideas/{idea_id}/attachment", headers=headers)
+    assert res.status_code == 200 and res.content == b"flat upload"
+    assert res.headers["cache-control"] == "private, no-cache"
+    again = client.get(f"/api/ideas/{idea_id}/attachment", headers={**headers, "If-None-Match": res.headers["etag"]})
+    assert again.status_code == 304
+
+
+def test_gc_reclaims_only_unreferenced_files(client, db, upload_dir, register_login):
+    headers = register_login("gc@example.com")
+    kept_id = _submit(client, headers, b"still referenced").json()["id"]
+    gone_id = _submit(client, headers, b"about to be orphaned").json()["id"]
+    client.delete(f"/api/ideas/{gone_id}", headers=headers)
+    gone = storage.blob_path(hashlib.sha256(b"about to be orphaned").hexdigest())
+    kept = storage.blob_path(hashlib.sha256(b"still referenced").hexdigest())
+    (upload_dir / ".tmp" / "crashed-upload").write_bytes(b"partial")
+    (upload_dir / "old-flat.bin").write_bytes(b"nobody links me")
+
+    # Young files are inside the grace period
+    assert attachment_gc.collect(db, dry_run=False, grace_seconds=3600)["deleted_files"] == 0
+
+    report = attachment_gc.collect(db, dry_run=True, grace_seconds=0)
+    assert report["orphaned_files"] == 3
+    assert report["reclaimed_bytes"] == len(b"about to be orphaned") + len(b"partial") + len(b"nobody links me")
+    assert gone.exists()
+
+    stats = attachment_gc.collect(db, dry_run=False, grace_seconds=0)
+    assert stats["deleted_files"] == 3 and stats["reclaimed_bytes"] == report["reclaimed_bytes"]
+    assert not gone.exists() and kept.exists()
+    assert [a.sha256 for a in db.query(Attachment)] == [kept.name]
+    assert client.get(f"/api/ideas/{kept_id}/attachment", headers=headers).content == b"still referenced"
+    assert metrics.snapshot()["attachment_gc.last_run"]["deleted_files"] == 3
@@ -0,0 +1,77 @@
+"""
+test_batch_evaluation.py — POST /api/admin/ideas/evaluate:batch: one transaction, bulk
+updates per status, bulk-inserted author notifications, and per-item failure reporting.
+"""
+from sqlalchemy import event
+
+from src.app.crud.user import get_user_by_email
+from src.app.models.idea import Idea
+from src.app.models.notification import Notification
+
+def _ideas(db, email, count):
+    user_id = get_user_by_email(db, email).id
+    ideas = [Idea(title=f"Backlog {n}", description="Long enough description", category="AI", user_id=user_id)
+             for n in range(count)]
+    db.add_all(ideas)
+    db.commit()
+    return [i.id for i in ideas]
+
+
+def test_batch_applies_items_and_reports_failures(client, db, register_login, make_admin):
+    admin = make_admin("admin_batch@example.com")
+    register_login("author_batch@example.com")
+    ids = _ideas(db, "author_batch@example.com", 3)
+
+    res = client.post("/api/admin/ideas/evaluate:batch", headers=admin, json={"items": [
+        {"idea_id": ids[0], "status": "accepted", "admin_comment": "Ship it"},
+        {"idea_id": ids[1], "status": "rejected", "admin_comment": "Out of scope"},
+        {"idea_id": "missing", "status": "accepted"},
+        {"idea_id": ids[2], "status": "accepted"},
+        {"idea_id": ids[0], "status": "rejected"},
+    ]})
+    assert res.status_code == 200
+    body = res.json()
+    assert (body["succeeded"], body["failed"]) == (3, 2)
+    assert [r["ok"] for r in body["results"]] == [True, True, False, True, False]
+    assert body["results"][2]["error"] == "Idea not found"
+
+    db.expire_all()
+    reviewer_id = get_user_by_email(db, "admin_batch@example.com").id
+    got = {i.id: (i.status, i.admin_comment, i.reviewed_by_id) for i in db.query(Idea)}
+    assert got == {
+        ids[0]: ("accepted", "Ship it", reviewer_id),
+        ids[1]: ("rejected", "Out of scope", reviewer_id),
+        ids[2]: ("accepted", None, reviewer_id),
+    }
+    notes = db.query(Notification).filter(Notification.type == "idea_review").all()
+    assert len(notes) == 3
+    assert {n.user_id for n in notes} == {get_user_by_email(db, "author_batch@example.com").id}
+
+
+def test_batch_cost_does_not_grow_with_size(client, db, register_login, make_admin):
+    admin = make_admin("admin_bulk@example.com")
+    register_login("author_bulk@example.com")
+    ids = _ideas(db, "author_bulk@example.com", 120)
+    items = [{"idea_id": i, "status": "accepted" if n % 2 else "rejected", "admin_comment": f"#{n}"}
+             for n, i in enumerate(ids)]
+
+    engine, statements = db.get_bind(), []
+    def listener(conn, cursor, statement, *args):
+        statements.append(statement)
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        res = client.post("/api/admin/ideas/evaluate:batch", headers=admin, json={"items": items})
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+    assert res.json()["succeeded"] == 120
+    assert sum(s.startswith("UPDATE ideas") for s in statements) == 2
+    assert sum(s.startswith("INSERT INTO notifications") for s in statements) == 1
+
+
+def test_batch_requires_admin_and_bounds_size(client, db, register_login, make_admin):
+    user = register_login("plain_batch@example.com")
+    item = {"idea_id": "x", "status": "accepted"}
+    assert client.post("/api/admin/ideas/evaluate:batch", headers=user, json={"items": [item]}).status_code == 403
+    admin = make_admin("admin_bounds@example.com")
+    assert client.post("/api/admin/ideas/evaluate:batch", headers=admin, json={"items": []}).status_code == 422
+    assert client.post("/api/admin/ideas/evaluate:batch", headers=admin, json={"items": [item] * 201}).status_code == 422
@@ -0,0 +1,103 @@
+"""
+test_conditional_get.py — Per-user list endpoints carry a weak ETag built from a version
+counter that triggers bump on every write; a current If-None-Match gets 304 without the list query.
+"""
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from src.app.crud.user import get_user_by_email
+
+def _revalidate(client, url, headers, etag):
+    return client.get(url, headers={**headers, "If-None-Match": etag})
+
+
+def test_unchanged_list_is_304_without_the_list_query(client, db, register_login):
+    headers = register_login("etag_todos@example.com")
+    client.post("/api/todos", headers=headers, json={"title": "Write the report"})
+    first = client.get("/api/todos", headers=headers)
+    etag = first.headers["etag"]
+    assert etag.startswith('W/"todos-') and first.headers["cache-control"] == "private, no-cache"
+
+    statements = []
+    def listener(conn, cursor, statement, *args):
+        statements.append(statement)
+    event.listen(Engine, "before_cursor_execute", listener)
+    try:
+        res = _revalidate(client, "/api/todos", headers, etag)
+    finally:
+        event.remove(Engine, "before_cursor_execute", listener)
+    assert res.status_code == 304 and res.content == b""
+    assert res.headers["etag"] == etag
+    assert not any("FROM todos" in s for s in statements)
+
+    todo_id = first.json()[0]["id"]
+    client.patch(f"/api/todos/{todo_id}", headers=headers, json={"done": True})
+    changed = _revalidate(client, "/api/todos", headers, etag)
+    assert changed.status_code == 200 and changed.json()[0]["done"] is True
+    assert changed.headers["etag"] != etag
+    client.delete(f"/api/todos/{todo_id}", headers=headers)
+    assert _revalidate(client, "/api/todos", headers, changed.headers["etag"]).status_code == 200
+
+
+def test_other_users_writes_move_only_their_own_versions(client, db, register_login, make_admin):
+    admin = make_admin("etag_admin@example.com")
+    author = register_login("etag_author@example.com")
+    bystander = register_login("etag_bystander@example.com")
+    idea_id = client.post("/api/ideas", headers=author, data={
+        "title": "Versioned idea", "description": "Long enough description", "category": "AI"}).json()["id"]
+
+    ideas = client.get("/api/ideas", headers=author).headers["etag"]
+    notes = client.get("/api/notifications", headers=author).headers["etag"]
+    quiet = client.get("/api/notifications", headers=bystander).headers["etag"]
+    assert quiet != notes
+
+    # A batch evaluation updates the author's idea and notifies them, in bulk statements
+    client.post("/api/admin/ideas/evaluate:batch", headers=admin, json={"items": [{"idea_id": idea_id, "status": "accepted"}]})
+    assert _revalidate(client, "/api/ideas", author, ideas).status_code == 200
+    notes_after = _revalidate(client, "/api/notifications", author, notes)
+    assert notes_after.status_code == 200 and len(notes_after.json()) == 1
+    assert _revalidate(client, "/api/notifications", bystander, quiet).status_code == 304
+
+    client.patch("/api/notifications/read", headers=author)
+    assert _revalidate(client, "/api/notifications", author, notes_after.headers["etag"]).status_code == 200
+
+
+def test_etag_varies_with_the_query(client, db, register_login):
+    headers = register_login("etag_query@example.com")
+    client.post("/api/events", headers=headers, json={"title": "Demo day", "date": "2026-11-02"})
+    events = client.get("/api/events", headers=headers)
+    assert _revalidate(client, "/api/events", headers, events.headers["etag"]).status_code == 304
+
+    page = client.get("/api/ideas?limit=5", headers=headers).headers["etag"]
+    assert _revalidate(client, "/api/ideas?limit=10", headers, page).status_code == 200
+    assert _revalidate(client, "/api/ideas?limit=5", headers, f"{page}, \"other\"").status_code == 304
+
+
+def test_profile_change_moves_the_ideas_lists_that_embed_it(client, db, register_login, make_admin):
+    admin = make_admin("etag_reviewer@example.com")
+    author = register_login("etag_profiled@example.com")
+    bystander = register_login("etag_unrelated@example.com")
+    idea_id = client.post("/api/ideas", headers=author, data={
+        "title": "Reviewed idea", "description": "Long enough description", "category": "AI"}).json()["id"]
+    client.patch(f"/api/admin/ideas/{idea_id}/evaluate", headers=admin, json={"status": "accepted", "admin_comment": "Nice"})
+    ideas = client.get("/api/ideas", headers=author).headers["etag"]
+    quiet = client.get("/api/ideas", headers=bystander).headers["etag"]
+
+    # The reviewer's new avatar is embedded in the author's list
+    client.put("/api/users/me/profile", headers=admin, json={"avatar_url": "https://example.com/new.png"})
+    res = _revalidate(client, "/api/ideas", author, ideas)
+    assert res.status_code == 200
+    assert res.json()[0]["reviewer"]["avatar_url"] == "https://example.com/new.png"
+    assert _revalidate(client, "/api/ideas", bystander, quiet).status_code == 304
+
+    # So is the author's own
+    ideas = res.headers["etag"]
+    client.put("/api/users/me/profile", headers=author, json={"bio": "Builder"})
+    res = _revalidate(client, "/api/ideas", author, ideas)
+    assert res.status_code == 200 and res.json()[0]["author"]["bio"] == "Builder"
+
+    # Writes that touch no embedded field leave it alone
+    ideas = res.headers["etag"]
+    get_user_by_email(db, "etag_profiled@example.com").is_active = True
+    db.commit()
+    assert _revalidate(client, "/api/ideas", author, ideas).status_code == 304
@@ -0,0 +1,88 @@
+"""
+test_dashboard.py — GET /api/admin/dashboard: one payload for the admin dashboard, served
+from a short-TTL snapshot that concurrent misses build once and idea writes invalidate.
+"""
+import threading
+import time
+
+from src.app.api import admin as admin_api
+from src.app.core.cache import SingleFlightCache
+from src.app.core.dashboard_cache import dashboard_cache
+
+def _submit(client, headers, title):
+    res = client.post("/api/ideas", headers=headers,
+                      data={"title": title, "description": "Long enough description", "category": "AI"})
+    return res.json()["id"]
+
+
+def test_dashboard_bundles_stats_ideas_and_users(client, db, register_login, make_admin):
+    admin = make_admin("dash_admin@example.com")
+    author = register_login("dash_author@example.com")
+    ids = [_submit(client, author, f"Dashboard idea {n}") for n in range(3)]
+
+    res = client.get("/api/admin/dashboard", headers=admin)
+    assert res.status_code == 200
+    body = res.json()
+    assert body["stats"]["total"] == 3 and body["stats"]["pending"] == 3
+    assert [i["id"] for i in body["ideas"]] == ids[::-1]
+    assert body["ideas_next_cursor"] is None
+    assert body["top_users"][0]["email"] == "dash_author@example.com"
+    assert body["top_users"][0]["total"] == 3
+
+    assert client.get("/api/admin/dashboard", headers=author).status_code == 403
+
+
+def test_snapshot_is_cached_until_an_idea_changes(client, db, register_login, make_admin):
+    admin = make_admin("dash_cache@example.com")
+    author = register_login("dash_writer@example.com")
+    idea_id = _submit(client, author, "Cached idea")
+
+    first = client.get("/api/admin/dashboard", headers=admin).json()
+    computations = dashboard_cache.computations
+    assert client.get("/api/admin/dashboard", headers=admin).json() == first
+    assert dashboard_cache.computations == computations
+
+    client.patch(f"/api/admin/ideas/{idea_id}/evaluate", headers=admin, json={"status": "accepted"})
+    after = client.get("/api/admin/dashboard", headers=admin).json()
+    assert after["stats"]["accepted"] == 1
+    assert after["ideas"][0]["status"] == "accepted"
+    assert dashboard_cache.computations == computations + 1
+
+    client.delete(f"/api/ideas/{idea_id}", headers=author)
+    assert client.get("/api/admin/dashboard", headers=admin).json()["stats"]["total"] == 0
+
+
+def test_concurrent_misses_build_once(client, db, monkeypatch, make_admin):
+    admin = make_admin("dash_herd@example.com")
+    real_build, builds = admin_api._dashboard_snapshot, []
+
+    def slow_build(session):
+        builds.append(1)
+        time.sleep(0.2)  # long enough for every request to arrive while the first is building
+        return real_build(session)
+
+    monkeypatch.setattr(admin_api, "_dashboard_snapshot", slow_build)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(client.get("/api/admin/dashboard", headers=admin)))
+               for _ in range(6)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert [r.status_code for r in results] == [200] * 6
+    assert len({r.content for r in results}) == 1
+    assert len(builds) == 1
+
+
+def test_invalidate_during_a_build_is_not_cached():
+    cache, calls = SingleFlightCache(maxsize=1, ttl=60), []
+
+    def build():
+        calls.append(1)
+        if len(calls) == 1:
+            cache.invalidate()  # a write commits while the first snapshot is being built
+        return len(calls)
+
+    assert cache.get("k", build) == 1  # handed to its caller, but not kept
+    assert cache.get("k", build) == 2
+    assert cache.get("k", lambda: 99) == 2
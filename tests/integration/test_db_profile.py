@@ -0,0 +1,37 @@
+"""
+test_db_profile.py — The SQLite connection profile applied by src.app.db.session.
+"""
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+from src.app.db.session import apply_sqlite_profile
+
+
+def _engines(tmp_path):
+    url = f"sqlite:///{tmp_path / 'profile.db'}"
+    writer = create_engine(url)
+    reader = create_engine(url)
+    apply_sqlite_profile(writer)
+    apply_sqlite_profile(reader, read_only=True)
+    return writer, reader
+
+
+def test_writer_profile_pragmas(tmp_path):
+    writer, _ = _engines(tmp_path)
+    with writer.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+        assert conn.execute(text("PRAGMA foreign_keys")).scalar() == 1
+        assert conn.execute(text("PRAGMA busy_timeout")).scalar() == 5000
+        assert conn.execute(text("PRAGMA query_only")).scalar() == 0
+
+
+def test_reader_is_query_only_and_sees_committed_rows(tmp_path):
+    writer, reader = _engines(tmp_path)
+    with writer.begin() as conn:
+        conn.execute(text("CREATE TABLE t (x INTEGER)"))
+        conn.execute(text("INSERT INTO t VALUES (1)"))
+    with reader.connect() as conn:
+        assert conn.execute(text("SELECT count(*) FROM t")).scalar() == 1
+        with pytest.raises(OperationalError):
+            conn.execute(text("INSERT INTO t VALUES (2)"))
@@ -0,0 +1,133 @@
+"""
+test_migrations.py — The Alembic chain reproduces the models, including every declared index.
+"""
+from pathlib import Path
+
+import pytest
+from alembic import command
+from alembic.config import Config
+from alembic.util.exc import AutogenerateDiffsDetected
+from sqlalchemy import create_engine, inspect, text
+from src.app.db.indexes import missing_indexes
+
+ROOT = Path(__file__).resolve().parents[2]
+
+
+def _alembic(url: str) -> Config:
+    cfg = Config(str(ROOT / "alembic.ini"))
+    cfg.set_main_option("sqlalchemy.url", url)
+    cfg.attributes["configure_logger"] = False
+    return cfg
+
+
+def test_upgrade_head_matches_models(tmp_path):
+    url = f"sqlite:///{tmp_path / 'fresh.db'}"
+    cfg = _alembic(url)
+    command.upgrade(cfg, "head")
+    assert missing_indexes(create_engine(url)) == []
+    command.check(cfg)  # raises if autogenerate sees any model/DB drift
+
+
+def test_check_reports_missing_index(tmp_path):
+    url = f"sqlite:///{tmp_path / 'drift.db'}"
+    command.upgrade(_alembic(url), "head")
+    engine = create_engine(url)
+    with engine.begin() as conn:
+        conn.execute(text("DROP INDEX ix_todos_user_id_date"))
+    assert missing_indexes(engine) == ["todos.ix_todos_user_id_date"]
+    with pytest.raises(AutogenerateDiffsDetected):
+        command.check(_alembic(url))
+
+
+def test_upgrade_legacy_database_keeps_rows(tmp_path):
+    """A pre-Phase-2 database (no social/rich columns) is upgraded in place."""
+    url = f"sqlite:///{tmp_path / 'legacy.db'}"
+    engine = create_engine(url)
+    with engine.begin() as conn:
+        conn.execute(text(
+            "CREATE TABLE users (id VARCHAR PRIMARY KEY, email VARCHAR NOT NULL, "
+            "hashed_password VARCHAR NOT NULL, role VARCHAR, is_active BOOLEAN)"
+        ))
+        conn.execute(text("INSERT INTO users VALUES ('u1', 'old@example.com', 'x', 'admin', 1)"))
+
+    command.upgrade(_alembic(url), "head")
+
+    columns = {c["name"] for c in inspect(engine).get_columns("users")}
+    assert {"avatar_url", "bio", "github_link", "linkedin_link", "studio_name"} <= columns
+    with engine.connect() as conn:
+        assert conn.execute(text("SELECT email FROM users")).scalar() == "old@example.com"
+    assert missing_indexes(engine) == []
+
+
+def test_tag_backfill_normalises_existing_ideas(tmp_path):
+    url = f"sqlite:///{tmp_path / 'tags.db'}"
+    cfg = _alembic(url)
+    command.upgrade(cfg, "0004")
+    engine = create_engine(url)
+    with engine.begin() as conn:
+        conn.execute(text("INSERT INTO users (id, email, hashed_password) VALUES ('u1', 'a@example.com', 'x')"))
+        for idea_id, tags in [("i1", "AI, LLM"), ("i2", '["ai","Cloud"]'), ("i3", None)]:
+            conn.execute(text(
+                "INSERT INTO ideas (id, title, description, category, user_id, tags) "
+                "VALUES (:id, 'T', 'Description', 'AI', 'u1', :tags)"
+            ), {"id": idea_id, "tags": tags})
+
+    command.upgrade(cfg, "head")
+
+    with engine.connect() as conn:
+        assert [r[0] for r in conn.execute(text("SELECT name FROM tags ORDER BY name"))] == ["ai", "cloud", "llm"]
+        links = conn.execute(text(
+            "SELECT idea_id, name FROM idea_tags JOIN tags ON tags.id = tag_id ORDER BY idea_id, name"
+        )).all()
+    assert links == [("i1", "ai"), ("i1", "llm"), ("i2", "ai"), ("i2", "cloud")]
+
+
+def test_notification_numbering_backfills_in_created_order(tmp_path):
+    url = f"sqlite:///{tmp_path / 'seq.db'}"
+    cfg = _alembic(url)
+    command.upgrade(cfg, "0010")
+    engine = create_engine(url)
+    with engine.begin() as conn:
+        for user_id in ("u1", "u2"):
+            conn.execute(text("INSERT INTO users (id, email, hashed_password) VALUES (:id, :id, 'x')"), {"id": user_id})
+        for notif_id, user_id, created_at in [("n1", "u1", "2026-01-02"), ("n2", "u1", "2026-01-01"), ("n3", "u2", "2026-01-03")]:
+            conn.execute(text(
+                "INSERT INTO notifications (id, user_id, message, is_read, type, created_at) "
+                "VALUES (:id, :user_id, 'M', 0, 'new_idea', :created_at)"
+            ), {"id": notif_id, "user_id": user_id, "created_at": created_at})
+
+    command.upgrade(cfg, "head")
+
+    with engine.begin() as conn:
+        conn.execute(text("INSERT INTO notifications (id, user_id, message, is_read, type) VALUES ('n4', 'u1', 'M', 0, 'new_idea')"))
+        assert conn.execute(text("SELECT id, seq FROM notifications ORDER BY id")).all() == [
+            ("n1", 2), ("n2", 1), ("n3", 1), ("n4", 3)]
+
+
+def test_search_docids_start_from_existing_rowids(tmp_path):
+    url = f"sqlite:///{tmp_path / 'docid.db'}"
+    cfg = _alembic(url)
+    command.upgrade(cfg, "0011")
+    engine = create_engine(url)
+    with engine.begin() as conn:
+        conn.execute(text("INSERT INTO users (id, email, hashed_password) VALUES ('u1', 'a@example.com', 'x')"))
+        for idea_id, title in [("i1", "Solar carport"), ("i2", "Solar rooftop")]:
+            conn.execute(text(
+                "INSERT INTO ideas (id, title, description, category, user_id) VALUES (:id, :title, 'D', 'AI', 'u1')"
+            ), {"id": idea_id, "title": title})
+
+    command.upgrade(cfg, "head")
+
+    match = "SELECT ideas.id FROM ideas_fts JOIN ideas ON ideas.search_docid = ideas_fts.rowid WHERE ideas_fts MATCH :q"
+    with engine.begin() as conn:
+        assert conn.execute(text("SELECT count(*) FROM ideas WHERE search_docid IS NOT rowid")).scalar() == 0
+        conn.execute(text("INSERT INTO ideas (id, title, description, category, user_id) VALUES ('i3', 'Solar bus', 'D', 'AI', 'u1')"))
+        assert conn.execute(text("SELECT search_docid FROM ideas WHERE id = 'i3'")).scalar() == 3
+        assert sorted(r[0] for r in conn.execute(text(match), {"q": "solar"})) == ["i1", "i2", "i3"]
+
+    command.downgrade(cfg, "0011")
+    with engine.connect() as conn:
+        hits = conn.execute(text(
+            "SELECT ideas.id FROM ideas_fts JOIN ideas ON ideas.rowid = ideas_fts.rowid WHERE ideas_fts MATCH 'solar'"
+        ))
+        assert sorted(r[0] for r in hits) == ["i1", "i2", "i3"]
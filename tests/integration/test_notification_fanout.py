@@ -0,0 +1,75 @@
+"""
+test_notification_fanout.py — New-idea alerts to admins are written after the response by a
+background task: one bulk insert, retried with backoff, with lag and failure metrics.
+"""
+from sqlalchemy import event
+
+from src.app.core.config import settings
+from src.app.core.metrics import metrics
+from src.app.crud import notification as crud_notif
+from src.app.models.notification import Notification
+
+def _make_admins(make_admin, count):
+    for n in range(count):
+        make_admin(f"fanout_admin{n}@example.com")
+
+def _submit(client, headers, title="Fan-out idea"):
+    return client.post("/api/ideas", headers=headers,
+                       data={"title": title, "description": "Long enough description", "category": "AI"})
+
+
+def test_admins_are_notified_with_one_insert(client, db, register_login, make_admin):
+    _make_admins(make_admin, 5)
+    headers = register_login("fanout_author@example.com")
+    lag_count = metrics.summary("notifications.fanout_lag_seconds").count
+
+    engine, statements = db.get_bind(), []
+    def listener(conn, cursor, statement, *args):
+        statements.append(statement)
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        assert _submit(client, headers).status_code == 201
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+    notes = db.query(Notification).filter(Notification.type == "new_idea").all()
+    assert len(notes) == 5
+    assert all("fanout_author@example.com" in n.message for n in notes)
+    assert sum(s.startswith("INSERT INTO notifications") for s in statements) == 1
+    assert metrics.summary("notifications.fanout_lag_seconds").count == lag_count + 1
+
+
+def test_failed_fanout_is_retried(client, db, monkeypatch, register_login, make_admin):
+    _make_admins(make_admin, 2)
+    headers = register_login("retry_author@example.com")
+    monkeypatch.setattr(settings, "fanout_retry_delay_ms", 1)
+    real_insert, calls = crud_notif.create_notifications, []
+
+    def flaky(session, notifs):
+        calls.append(len(notifs))
+        if len(calls) == 1:
+            raise RuntimeError("database is locked")
+        return real_insert(session, notifs)
+
+    monkeypatch.setattr(crud_notif, "create_notifications", flaky)
+    retries = metrics.counter("notifications.fanout_retries").value
+    assert _submit(client, headers).status_code == 201
+    assert calls == [2, 2]
+    assert db.query(Notification).filter(Notification.type == "new_idea").count() == 2
+    assert metrics.counter("notifications.fanout_retries").value == retries + 1
+
+
+def test_fanout_gives_up_after_max_attempts(client, db, monkeypatch, register_login, make_admin):
+    _make_admins(make_admin, 1)
+    headers = register_login("doomed_author@example.com")
+    monkeypatch.setattr(settings, "fanout_retry_delay_ms", 1)
+    monkeypatch.setattr(settings, "fanout_max_attempts", 2)
+
+    def broken(session, notifs):
+        raise RuntimeError("disk I/O error")
+
+    monkeypatch.setattr(crud_notif, "create_notifications", broken)
+    failed = metrics.counter("notifications.fanout_failed").value
+    assert _submit(client, headers).status_code == 201  # the idea itself is saved
+    assert db.query(Notification).count() == 0
+    assert metrics.counter("notifications.fanout_failed").value == failed + 1
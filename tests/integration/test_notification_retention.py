@@ -0,0 +1,74 @@
+"""
+test_notification_retention.py — The retention pruner drops read notifications past their age
+and everything past the per-user cap, in batches, keeping the unread counters right, and
+archives what it deletes as gzipped NDJSON.
+"""
+import gzip
+import json
+from datetime import datetime, timedelta
+
+from src.app.core.config import settings
+from src.app.core.metrics import metrics
+from src.app.crud import notification as crud_notif
+from src.app.crud.user import get_user_by_email
+from src.app.models.notification import Notification
+from src.app.models.stats import UserNotificationStats
+from src.app.tasks import notification_retention
+
+def _register(client, db, email, password="password"):
+    client.post("/api/auth/register", json={"email": email, "password": password})
+    return get_user_by_email(db, email).id
+
+def _add(db, user_id, message, days_old, is_read):
+    db.add(Notification(user_id=user_id, message=message, type="new_idea", is_read=is_read,
+                        created_at=datetime.utcnow() - timedelta(days=days_old)))
+    db.commit()
+
+def _messages(db, user_id):
+    return sorted(n.message for n in db.query(Notification).filter(Notification.user_id == user_id))
+
+
+def test_prune_applies_age_and_cap_in_batches(client, db, monkeypatch):
+    monkeypatch.setattr(settings, "notification_retention_batch_size", 2)
+    monkeypatch.setattr(settings, "notification_retention_pause_ms", 0)
+    reader = _register(client, db, "reader@example.com")
+    _add(db, reader, "old read", 40, True)
+    _add(db, reader, "old unread", 40, False)
+    _add(db, reader, "new read", 1, True)
+    hoarder = _register(client, db, "hoarder@example.com")
+    for n in range(6):
+        _add(db, hoarder, f"unread {n}", 10 - n, False)
+
+    report = notification_retention.prune(db, dry_run=True, read_days=30, max_per_user=3)
+    assert report["deleted_rows"] == 4 and report["batches"] == 0
+    assert len(_messages(db, hoarder)) == 6
+
+    stats = notification_retention.prune(db, read_days=30, max_per_user=3)
+    assert stats["deleted_rows"] == 4
+    assert stats["batches"] == 3  # the hoarder's three oldest, two at a time
+    assert _messages(db, reader) == ["new read", "old unread"]
+    assert _messages(db, hoarder) == ["unread 3", "unread 4", "unread 5"]
+    assert crud_notif.get_unread_count(db, hoarder) == 3
+    assert db.get(UserNotificationStats, reader).total == 2
+    assert metrics.snapshot()["notification_retention.last_run"]["deleted_rows"] == 4
+
+    assert notification_retention.prune(db, read_days=30, max_per_user=3)["deleted_rows"] == 0
+    assert notification_retention.prune(db, read_days=0, max_per_user=0)["users_checked"] == 0
+
+
+def test_prune_archives_deleted_rows(client, db, tmp_path):
+    archive_dir = tmp_path / "archive"
+    user_id = _register(client, db, "archived@example.com")
+    _add(db, user_id, "Archived", 100, True)
+    _add(db, user_id, "Kept", 100, False)
+
+    stats = notification_retention.prune(db, read_days=30, max_per_user=0, archive_dir=str(archive_dir))
+    assert stats["deleted_rows"] == 1
+    with gzip.open(stats["archive"], "rt") as f:
+        [row] = [json.loads(line) for line in f]
+    assert row["message"] == "Archived" and row["user_id"] == user_id and row["is_read"] is True
+    assert _messages(db, user_id) == ["Kept"]
+
+    # Nothing to delete: no archive file is written
+    assert notification_retention.prune(db, read_days=30, max_per_user=0, archive_dir=str(archive_dir))["archive"] is None
+    assert len(list(archive_dir.iterdir())) == 1
@@ -0,0 +1,178 @@
+"""
+test_notification_stream.py — GET /api/notifications/stream: notifications pushed as they are
+committed, heartbeats while idle, Last-Event-ID catch-up, and the per-user connection cap.
+"""
+import asyncio
+import json
+from datetime import datetime, timedelta
+
+from src.app.core import notification_stream
+from src.app.core.config import settings
+from src.app.core.metrics import metrics
+from src.app.crud import notification as crud_notif
+from src.app.crud.user import get_user_by_email
+from src.app.main import app
+from src.app.models.notification import Notification
+from src.app.schemas.notification import NotificationCreate
+
+class _Stream:
+    """Drives the ASGI app directly: TestClient would wait for the endless body to end."""
+
+    def __init__(self, headers: dict):
+        self.headers = [(k.lower().encode(), v.encode()) for k, v in headers.items()]
+        self.status = None
+        self.buffer = b""
+        self._chunks: asyncio.Queue = asyncio.Queue()
+        self._disconnect = asyncio.Event()
+
+    async def __aenter__(self):
+        scope = {"type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+                 "scheme": "http", "path": "/api/notifications/stream", "raw_path": b"/api/notifications/stream",
+                 "query_string": b"", "root_path": "", "headers": self.headers,
+                 "client": ("127.0.0.1", 50000), "server": ("testserver", 80)}
+
+        async def receive():
+            await self._disconnect.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            if message["type"] == "http.response.start":
+                self.status = message["status"]
+            await self._chunks.put(message.get("body", b""))
+
+        self._task = asyncio.create_task(app(scope, receive, send))
+        await self._chunks.get()  # response start
+        return self
+
+    async def frames(self, count: int, timeout: float = 2.0) -> list[str]:
+        while self.buffer.count(b"\n\n") < count:
+            self.buffer += await asyncio.wait_for(self._chunks.get(), timeout)
+        *frames, self.buffer = self.buffer.split(b"\n\n", count)
+        return [f.decode() for f in frames]
+
+    async def ended(self, timeout: float = 0.2) -> bool:
+        try:
+            await asyncio.wait_for(asyncio.shield(self._task), timeout)
+            return True
+        except TimeoutError:
+            return False
+
+    async def __aexit__(self, *exc):
+        self._disconnect.set()
+        await asyncio.wait_for(self._task, 2.0)
+
+def _data(frame: str) -> dict:
+    return json.loads(frame.split("data: ", 1)[1])
+
+def _event_id(frame: str) -> str:
+    return frame.split("id: ", 1)[1].split("\n", 1)[0]
+
+def _notify(db, user_id, message):
+    crud_notif.create_notification(db, NotificationCreate(user_id=user_id, message=message, type="task_assigned"))
+
+
+def test_stream_pushes_new_notifications(client, db, monkeypatch, register_login):
+    headers = register_login("stream_user@example.com")
+    user_id = get_user_by_email(db, "stream_user@example.com").id
+    monkeypatch.setattr(settings, "sse_heartbeat_seconds", 0.05)
+
+    async def scenario():
+        async with _Stream(headers) as stream:
+            assert stream.status == 200
+            retry, heartbeat = await stream.frames(2)
+            assert retry == f"retry: {settings.sse_retry_ms}"
+            assert heartbeat == ": keepalive"
+            assert notification_stream.notification_broker.subscriber_count(f"user:{user_id}") == 1
+            assert metrics.gauge("http.in_flight").value == 0  # open streams don't count toward shedding
+            _notify(db, user_id, "First")
+            _notify(db, user_id, "Second")
+            pushed = [f for f in await stream.frames(4) if f.startswith("id: ")]
+            while len(pushed) < 2:
+                pushed += [f for f in await stream.frames(1) if f.startswith("id: ")]
+            return pushed
+
+    first, second = asyncio.run(scenario())
+    assert "event: notification" in first
+    assert [_data(first)["message"], _data(second)["message"]] == ["First", "Second"]
+    assert _data(first)["user_id"] == user_id and _data(first)["is_read"] is False
+    assert notification_stream.notification_broker.subscriber_count(f"user:{user_id}") == 0
+
+
+def test_last_event_id_replays_missed_notifications(client, db, monkeypatch, register_login):
+    headers = register_login("resume_user@example.com")
+    user_id = get_user_by_email(db, "resume_user@example.com").id
+    monkeypatch.setattr(settings, "sse_replay_limit", 2)
+    for n in range(4):
+        _notify(db, user_id, f"Note {n}")
+
+    async def scenario(last_event_id, count):
+        async with _Stream({**headers, "Last-Event-ID": last_event_id}) as stream:
+            frames = await stream.frames(count + 1)
+            return frames[1:], await stream.ended()
+
+    first = notification_stream.frame(crud_notif.get_user_notifications(db, user_id)[-1])[1].decode()
+    assert _data(first)["message"] == "Note 0"
+    replayed, ended = asyncio.run(scenario(_event_id(first), 2))
+    assert [_data(f)["message"] for f in replayed] == ["Note 1", "Note 2"]
+    assert ended  # more than the replay limit was missed: the reconnect picks up the rest
+    rest, ended = asyncio.run(scenario(_event_id(replayed[-1]), 1))
+    assert [_data(f)["message"] for f in rest] == ["Note 3"]
+    assert not ended
+
+
+def test_replay_follows_commit_order_not_timestamps(client, db, register_login):
+    headers = register_login("late_stream@example.com")
+    user_id = get_user_by_email(db, "late_stream@example.com").id
+    _notify(db, user_id, "Seen")
+    seen = notification_stream.frame(crud_notif.get_user_notifications(db, user_id)[0])[1].decode()
+    assert _event_id(seen) == "1"
+
+    # Stamped before the event already received, committed after it: replayed all the same
+    db.add(Notification(user_id=user_id, message="Late", type="new_idea",
+                        created_at=datetime.utcnow() - timedelta(minutes=5)))
+    db.commit()
+
+    async def scenario():
+        async with _Stream({**headers, "Last-Event-ID": _event_id(seen)}) as stream:
+            return (await stream.frames(2))[1]
+
+    replayed = asyncio.run(scenario())
+    assert _data(replayed)["message"] == "Late" and _event_id(replayed) == "2"
+
+
+def test_connection_cap_and_bad_event_id(client, db, monkeypatch, register_login):
+    headers = register_login("tabs_user@example.com")
+    monkeypatch.setattr(settings, "sse_max_connections_per_user", 2)
+
+    async def scenario():
+        async with _Stream(headers), _Stream(headers):
+            async with _Stream(headers) as third:
+                return third.status
+
+    assert asyncio.run(scenario()) == 429
+
+    async def bad_cursor():
+        async with _Stream({**headers, "Last-Event-ID": "not-a-cursor"}) as stream:
+            return stream.status
+
+    assert asyncio.run(bad_cursor()) == 400
+
+
+def test_batch_review_is_pushed_to_the_author(client, db, register_login):
+    admin = register_login("stream_admin@example.com")
+    get_user_by_email(db, "stream_admin@example.com").role = "admin"
+    db.commit()
+    author = register_login("stream_author@example.com")
+    idea = client.post("/api/ideas", headers=author,
+                       data={"title": "Streamed", "description": "Long enough description", "category": "AI"}).json()
+
+    async def scenario():
+        async with _Stream(author) as stream:
+            await stream.frames(1)
+            res = await asyncio.to_thread(client.post, "/api/admin/ideas/evaluate:batch", headers=admin,
+                                          json={"items": [{"idea_id": idea["id"], "status": "accepted"}]})
+            assert res.json()["succeeded"] == 1
+            return await stream.frames(1)
+
+    [pushed] = asyncio.run(scenario())
+    assert _data(pushed)["type"] == "idea_review"
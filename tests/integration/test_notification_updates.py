@@ -0,0 +1,152 @@
+"""
+test_notification_updates.py — GET /api/notifications/unread-count from the trigger-maintained
+counter, ?since= incremental fetches, and the ?wait= long-poll.
+"""
+import threading
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine
+
+from src.app.core import pagination
+from src.app.core.config import settings
+from src.app.crud import notification as crud_notif
+from src.app.crud.user import get_user_by_email
+from src.app.db import aggregates
+from src.app.models.notification import Notification
+from src.app.schemas.notification import NotificationCreate
+
+def _notify(db, user_id, message):
+    return crud_notif.create_notification(db, NotificationCreate(user_id=user_id, message=message, type="task_assigned"))
+
+def _unread(client, headers):
+    res = client.get("/api/notifications/unread-count", headers=headers)
+    assert res.status_code == 200
+    return res.json()["unread"]
+
+
+def test_unread_count_follows_every_write(client, db, register_login):
+    headers = register_login("count_user@example.com")
+    user_id = get_user_by_email(db, "count_user@example.com").id
+    assert _unread(client, headers) == 0
+
+    _notify(db, user_id, "One")
+    crud_notif.create_notifications(db, [NotificationCreate(user_id=user_id, message=f"Bulk {n}", type="new_idea")
+                                         for n in range(3)])
+    db.commit()
+    assert _unread(client, headers) == 4
+
+    statements = []
+    def listener(conn, cursor, statement, *args):
+        statements.append(statement)
+    event.listen(Engine, "before_cursor_execute", listener)
+    try:
+        assert _unread(client, headers) == 4
+    finally:
+        event.remove(Engine, "before_cursor_execute", listener)
+    assert any("user_notification_stats" in s for s in statements)
+    assert not any("FROM notifications" in s for s in statements)
+
+    client.patch("/api/notifications/read", headers=headers)
+    assert _unread(client, headers) == 0
+    _notify(db, user_id, "Two")
+    assert _unread(client, headers) == 1
+
+
+def test_reconcile_repairs_notification_counters(client, db, register_login):
+    register_login("drift_user@example.com")
+    user_id = get_user_by_email(db, "drift_user@example.com").id
+    _notify(db, user_id, "Counted")
+    db.execute(text("UPDATE user_notification_stats SET unread = 7"))
+    db.commit()
+
+    drift = aggregates.NOTIFICATION_STATS.reconcile(db.connection())
+    db.commit()
+    assert drift == [{"table": "user_notification_stats", "key": user_id,
+                      "stored": {"total": 1, "unread": 7}, "actual": {"total": 1, "unread": 1}}]
+    assert crud_notif.get_unread_count(db, user_id) == 1
+
+
+def test_since_returns_only_newer_notifications(client, db, register_login):
+    headers = register_login("since_user@example.com")
+    user_id = get_user_by_email(db, "since_user@example.com").id
+
+    empty = client.get("/api/notifications", headers=headers)
+    assert empty.json() == []
+    origin = empty.headers[pagination.LATEST_CURSOR_HEADER]
+    assert pagination.decode_seq_cursor(origin) == 0
+
+    _notify(db, user_id, "Old")
+    listed = client.get("/api/notifications", headers=headers)
+    assert [n["message"] for n in listed.json()] == ["Old"]
+    cursor = listed.headers[pagination.LATEST_CURSOR_HEADER]
+
+    _notify(db, user_id, "New 1")
+    _notify(db, user_id, "New 2")
+    res = client.get("/api/notifications", headers=headers, params={"since": cursor})
+    assert [n["message"] for n in res.json()] == ["New 1", "New 2"]  # oldest first
+    cursor = res.headers[pagination.LATEST_CURSOR_HEADER]
+
+    res = client.get("/api/notifications", headers=headers, params={"since": cursor})
+    assert res.json() == []
+    assert res.headers[pagination.LATEST_CURSOR_HEADER] == cursor
+
+    everything = client.get("/api/notifications", headers=headers, params={"since": origin, "limit": 2})
+    assert [n["message"] for n in everything.json()] == ["Old", "New 1"]
+    assert client.get("/api/notifications", headers=headers, params={"since": "junk"}).status_code == 400
+
+
+def test_since_follows_commit_order_not_timestamps(client, db, register_login):
+    headers = register_login("late_commit@example.com")
+    user_id = get_user_by_email(db, "late_commit@example.com").id
+    _notify(db, user_id, "Seen")
+    cursor = client.get("/api/notifications", headers=headers).headers[pagination.LATEST_CURSOR_HEADER]
+
+    # Stamped before the one already seen, committed after it: a (created_at, id) cursor skips it
+    db.add(Notification(user_id=user_id, message="Late", type="new_idea",
+                        created_at=datetime.utcnow() - timedelta(minutes=5)))
+    db.commit()
+    res = client.get("/api/notifications", headers=headers, params={"since": cursor})
+    assert [n["message"] for n in res.json()] == ["Late"]
+    assert pagination.decode_seq_cursor(res.headers[pagination.LATEST_CURSOR_HEADER]) == res.json()[0]["seq"] == 2
+
+    # Numbers are never reused once their row is gone
+    db.query(Notification).filter(Notification.message == "Late").delete()
+    db.commit()
+    _notify(db, user_id, "After the delete")
+    assert [n["seq"] for n in client.get("/api/notifications", headers=headers).json()] == [3, 1]
+
+
+def test_long_poll_returns_when_a_notification_arrives(client, db, register_login):
+    headers = register_login("poll_user@example.com")
+    user_id = get_user_by_email(db, "poll_user@example.com").id
+    cursor = client.get("/api/notifications", headers=headers).headers[pagination.LATEST_CURSOR_HEADER]
+
+    def later():  # the test thread is blocked in the request meanwhile, so db is free to use
+        time.sleep(0.3)
+        _notify(db, user_id, "Worth the wait")
+
+    writer = threading.Thread(target=later)
+    started = time.monotonic()
+    writer.start()
+    res = client.get("/api/notifications", headers=headers, params={"since": cursor, "wait": 10})
+    writer.join()
+    assert [n["message"] for n in res.json()] == ["Worth the wait"]
+    assert 0.2 < time.monotonic() - started < 5
+    assert "etag" not in res.headers
+
+
+def test_long_poll_times_out_empty_and_ignores_etags(client, db, monkeypatch, register_login):
+    headers = register_login("idle_user@example.com")
+    monkeypatch.setattr(settings, "notifications_max_wait_seconds", 0.2)
+    listed = client.get("/api/notifications", headers=headers)
+    cursor = listed.headers[pagination.LATEST_CURSOR_HEADER]
+    conditional = {**headers, "If-None-Match": listed.headers["etag"]}
+    assert client.get("/api/notifications", headers=conditional).status_code == 304
+
+    started = time.monotonic()
+    res = client.get("/api/notifications", headers=conditional, params={"since": cursor, "wait": 30})
+    assert res.status_code == 200 and res.json() == []
+    assert 0.15 < time.monotonic() - started < 5  # capped by NOTIFICATIONS_MAX_WAIT_SECONDS
+    assert res.headers[pagination.LATEST_CURSOR_HEADER] == cursor
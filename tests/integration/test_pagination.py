@@ -0,0 +1,84 @@
+"""
+test_pagination.py — Keyset pagination of /api/ideas and /api/admin/ideas:
+newest first, stable while ideas arrive, and skip/limit still honoured.
+"""
+from datetime import datetime, timedelta
+
+from src.app.crud.user import get_user_by_email
+from src.app.models.idea import Idea
+
+def _seed(db, email, count, start=datetime(2026, 1, 1)):
+    user_id = get_user_by_email(db, email).id
+    # Pairs share a timestamp so the id tie-breaker is exercised
+    db.add_all(
+        Idea(title=f"Idea {i}", description="Long enough description", category="AI",
+             user_id=user_id, created_at=start + timedelta(minutes=i // 2))
+        for i in range(count)
+    )
+    db.commit()
+    return user_id
+
+def _walk(client, url, headers, limit):
+    seen, cursor, pages = [], None, 0
+    while True:
+        params = {"limit": limit} | ({"cursor": cursor} if cursor else {})
+        res = client.get(url, params=params, headers=headers)
+        assert res.status_code == 200
+        seen += [i["id"] for i in res.json()]
+        pages += 1
+        cursor = res.headers.get("X-Next-Cursor")
+        if not cursor:
+            return seen, pages
+
+
+def test_cursor_walks_every_idea_once_newest_first(client, db, register_login):
+    headers = register_login("pager@example.com")
+    _seed(db, "pager@example.com", 25)
+
+    seen, pages = _walk(client, "/api/ideas", headers, limit=10)
+    assert pages == 3
+    assert len(seen) == len(set(seen)) == 25
+    expected = [i.id for i in db.query(Idea).order_by(Idea.created_at.desc(), Idea.id.desc())]
+    assert seen == expected
+
+
+def test_new_ideas_do_not_shift_later_pages(client, db, register_login):
+    headers = register_login("stable@example.com")
+    user_id = _seed(db, "stable@example.com", 6)
+
+    res = client.get("/api/ideas", params={"limit": 3}, headers=headers)
+    first = [i["id"] for i in res.json()]
+    db.add(Idea(title="Fresh", description="Arrived mid-scroll", category="AI",
+                user_id=user_id, created_at=datetime(2027, 1, 1)))
+    db.commit()
+
+    res = client.get("/api/ideas", params={"limit": 3, "cursor": res.headers["X-Next-Cursor"]}, headers=headers)
+    second = [i["id"] for i in res.json()]
+    assert len(second) == 3 and not set(first) & set(second)
+    assert "X-Next-Cursor" not in res.headers
+
+
+def test_skip_limit_still_supported(client, db, register_login):
+    headers = register_login("legacy@example.com")
+    _seed(db, "legacy@example.com", 5)
+    all_ids = [i["id"] for i in client.get("/api/ideas", headers=headers).json()]
+    res = client.get("/api/ideas", params={"skip": 2, "limit": 2}, headers=headers)
+    assert [i["id"] for i in res.json()] == all_ids[2:4]
+
+
+def test_admin_feed_pages_across_users(client, db, register_login, make_admin):
+    admin = make_admin("pager_admin@example.com")
+    register_login("author_a@example.com")
+    register_login("author_b@example.com")
+    _seed(db, "author_a@example.com", 7)
+    _seed(db, "author_b@example.com", 7, start=datetime(2026, 2, 1))
+
+    seen, pages = _walk(client, "/api/admin/ideas", admin, limit=5)
+    assert pages == 3
+    assert len(set(seen)) == 14
+
+
+def test_invalid_cursor_is_rejected(client, register_login):
+    headers = register_login("badcursor@example.com")
+    res = client.get("/api/ideas", params={"cursor": "not-a-cursor"}, headers=headers)
+    assert res.status_code == 400
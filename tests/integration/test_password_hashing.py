@@ -0,0 +1,92 @@
+"""
+test_password_hashing.py — Password work runs through the bounded hashing pool, hashes
+made at an outdated cost are replaced on the next login, and admins can read the metrics.
+"""
+import asyncio
+
+from src.app.core import hashing
+from src.app.core.config import settings
+from src.app.core.metrics import Gauge
+from src.app.crud.user import get_user_by_email
+
+def _login(client, email, password="password"):
+    return client.post("/api/auth/login", data={"username": email, "password": password})
+
+
+def test_login_rehashes_when_cost_changes(client, db, monkeypatch):
+    monkeypatch.setattr(settings, "password_hash_rounds", 1_000)
+    client.post("/api/auth/register", json={"email": "rehash@example.com", "password": "password"})
+    old_hash = get_user_by_email(db, "rehash@example.com").hashed_password
+    assert "$1000$" in old_hash
+
+    monkeypatch.setattr(settings, "password_hash_rounds", 2_000)
+    assert _login(client, "rehash@example.com").status_code == 200
+    db.expire_all()
+    new_hash = get_user_by_email(db, "rehash@example.com").hashed_password
+    assert "$2000$" in new_hash
+
+    # Already at the current cost: verified, left alone
+    assert _login(client, "rehash@example.com").status_code == 200
+    db.expire_all()
+    assert get_user_by_email(db, "rehash@example.com").hashed_password == new_hash
+
+
+def test_failed_login_does_not_rehash(client, db, monkeypatch):
+    monkeypatch.setattr(settings, "password_hash_rounds", 1_000)
+    client.post("/api/auth/register", json={"email": "norehash@example.com", "password": "password"})
+    monkeypatch.setattr(settings, "password_hash_rounds", 2_000)
+    assert _login(client, "norehash@example.com", "wrong").status_code == 401
+    db.expire_all()
+    assert "$1000$" in get_user_by_email(db, "norehash@example.com").hashed_password
+
+
+def test_password_change_verifies_once(client, monkeypatch):
+    client.post("/api/auth/register", json={"email": "pwchange@example.com", "password": "password"})
+    headers = {"Authorization": f"Bearer {_login(client, 'pwchange@example.com').json()['access_token']}"}
+    verified = []
+    verify = hashing.verify_password
+
+    async def counting_verify(password, hashed):
+        verified.append(password)
+        return await verify(password, hashed)
+
+    monkeypatch.setattr(hashing, "verify_password", counting_verify)
+    wrong = client.put("/api/users/me/password", headers=headers,
+                       json={"current_password": "not-it-at-all", "new_password": "brand-new-pass"})
+    assert wrong.status_code == 400 and verified == ["not-it-at-all"]  # fails before any other hashing
+
+    verified.clear()
+    same = client.put("/api/users/me/password", headers=headers,
+                      json={"current_password": "password", "new_password": "password"})
+    assert same.status_code == 400 and "differ" in same.json()["detail"]
+    assert verified == ["password"]
+
+
+def test_pending_hashes_are_capped(monkeypatch):
+    monkeypatch.setattr(settings, "password_hash_max_pending", 2)
+    monkeypatch.setattr(settings, "password_hash_rounds", 1_000)
+    pending = Gauge()
+    monkeypatch.setattr(hashing, "_pending", pending)
+
+    async def storm():
+        return await asyncio.gather(*(hashing.hash_password(f"pw{i}") for i in range(8)))
+
+    hashes = asyncio.run(storm())
+    assert len(set(hashes)) == 8
+    assert pending.max <= 2
+    assert pending.value == 0
+
+
+def test_metrics_endpoint_is_admin_only(client, db, make_admin):
+    admin = make_admin("metrics_admin@example.com")
+    client.post("/api/auth/register", json={"email": "metrics_user@example.com", "password": "password"})
+    user_token = _login(client, "metrics_user@example.com").json()["access_token"]
+
+    res = client.get("/api/admin/metrics", headers={"Authorization": f"Bearer {user_token}"})
+    assert res.status_code == 403
+
+    data = client.get("/api/admin/metrics", headers=admin).json()
+    assert data["password_hash.seconds"]["count"] >= 2
+    assert data["password_hash.pending"]["value"] == 0
+    assert "password_hash.waiting" in data
+    assert {"hits", "misses", "size"} <= data["principal_cache"].keys()
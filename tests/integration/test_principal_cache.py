@@ -0,0 +1,44 @@
+"""
+test_principal_cache.py — get_current_user serves repeat tokens from the principal cache,
+and writes that change the principal invalidate it immediately.
+"""
+from src.app.core.auth_cache import principal_cache
+from src.app.crud.user import get_user_by_email
+
+
+def test_repeat_requests_hit_cache(client, register_login):
+    headers = register_login("cached@example.com")
+    before = principal_cache.stats()
+    for _ in range(3):
+        assert client.get("/api/notifications", headers=headers).status_code == 200
+    after = principal_cache.stats()
+    assert after["misses"] - before["misses"] == 1
+    assert after["hits"] - before["hits"] == 2
+
+
+def test_role_demotion_takes_effect_immediately(client, db, make_admin):
+    boss = make_admin("boss@example.com")
+    deputy = make_admin("deputy@example.com")
+    # Warm the deputy's cached principal with the admin role
+    assert client.get("/api/admin/summary", headers=deputy).status_code == 200
+    assert client.get("/api/admin/summary", headers=deputy).status_code == 200
+
+    deputy_id = get_user_by_email(db, "deputy@example.com").id
+    res = client.patch(f"/api/admin/users/{deputy_id}/role", json={"role": "submitter"}, headers=boss)
+    assert res.status_code == 200
+
+    assert client.get("/api/admin/summary", headers=deputy).status_code == 403
+    assert client.get("/api/auth/me", headers=deputy).json()["role"] == "submitter"
+
+
+def test_profile_update_is_visible_on_next_request(client, register_login):
+    headers = register_login("profile_cache@example.com")
+    assert client.get("/api/auth/me", headers=headers).json()["bio"] is None
+    client.put("/api/users/me/profile", json={"bio": "Fresh bio"}, headers=headers)
+    assert client.get("/api/auth/me", headers=headers).json()["bio"] == "Fresh bio"
+
+
+def test_invalid_token_is_not_cached(client):
+    headers = {"Authorization": "Bearer not-a-jwt"}
+    assert client.get("/api/auth/me", headers=headers).status_code == 401
+    assert principal_cache.get("not-a-jwt") is None
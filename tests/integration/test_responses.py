@@ -0,0 +1,52 @@
+"""
+test_responses.py — The default response class: orjson / pydantic-core encoding matches
+the old jsonable_encoder output, and model routes keep FastAPI's bytes fast path.
+"""
+import json
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+from fastapi.datastructures import DefaultPlaceholder
+from fastapi.encoders import jsonable_encoder
+from fastapi.routing import APIRoute
+
+from src.app.core import responses
+from src.app.main import app
+from src.app.schemas.user import PublicProfile
+
+CONTENT = {
+    "created_at": datetime(2026, 3, 1, 9, 30, 0, 125),
+    "count": 3,
+    "ratio": 0.5,
+    "author": PublicProfile(id="u1", email="a@example.com"),
+    "items": [{"title": "Ünïcode", "done": False, "note": None}],
+}
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dumps_matches_default_encoder(monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(responses, "orjson", None)
+    elif responses.orjson is None:
+        pytest.skip("orjson not installed")
+    assert json.loads(responses.dumps(CONTENT)) == jsonable_encoder(CONTENT)
+    assert json.loads(responses.dumps(CONTENT))["created_at"] == "2026-03-01T09:30:00.000125"
+    # Types orjson does not know go through pydantic-core; Decimal keeps its digits
+    assert json.loads(responses.dumps({"amount": Decimal("1.50"), "ids": {1}})) == {"amount": "1.50", "ids": [1]}
+    aware = json.loads(responses.dumps({"at": datetime(2026, 3, 1, tzinfo=timezone.utc)}))["at"]
+    assert datetime.fromisoformat(aware.replace("Z", "+00:00")) == datetime(2026, 3, 1, tzinfo=timezone.utc)
+
+
+def test_model_routes_keep_the_bytes_fast_path():
+    routes = [r for r in app.routes if isinstance(r, APIRoute)]
+    assert all(isinstance(r.response_class, DefaultPlaceholder) for r in routes)
+    assert all(r.response_class.value is responses.FastJSONResponse for r in routes)
+
+
+def test_model_less_routes_render_through_fast_class(client, db, make_admin):
+    headers = make_admin("admin_json@example.com")
+    res = client.get("/api/admin/stats", headers=headers)
+    assert res.status_code == 200
+    assert res.headers["content-type"] == "application/json"
+    assert res.content == responses.dumps(res.json())
@@ -0,0 +1,112 @@
+"""
+test_search.py — GET /api/ideas/search over the FTS5 index: bm25 ranking, highlighted
+snippets, cursor paging, visibility rules, trigger sync and the rebuild command.
+"""
+from sqlalchemy import text
+
+from src.app.crud.user import get_user_by_email
+from src.app.db import search
+from src.app.models.idea import Idea
+
+def _idea(db, email, title, description="Nothing special in here.", **extra):
+    idea = Idea(title=title, description=description, category="AI",
+                user_id=get_user_by_email(db, email).id, **extra)
+    db.add(idea)
+    db.commit()
+    return idea
+
+def _search(client, headers, q, **params):
+    return client.get("/api/ideas/search", params={"q": q, **params}, headers=headers)
+
+
+def test_title_match_outranks_body_match(client, db, register_login):
+    headers = register_login("ranker@example.com")
+    _idea(db, "ranker@example.com", "Quarterly planning", description="Use a drone to count stock.")
+    _idea(db, "ranker@example.com", "Drone inventory audits")
+    _idea(db, "ranker@example.com", "Unrelated idea")
+
+    res = _search(client, headers, "drone")
+    assert res.status_code == 200
+    assert [h["title"] for h in res.json()] == ["Drone inventory audits", "Quarterly planning"]
+    assert "<mark>drone</mark>" in res.json()[1]["snippet"]
+
+
+def test_prefix_multiword_and_escaped_snippets(client, db, register_login):
+    headers = register_login("snippets@example.com")
+    _idea(db, "snippets@example.com", "Kubernetes cost report",
+          description="Show <script>alert(1)</script> savings for kubernetes clusters.")
+
+    hits = _search(client, headers, "savings kube").json()
+    assert len(hits) == 1
+    assert "<script>" not in hits[0]["snippet"] and "&lt;script&gt;" in hits[0]["snippet"]
+    # FTS5 operators and stray quotes in user input are treated as plain words
+    assert _search(client, headers, 'kube" OR (NEAR').status_code == 200
+
+
+def test_submitters_only_find_their_own_ideas(client, db, register_login, make_admin):
+    alice = register_login("alice_search@example.com")
+    admin = make_admin("admin_search@example.com")
+    register_login("bob_search@example.com")
+    _idea(db, "alice_search@example.com", "Solar carport")
+    _idea(db, "bob_search@example.com", "Solar rooftop")
+
+    assert [h["title"] for h in _search(client, alice, "solar").json()] == ["Solar carport"]
+    assert len(_search(client, admin, "solar").json()) == 2
+
+
+def test_index_follows_updates_and_deletes(client, db, register_login):
+    headers = register_login("sync@example.com")
+    idea = _idea(db, "sync@example.com", "Paperless onboarding", tags="HR, Automation")
+    assert len(_search(client, headers, "automation").json()) == 1
+
+    idea.title = "Digital onboarding"
+    db.commit()
+    assert _search(client, headers, "paperless").json() == []
+    assert len(_search(client, headers, "digital").json()) == 1
+
+    db.delete(idea)
+    db.commit()
+    assert _search(client, headers, "onboarding").json() == []
+
+
+def test_cursor_pages_through_ranked_hits(client, db, register_login):
+    headers = register_login("pages_search@example.com")
+    for n in range(5):
+        _idea(db, "pages_search@example.com", f"Chatbot variant {n}")
+
+    seen, cursor = [], None
+    for _ in range(3):
+        res = _search(client, headers, "chatbot", limit=2, **({"cursor": cursor} if cursor else {}))
+        seen += [h["id"] for h in res.json()]
+        cursor = res.headers.get("X-Next-Cursor")
+    assert cursor is None
+    assert len(seen) == len(set(seen)) == 5
+    assert _search(client, headers, "chatbot", cursor="garbage").status_code == 400
+
+
+def test_rebuild_restores_an_emptied_index(client, db, register_login):
+    headers = register_login("rebuild@example.com")
+    _idea(db, "rebuild@example.com", "Greenhouse sensors")
+    db.execute(text(f"INSERT INTO {search.FTS_TABLE}({search.FTS_TABLE}) VALUES('delete-all')"))
+    db.commit()
+    assert _search(client, headers, "greenhouse").json() == []
+
+    search.rebuild(db.connection())
+    db.commit()
+    assert len(_search(client, headers, "greenhouse").json()) == 1
+
+
+def test_index_follows_ideas_when_rowids_change(client, db, register_login):
+    # VACUUM may renumber the implicit rowids of ideas; the index is keyed on search_docid instead
+    headers = register_login("vacuum@example.com")
+    gone = _idea(db, "vacuum@example.com", "Hydroponic wall")
+    _idea(db, "vacuum@example.com", "Hydroponic roof")
+    db.delete(gone)
+    db.commit()
+    db.execute(text("UPDATE ideas SET rowid = rowid + 1000"))
+    db.commit()
+
+    assert [h["title"] for h in _search(client, headers, "hydroponic").json()] == ["Hydroponic roof"]
+    newest = _idea(db, "vacuum@example.com", "Hydroponic cellar")
+    assert db.scalar(text("SELECT max(search_docid) FROM ideas")) == db.get(Idea, newest.id).search_docid
+    assert len(_search(client, headers, "hydroponic").json()) == 2
@@ -0,0 +1,63 @@
+"""
+test_serializers.py — The projected-row serializer renders ideas exactly as the validated
+ORM path did, shares profiles within a page, and backs the list endpoints.
+"""
+from pydantic import TypeAdapter
+
+from src.app.api import serializers
+from src.app.crud import idea as crud_idea
+from src.app.crud.user import get_user_by_email
+from src.app.models.idea import Idea
+from src.app.schemas.idea import IdeaPublic
+
+def _validated(idea) -> IdeaPublic:
+    """The pre-serializer path: column dict, then full validation."""
+    return IdeaPublic.model_validate({
+        **{c.name: getattr(idea, c.name) for c in idea.__table__.columns},
+        "author": idea.owner,
+        "reviewer": idea.reviewer,
+    })
+
+
+def test_rows_serialize_like_validated_orm_objects(client, db, register_login, make_admin):
+    make_admin("reviewer_ser@example.com")
+    register_login("author_ser@example.com")
+    author = get_user_by_email(db, "author_ser@example.com")
+    author.bio = "Builds things"
+    reviewer = get_user_by_email(db, "reviewer_ser@example.com")
+    db.add_all([
+        Idea(title="Reviewed idea", description="Long enough description", category="AI",
+             user_id=author.id, status="accepted", admin_comment="Go", reviewed_by_id=reviewer.id),
+        Idea(title="Fresh idea", description="Long enough description", category="HR",
+             user_id=author.id, tags="hr, people"),
+    ])
+    db.commit()
+
+    adapter = TypeAdapter(list[IdeaPublic])
+    expected = adapter.dump_json([_validated(i) for i in crud_idea.get_all_ideas(db)])
+    rows = crud_idea.get_all_idea_rows(db)
+    assert serializers.ideas_response(rows).body == expected
+
+    ideas = serializers.ideas_from_rows(rows)
+    assert ideas[0].author is ideas[1].author
+    assert {i.title: i.reviewer is None for i in ideas} == {"Reviewed idea": False, "Fresh idea": True}
+    orm = crud_idea.get_all_ideas(db)
+    assert [serializers.idea_from_orm(i) for i in orm] == [_validated(i) for i in orm]
+
+
+def test_list_endpoints_keep_cursor_header_and_shape(client, db, register_login, make_admin):
+    admin = make_admin("admin_ser@example.com")
+    user = register_login("lister_ser@example.com")
+    for n in range(3):
+        client.post("/api/ideas", data={"title": f"Listed {n}", "description": "Long enough description",
+                                        "category": "AI"}, headers=user)
+
+    res = client.get("/api/ideas", params={"limit": 2}, headers=user)
+    assert res.headers["content-type"] == "application/json"
+    assert res.headers["X-Next-Cursor"]
+    assert [i["title"] for i in res.json()] == ["Listed 2", "Listed 1"]
+    assert res.json()[0]["author"]["email"] == "lister_ser@example.com"
+
+    res = client.get("/api/admin/ideas", params={"cursor": res.headers["X-Next-Cursor"]}, headers=admin)
+    assert [i["title"] for i in res.json()] == ["Listed 0"]
+    assert "X-Next-Cursor" not in res.headers
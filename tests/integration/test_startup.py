@@ -0,0 +1,37 @@
+"""
+test_startup.py — init_db(), the lifespan bootstrap: migrate once, then no-op for later workers.
+"""
+import alembic.command
+from sqlalchemy import create_engine
+from src.app.core.config import settings
+from src.app.db import init_db as bootstrap
+from src.app.db import session
+from src.app.db.indexes import missing_indexes
+
+
+def test_init_db_migrates_once(tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path / 'boot.db'}")
+    monkeypatch.setattr(session, "engine", engine)
+    monkeypatch.setattr(bootstrap, "LOCK_PATH", tmp_path / ".startup.lock")
+    monkeypatch.setattr(settings, "upload_dir", str(tmp_path / "uploads"))
+
+    bootstrap.init_db()
+    assert (tmp_path / "uploads").is_dir()
+    assert missing_indexes(engine) == []
+
+    # A second worker finds the schema at head and never calls Alembic's upgrade
+    upgrades = []
+    monkeypatch.setattr(alembic.command, "upgrade", lambda *args, **kw: upgrades.append(args))
+    bootstrap.init_db()
+    assert upgrades == []
+
+
+def test_init_db_skips_migrations_when_disabled(tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path / 'skip.db'}")
+    monkeypatch.setattr(session, "engine", engine)
+    monkeypatch.setattr(settings, "upload_dir", str(tmp_path / "uploads"))
+    monkeypatch.setattr(settings, "migrate_on_startup", False)
+
+    bootstrap.init_db()
+    assert (tmp_path / "uploads").is_dir()
+    assert missing_indexes(engine) != []
@@ -0,0 +1,112 @@
+"""
+test_static_assets.py — The asset build (fingerprinted, precompressed files and a rewritten
+index.html), the static handler serving those variants, and gzip on large /api responses.
+"""
+import gzip
+import json
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.app.core import assets
+from src.app.core.config import settings
+
+def _sources(tmp_path, js="console.log('v1');\n" * 200):
+    source = tmp_path / "static"
+    source.mkdir()
+    (source / "app.js").write_text(js)
+    (source / "style.css").write_text("body { margin: 0; }\n" * 200)
+    (source / "index.html").write_text(
+        '<link rel="stylesheet" href="style.css?v=3">\n<script src="app.js?v=8"></script>\n')
+    return source
+
+def _static_client(directory):
+    app = FastAPI()
+    app.mount("/", assets.PrecompressedStaticFiles(directory=str(directory), html=True))
+    return TestClient(app)
+
+
+def test_build_fingerprints_and_rewrites_index(tmp_path):
+    source = _sources(tmp_path)
+    dist = source / "dist"
+    manifest = assets.build(source, dist)
+
+    js = manifest["assets"]["app.js"]
+    assert js.startswith("app.") and js.endswith(".js") and js != "app.js"
+    assert (dist / js).read_text() == (source / "app.js").read_text()
+    assert gzip.decompress((dist / f"{js}.gz").read_bytes()) == (dist / js).read_bytes()
+    html = (dist / "index.html").read_text()
+    assert f'src="{js}"' in html and f'href="{manifest["assets"]["style.css"]}"' in html
+    assert "?v=" not in html
+    assert json.loads((dist / assets.MANIFEST).read_text()) == manifest
+    assert assets.serving_dir(source, dist) == str(dist)
+    assert assets.serving_dir(source, tmp_path / "nothing") == str(source)
+
+
+def test_rebuild_keeps_previous_assets_only(tmp_path):
+    source = _sources(tmp_path)
+    dist = source / "dist"
+    first = assets.build(source, dist)["assets"]["app.js"]
+    (source / "app.js").write_text("console.log('v2');\n")
+    second = assets.build(source, dist)["assets"]["app.js"]
+    (source / "app.js").write_text("console.log('v3');\n")
+    third = assets.build(source, dist)["assets"]["app.js"]
+
+    assert len({first, second, third}) == 3
+    assert not (dist / first).exists() and not (dist / f"{first}.gz").exists()
+    assert (dist / second).exists() and (dist / third).exists()
+
+
+def test_serves_precompressed_variant_with_immutable_caching(tmp_path):
+    source = _sources(tmp_path)
+    dist = source / "dist"
+    js = assets.build(source, dist)["assets"]["app.js"]
+    client = _static_client(dist)
+
+    res = client.get(f"/{js}", headers={"Accept-Encoding": "gzip"})
+    assert res.status_code == 200
+    assert res.headers["content-encoding"] == "gzip"
+    assert res.headers["content-type"].startswith("text/javascript")
+    assert res.headers["cache-control"] == assets.IMMUTABLE
+    assert res.headers["vary"] == "Accept-Encoding"
+    assert int(res.headers["content-length"]) == (dist / f"{js}.gz").stat().st_size
+    assert res.text == (source / "app.js").read_text()
+
+    plain = client.get(f"/{js}", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in plain.headers
+    assert plain.content == (dist / js).read_bytes()
+
+    again = client.get(f"/{js}", headers={"Accept-Encoding": "gzip", "If-None-Match": res.headers["etag"]})
+    assert again.status_code == 304
+
+
+def test_index_is_revalidated(tmp_path):
+    source = _sources(tmp_path)
+    assets.build(source, source / "dist")
+    client = _static_client(source / "dist")
+    res = client.get("/", headers={"Accept-Encoding": "gzip"})
+    assert res.status_code == 200
+    assert res.headers["cache-control"] == assets.REVALIDATE
+    assert res.headers["content-type"].startswith("text/html")
+    assert client.get("/", headers={"If-None-Match": res.headers["etag"],
+                                    "Accept-Encoding": "gzip"}).status_code == 304
+
+
+def test_large_api_responses_are_gzipped(client, db, monkeypatch, make_admin):
+    admin = make_admin("gzip_admin@example.com")
+    for n in range(20):
+        client.post("/api/ideas", headers=admin,
+                    data={"title": f"Compressed idea {n}", "description": "Long enough description", "category": "AI"})
+
+    res = client.get("/api/admin/ideas", headers={**admin, "Accept-Encoding": "gzip"})
+    assert res.headers["content-encoding"] == "gzip"
+    assert res.headers["vary"] == "Accept-Encoding"
+    assert len(res.json()) == 20
+
+    small = client.get("/api/users/me/stats", headers={**admin, "Accept-Encoding": "gzip"})
+    assert small.status_code == 200
+    assert "content-encoding" not in small.headers
+
+    monkeypatch.setattr(settings, "gzip_min_bytes", 10**9)
+    res = client.get("/api/admin/ideas", headers={**admin, "Accept-Encoding": "gzip"})
+    assert "content-encoding" not in res.headers
@@ -0,0 +1,70 @@
+"""
+test_tags.py — Tags are normalised into idea_tags on create and removed on delete,
+power the ?tag= filter, and feed GET /api/ideas/facets.
+"""
+from src.app.crud.tag import parse_tags
+from src.app.models.tag import IdeaTag
+
+def _submit(client, headers, title, tags=None, category="AI"):
+    data = {"title": title, "description": "A description long enough.", "category": category}
+    if tags is not None:
+        data["tags"] = tags
+    res = client.post("/api/ideas", data=data, headers=headers)
+    assert res.status_code == 201
+    return res.json()
+
+
+def test_parse_tags_folds_case_and_dedupes():
+    assert parse_tags(" AI, llm ,ai,, #Cloud ") == ["ai", "llm", "cloud"]
+    assert parse_tags('["AI", "Edge"]') == ["ai", "edge"]
+    assert parse_tags(None) == [] and parse_tags("  ") == []
+
+
+def test_tag_filter_is_case_insensitive(client, register_login):
+    headers = register_login("tagger@example.com")
+    _submit(client, headers, "Vector search", tags="AI, Search")
+    _submit(client, headers, "Cost dashboards", tags="FinOps")
+    _submit(client, headers, "Untagged idea")
+
+    res = client.get("/api/ideas", params={"tag": "ai"}, headers=headers)
+    assert [i["title"] for i in res.json()] == ["Vector search"]
+    assert [i["title"] for i in client.get("/api/ideas", params={"tag": "FINOPS"}, headers=headers).json()] == ["Cost dashboards"]
+    assert client.get("/api/ideas", params={"tag": "missing"}, headers=headers).json() == []
+    # Tags as entered are still returned for display
+    assert res.json()[0]["tags"] == "AI, Search"
+
+
+def test_delete_removes_tag_links(client, db, register_login):
+    headers = register_login("untagger@example.com")
+    idea = _submit(client, headers, "Short lived", tags="Temp, AI")
+    assert db.query(IdeaTag).filter(IdeaTag.idea_id == idea["id"]).count() == 2
+    assert client.delete(f"/api/ideas/{idea['id']}", headers=headers).status_code == 204
+    assert db.query(IdeaTag).filter(IdeaTag.idea_id == idea["id"]).count() == 0
+
+
+def test_facets_count_tags_categories_and_statuses(client, db, register_login, make_admin):
+    alice = register_login("facets_a@example.com")
+    bob = register_login("facets_b@example.com")
+    admin = make_admin("facets_admin@example.com")
+    _submit(client, alice, "One", tags="AI, Cloud", category="AI")
+    _submit(client, alice, "Two", tags="ai", category="Ops")
+    _submit(client, bob, "Three", tags="Cloud", category="Ops")
+
+    mine = client.get("/api/ideas/facets", headers=alice).json()
+    assert mine["tags"] == [{"value": "ai", "count": 2}, {"value": "cloud", "count": 1}]
+    assert mine["categories"] == [{"value": "AI", "count": 1}, {"value": "Ops", "count": 1}]
+    assert mine["statuses"] == [{"value": "submitted", "count": 2}]
+
+    everyone = client.get("/api/ideas/facets", headers=admin).json()
+    assert everyone["tags"] == [{"value": "ai", "count": 2}, {"value": "cloud", "count": 2}]
+    assert everyone["categories"][0] == {"value": "Ops", "count": 2}
+    assert everyone["statuses"] == [{"value": "submitted", "count": 3}]
+
+
+def test_admin_feed_tag_filter(client, db, register_login, make_admin):
+    author = register_login("tag_author@example.com")
+    admin = make_admin("tag_admin@example.com")
+    _submit(client, author, "Edge caching", tags="CDN")
+    _submit(client, author, "Other", tags="Misc")
+    res = client.get("/api/admin/ideas", params={"tag": "cdn"}, headers=admin)
+    assert [i["title"] for i in res.json()] == ["Edge caching"]
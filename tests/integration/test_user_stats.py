@@ -0,0 +1,78 @@
+"""
+test_user_stats.py — Per-author counters in user_idea_stats follow every write through
+triggers, /api/users/me/stats reads one row, and reconcile repairs drift.
+"""
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine
+
+from src.app.crud.user import get_user_by_email
+from src.app.db import aggregates
+from src.app.models.idea import Idea
+from src.app.models.stats import UserIdeaStats
+
+def _submit(client, headers, title):
+    res = client.post("/api/ideas", headers=headers,
+                      data={"title": title, "description": "Long enough description", "category": "AI"})
+    return res.json()["id"]
+
+def _stats(client, headers):
+    return client.get("/api/users/me/stats", headers=headers).json()
+
+
+def test_counters_follow_create_evaluate_and_delete(client, db, register_login, make_admin):
+    admin = make_admin("stats_reviewer@example.com")
+    author = register_login("stats_author@example.com")
+    assert _stats(client, author) == {"total": 0, "accepted": 0, "rejected": 0, "pending": 0, "success_rate": 0.0}
+
+    ids = [_submit(client, author, f"Counted idea {n}") for n in range(4)]
+    assert _stats(client, author)["pending"] == 4
+
+    client.patch(f"/api/admin/ideas/{ids[0]}/evaluate", headers=admin, json={"status": "accepted"})
+    client.post("/api/admin/ideas/evaluate:batch", headers=admin, json={"items": [
+        {"idea_id": ids[1], "status": "rejected"}, {"idea_id": ids[2], "status": "accepted"},
+    ]})
+    assert _stats(client, author) == {"total": 4, "accepted": 2, "rejected": 1, "pending": 1, "success_rate": 50.0}
+
+    client.post("/api/admin/ideas/evaluate:batch", headers=admin, json={"items": [{"idea_id": ids[2], "status": "rejected"}]})
+    client.delete(f"/api/ideas/{ids[0]}", headers=author)
+    assert _stats(client, author) == {"total": 3, "accepted": 0, "rejected": 2, "pending": 1, "success_rate": 0.0}
+    assert aggregates.reconcile(db.connection(), dry_run=True) == []
+
+
+def test_stats_read_is_one_primary_key_lookup(client, db, register_login):
+    author = register_login("stats_lookup@example.com")
+    for n in range(5):
+        _submit(client, author, f"Lookup idea {n}")
+
+    statements = []
+    def listener(conn, cursor, statement, *args):
+        statements.append(statement)
+    event.listen(Engine, "before_cursor_execute", listener)  # the read and write engines both
+    try:
+        assert _stats(client, author)["total"] == 5
+    finally:
+        event.remove(Engine, "before_cursor_execute", listener)
+    assert not any("FROM ideas" in s for s in statements)
+    assert sum("FROM user_idea_stats" in s for s in statements) == 1
+
+
+def test_reconcile_reports_and_fixes_drift(client, db, register_login):
+    author = register_login("stats_drift@example.com")
+    _submit(client, author, "Drifting idea")
+    user_id = get_user_by_email(db, "stats_drift@example.com").id
+    db.add(Idea(title="Direct insert", description="Added through the ORM", category="AI",
+                user_id=user_id, status="accepted"))
+    db.commit()
+    assert db.get(UserIdeaStats, user_id).accepted == 1  # triggers see ORM writes too
+
+    db.execute(text("UPDATE user_idea_stats SET total = 9, pending = 0 WHERE user_id = :u"), {"u": user_id})
+    db.commit()
+    drift = aggregates.reconcile(db.connection(), dry_run=True)
+    assert drift == [{"table": "user_idea_stats", "key": user_id,
+                      "stored": {"total": 9, "accepted": 1, "rejected": 0, "pending": 0},
+                      "actual": {"total": 2, "accepted": 1, "rejected": 0, "pending": 1}}]
+
+    assert len(aggregates.reconcile(db.connection())) == 1
+    db.commit()
+    assert aggregates.reconcile(db.connection(), dry_run=True) == []
+    assert _stats(client, author)["total"] == 2